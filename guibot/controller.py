@@ -27,6 +27,7 @@ INTERFACE
 
 import os
 import re
+import sys
 import time
 import logging
 
@@ -69,6 +70,11 @@ class Controller(LocalConfig):
         self._keymap = None
         self._modmap = None
         self._mousemap = None
+        # X11 connection used only for in-memory screen grabbing
+        self._grab_display = None
+        self._grab_failed = False
+        # polling interval adapted to the observed screen changes
+        self._poll_delay = None
 
         # additional preparation
         if configure:
@@ -181,6 +187,16 @@ class Controller(LocalConfig):
         self.__synchronize_backend(backend, category, reset)
 
     def _region_from_args(self, *args):
+        xpos, ypos, width, height = self._clipped_region_from_args(*args)
+
+        # TODO: Switch to in-memory conversion - patch backends or request get_raw() from authors
+        with NamedTemporaryFile(prefix='guibot', suffix='.png') as f:
+            # NOTE: the file can be open twice on unix but only once on windows so simply
+            # use the generated filename to avoid this difference and remove it manually
+            filename = f.name
+        return xpos, ypos, width, height, filename
+
+    def _clipped_region_from_args(self, *args):
         if len(args) == 4:
             xpos = args[0]
             ypos = args[1]
@@ -208,12 +224,76 @@ class Controller(LocalConfig):
         if ypos + height > self._height:
             height = self._height - ypos
 
-        # TODO: Switch to in-memory conversion - patch backends or request get_raw() from authors
-        with NamedTemporaryFile(prefix='guibot', suffix='.png') as f:
-            # NOTE: the file can be open twice on unix but only once on windows so simply
-            # use the generated filename to avoid this difference and remove it manually
-            filename = f.name
-        return xpos, ypos, width, height, filename
+        return xpos, ypos, width, height
+
+    def _grab_screen(self, xpos, ypos, width, height):
+        """
+        Capture a screen region in memory without any intermediate files.
+
+        :param int xpos: x coordinate of the upleft region corner
+        :param int ypos: y coordinate of the upleft region corner
+        :param int width: width of the region
+        :param int height: height of the region
+        :returns: image of the captured region or None if in-memory
+                  capturing is not supported on the current platform
+        :rtype: :py:class:`target.Image` or None
+
+        On X11 only the region is transferred from the server while PIL
+        would grab the entire screen and crop it, so PIL is used only on
+        Windows. Grabbing on macOS is implemented by PIL with an external
+        process and file and is thus left to the backends.
+        """
+        if sys.platform.startswith("linux"):
+            return self._grab_x11_screen(xpos, ypos, width, height)
+        elif sys.platform != "win32":
+            return None
+        try:
+            from PIL import ImageGrab
+            pil_image = ImageGrab.grab(bbox=(xpos, ypos, xpos + width, ypos + height))
+        except (ImportError, OSError) as error:
+            log.debug("In-memory screen capture is not available: %s", error)
+            return None
+        if pil_image.mode != 'RGB':
+            pil_image = pil_image.convert('RGB')
+        return Image(None, pil_image)
+
+    def _grab_x11_screen(self, xpos, ypos, width, height):
+        # permanent failures are not retried on every capture
+        if self._grab_failed:
+            return None
+        try:
+            from Xlib import X, display, error as xerror
+        except ImportError as error:
+            log.debug("In-memory screen capture is not available: %s", error)
+            self._grab_failed = True
+            return None
+        try:
+            if self._grab_display is None:
+                self._grab_display = display.Display()
+            root = self._grab_display.screen().root
+            reply = root.get_image(xpos, ypos, width, height, X.ZPixmap, 0xffffffff)
+        except xerror.DisplayError as error:
+            log.debug("In-memory screen capture is not available: %s", error)
+            self._grab_failed = True
+            return None
+        except xerror.ConnectionClosedError as error:
+            log.debug("In-memory screen capture connection was closed: %s", error)
+            # reconnect on the next capture
+            self._grab_display = None
+            return None
+        except xerror.XError as error:
+            log.debug("In-memory screen capture failed: %s", error)
+            return None
+        # only true color visuals with four bytes per pixel are supported
+        if reply.depth not in (24, 32) or len(reply.data) != width * height * 4:
+            log.debug("In-memory screen capture is not available for depth %s", reply.depth)
+            return None
+        if self._grab_display.display.info.image_byte_order == X.LSBFirst:
+            raw_mode = "BGRX"
+        else:
+            raw_mode = "XRGB"
+        pil_image = PIL.Image.frombytes("RGB", (width, height), reply.data, "raw", raw_mode)
+        return Image(None, pil_image)
 
     def capture_screen(self, *args):
         """
@@ -228,6 +308,96 @@ class Controller(LocalConfig):
         """
         raise NotImplementedError("Method is not available for this controller implementation")
 
+    def detect_changes(self, previous, current, tile_size=32):
+        """
+        Detect the regions that changed between two screen captures.
+
+        :param previous: older capture of a screen region
+        :type previous: :py:class:`image.Image` or None
+        :param current: newer capture of the same screen region
+        :type current: :py:class:`image.Image`
+        :param int tile_size: size of the square tiles the captures are compared in
+        :returns: rectangles (x, y, width, height) relative to the captures
+                  that contain all changes, an empty list if nothing changed,
+                  or None if the captures cannot be compared
+        :rtype: [(int, int, int, int)] or None
+        """
+        if previous is None or previous.width != current.width or previous.height != current.height:
+            return None
+        import numpy
+        previous_image, current_image = previous.numpy_image, current.numpy_image
+        if previous_image is current_image:
+            return []
+        diff = previous_image != current_image
+        if diff.ndim == 3:
+            diff = diff.any(axis=2)
+        height, width = diff.shape
+        tiles = numpy.add.reduceat(diff, range(0, height, tile_size), axis=0)
+        tiles = numpy.add.reduceat(tiles, range(0, width, tile_size), axis=1) > 0
+
+        # merge changed tiles into horizontal runs and identical runs into columns
+        changes, open_runs = [], {}
+        for row in range(tiles.shape[0]):
+            columns = numpy.flatnonzero(tiles[row])
+            runs, start = [], None
+            for i, column in enumerate(columns):
+                if start is None:
+                    start = column
+                if i + 1 == len(columns) or columns[i + 1] != column + 1:
+                    runs.append((int(start), int(column) + 1))
+                    start = None
+            new_runs = {}
+            for run in runs:
+                new_runs[run] = open_runs.pop(run, row)
+            for (left, right), top in open_runs.items():
+                changes.append((left, top, right, row))
+            open_runs = new_runs
+        for (left, right), top in open_runs.items():
+            changes.append((left, top, right, tiles.shape[0]))
+
+        return [(left * tile_size, top * tile_size,
+                 min(right * tile_size, width) - left * tile_size,
+                 min(bottom * tile_size, height) - top * tile_size)
+                for left, top, right, bottom in sorted(changes, key=lambda c: (c[1], c[0]))]
+
+    def wait_for_change(self, previous, timeout, *args):
+        """
+        Wait for a screen region to change with respect to an older capture.
+
+        :param previous: older capture of the screen region
+        :type previous: :py:class:`image.Image` or None
+        :param float timeout: maximal time to wait for a change
+        :param args: region's (x, y, width, height) or a region object or
+                     nothing to obtain an image of the full screen
+        :type args: [int] or :py:class:`region.Region` or None
+        :returns: newest capture of the region and its changes with respect
+                  to the older capture (see :py:meth:`detect_changes`)
+        :rtype: (:py:class:`image.Image`, [(int, int, int, int)] or None)
+
+        The region is polled with an adaptive backoff, i.e. the polling starts
+        at the rescan interval and slows down exponentially while nothing
+        changes. Only once changes are observed during a wait, the following
+        waits start polling faster down to a fraction of the rescan interval
+        so that captures are not multiplied on backends where they are slow.
+        """
+        expires = time.time() + timeout
+        rescan = GlobalConfig.rescan_speed_on_find
+        start = self._poll_delay if self._poll_delay is not None else rescan
+        delay = start
+        while True:
+            capture = self.capture_screen(*args)
+            changes = self.detect_changes(previous, capture)
+            remaining = expires - time.time()
+            if changes is not None and len(changes) > 0:
+                # the screen is active so start polling faster on the next wait
+                self._poll_delay = max(start / 2, rescan / 4)
+            elif changes is not None and remaining <= 0:
+                self._poll_delay = None
+            if changes is None or len(changes) > 0 or remaining <= 0:
+                return capture, changes
+            time.sleep(min(delay, remaining))
+            delay = min(2 * delay, 2 * rescan)
+
     def mouse_move(self, location, smooth=True):
         """
         Move the mouse to a desired location.
@@ -401,7 +571,11 @@ class AutoPyController(Controller):
 
         See base method for details.
         """
-        xpos, ypos, width, height, filename = self._region_from_args(*args)
+        xpos, ypos, width, height = self._clipped_region_from_args(*args)
+        if width > 0 and height > 0:
+            image = self._grab_screen(xpos, ypos, width, height)
+            if image is not None:
+                return image
 
         # autopy works in points and requires a minimum of one point along a dimension
         xpos, ypos, width, height = xpos / self._scale, ypos / self._scale, width / self._scale, height / self._scale
@@ -411,6 +585,11 @@ class AutoPyController(Controller):
             autopy_bmp = self._backend_obj.bitmap.capture_screen(((xpos, ypos), (width, height)))
         except ValueError:
             return Image(None, PIL.Image.new('RGB', (1, 1)))
+        # autopy bitmaps can only be exported through a file
+        with NamedTemporaryFile(prefix='guibot', suffix='.png') as f:
+            # NOTE: the file can be open twice on unix but only once on windows so simply
+            # use the generated filename to avoid this difference and remove it manually
+            filename = f.name
         autopy_bmp.save(filename)
 
         with PIL.Image.open(filename) as f:
@@ -531,6 +710,8 @@ class XDoToolController(Controller):
         self.params[category] = {}
         self.params[category]["backend"] = "none"
         self.params[category]["binary"] = "xdotool"
+        # keep a single X11 connection for all commands instead of an xdotool process each
+        self.params[category]["persistent"] = False
 
     def configure_backend(self, backend=None, category="xdotool", reset=False):
         """
@@ -557,7 +738,109 @@ class XDoToolController(Controller):
                 process += [command]
                 process += args
                 return subprocess.check_output(process, shell=False).decode()
-        self._backend_obj = XDoTool(self)
+
+        class XDoToolSession(object):
+            """Persistent X11 client emulating the used xdotool commands via XTest."""
+
+            # special key names accepted by xdotool
+            aliases = {"ctrl": "Control_L", "control": "Control_L", "alt": "Alt_L",
+                       "shift": "Shift_L", "meta": "Meta_L", "super": "Super_L",
+                       "CtrlR": "Control_R", "AltR": "Alt_R", "ShiftR": "Shift_R",
+                       "MetaR": "Meta_R", "enter": "Return"}
+            characters = {"\n": "Return", "\t": "Tab", " ": "space"}
+
+            def __init__(self, dc):
+                from Xlib import display
+                self.dc = dc
+                self.display = display.Display()
+                self.root = self.display.screen().root
+
+            def run(self, command, *args):
+                from Xlib import X
+                from Xlib.ext import xtest
+                if command == "getmouselocation":
+                    pointer = self.root.query_pointer()
+                    return "x:%s y:%s" % (pointer.root_x, pointer.root_y)
+                elif command == "getdisplaygeometry":
+                    screen = self.display.screen()
+                    return "%s %s" % (screen.width_in_pixels, screen.height_in_pixels)
+                elif command == "mousemove":
+                    xtest.fake_input(self.display, X.MotionNotify, x=int(args[0]), y=int(args[1]))
+                elif command in ["mousedown", "mouseup"]:
+                    event = X.ButtonPress if command == "mousedown" else X.ButtonRelease
+                    xtest.fake_input(self.display, event, int(args[0]))
+                elif command in ["keydown", "keyup"]:
+                    event = X.KeyPress if command == "keydown" else X.KeyRelease
+                    xtest.fake_input(self.display, event, self.keycode(args[0]))
+                elif command == "type":
+                    for char in args[0]:
+                        self.type_character(char)
+                else:
+                    raise NotImplementedError("Command '%s' is not supported by the X11 session" % command)
+                # wait for the server to process all requests
+                self.display.sync()
+                return ""
+
+            def keysym(self, name):
+                from Xlib import XK
+                keysym = XK.string_to_keysym(self.aliases.get(name, name))
+                if keysym == 0 and len(name) == 1:
+                    # latin-1 keysyms coincide with the code points, others are offset
+                    keysym = ord(name) if ord(name) < 0x100 else 0x01000000 + ord(name)
+                return keysym
+
+            def keycode(self, name):
+                keycode = self.display.keysym_to_keycode(self.keysym(name))
+                if keycode == 0:
+                    raise ValueError("Key '%s' is not available on the X11 keyboard" % name)
+                return keycode
+
+            def type_character(self, char):
+                from Xlib import X
+                from Xlib.ext import xtest
+                keysym = self.keysym(self.characters.get(char, char))
+                keycodes = [(keycode, index) for keycode, index in
+                            self.display.keysym_to_keycodes(keysym) if index < 2]
+                remapped = None
+                if len(keycodes) == 0:
+                    # temporarily map the character to an unused keycode like xdotool does
+                    first = self.display.display.info.min_keycode
+                    count = self.display.display.info.max_keycode - first + 1
+                    mapping = self.display.get_keyboard_mapping(first, count)
+                    unused = [i for i, keysyms in enumerate(mapping) if not any(keysyms)]
+                    if len(unused) == 0:
+                        raise ValueError("Character '%s' cannot be typed on the X11 keyboard" % char)
+                    remapped = (first + unused[-1], mapping[unused[-1]])
+                    self.display.change_keyboard_mapping(remapped[0], [(keysym, keysym)])
+                    self.display.sync()
+                    keycodes = [(remapped[0], 0)]
+
+                keycode, index = keycodes[0]
+                shift = self.display.keysym_to_keycode(self.keysym("Shift_L"))
+                if index == 1:
+                    xtest.fake_input(self.display, X.KeyPress, shift)
+                xtest.fake_input(self.display, X.KeyPress, keycode)
+                xtest.fake_input(self.display, X.KeyRelease, keycode)
+                if index == 1:
+                    xtest.fake_input(self.display, X.KeyRelease, shift)
+
+                if remapped is not None:
+                    self.display.sync()
+                    self.display.change_keyboard_mapping(remapped[0], [tuple(remapped[1])])
+
+            def key_pressed(self, name):
+                keycode = self.keycode(name)
+                return bool(self.display.query_keymap()[keycode // 8] & (1 << (keycode % 8)))
+
+        self._backend_obj = None
+        if self.params[category]["persistent"]:
+            try:
+                self._backend_obj = XDoToolSession(self)
+            except ImportError as error:
+                log.warning("Persistent X11 session requires python-xlib, falling back "
+                            "to an xdotool process per command: %s", error)
+        if self._backend_obj is None:
+            self._backend_obj = XDoTool(self)
 
         self._width, self._height = self._backend_obj.run("getdisplaygeometry").split()
         self._width, self._height = int(self._width), int(self._height)
@@ -580,13 +863,20 @@ class XDoToolController(Controller):
 
         See base method for details.
         """
-        xpos, ypos, width, height, filename = self._region_from_args(*args)
+        xpos, ypos, width, height = self._clipped_region_from_args(*args)
+        if width > 0 and height > 0:
+            image = self._grab_screen(xpos, ypos, width, height)
+            if image is not None:
+                return image
+
+        import io
         import subprocess
         with subprocess.Popen(("xwd", "-silent", "-root"), stdout=subprocess.PIPE) as xwd:
-            subprocess.call(("convert", "xwd:-", "-crop", "%sx%s+%s+%s" % (width, height, xpos, ypos), filename), stdin=xwd.stdout)
-        with PIL.Image.open(filename) as f:
+            crop = "%sx%s+%s+%s" % (width, height, xpos, ypos)
+            png_data = subprocess.check_output(("convert", "xwd:-", "-crop", crop, "png:-"),
+                                               stdin=xwd.stdout)
+        with PIL.Image.open(io.BytesIO(png_data)) as f:
             pil_image = f.convert('RGB')
-        os.unlink(filename)
         return Image(None, pil_image)
 
     def mouse_move(self, location, smooth=True):
@@ -601,8 +891,13 @@ class XDoToolController(Controller):
                         " defaulting to instant mouse move")
         self._backend_obj.run("mousemove", str(location.x), str(location.y))
         # handle race conditions where the backend coordinates are updated too
-        # slowly by giving some time for the new location to take effect there
-        time.sleep(0.3)
+        # slowly by waiting for the new location to take effect there
+        expires = time.time() + 0.3
+        while time.time() < expires:
+            current = self.mouse_location
+            if current.x == location.x and current.y == location.y:
+                break
+            time.sleep(0.01)
         self._pointer = location
 
     def mouse_click(self, button=None, count=1, modifiers=None):
@@ -653,6 +948,12 @@ class XDoToolController(Controller):
                 self._backend_obj.run('keydown', str(key))
             else:
                 self._backend_obj.run('keyup', str(key))
+            # confirm the key state where it can be queried (persistent session)
+            if hasattr(self._backend_obj, "key_pressed"):
+                expires = time.time() + GlobalConfig.toggle_delay
+                while (self._backend_obj.key_pressed(str(key)) != up_down
+                       and time.time() < expires):
+                    time.sleep(0.001)
 
     def keys_type(self, text, modifiers=None):
         """
@@ -698,6 +999,8 @@ class VNCDoToolController(Controller):
         self.params[category]["vnc_port"] = 0
         # password for the vnc server
         self.params[category]["vnc_password"] = None
+        # capture from a local framebuffer kept up to date with incremental updates
+        self.params[category]["vnc_incremental"] = False
 
     def configure_backend(self, backend=None, category="vncdotool", reset=False):
         """
@@ -739,6 +1042,13 @@ class VNCDoToolController(Controller):
         self._width = screen.width
         self._height = screen.height
 
+        self._framebuffer = None
+        self._last_changes = None
+        self._last_capture = None
+        self._capture_changes = None
+        if self.params[category]["vnc_incremental"]:
+            self._start_incremental_updates()
+
         # sync pointer
         self.mouse_move(Location(self._width, self._height), smooth=False)
         self.mouse_move(Location(0, 0), smooth=False)
@@ -762,12 +1072,226 @@ class VNCDoToolController(Controller):
 
         See base method for details.
         """
-        xpos, ypos, width, height, _ = self._region_from_args(*args)
+        xpos, ypos, width, height = self._clipped_region_from_args(*args)
+        if self._framebuffer is not None:
+            return self._capture_framebuffer(xpos, ypos, width, height)
         self._backend_obj.refreshScreen()
         cropped = self._backend_obj.screen.crop((xpos, ypos, xpos + width, ypos + height))
         pil_image = cropped.convert('RGB')
         return Image(None, pil_image)
 
+    def get_last_changes(self):
+        """
+        Getter for readonly attribute.
+
+        :returns: screen rectangles (x, y, width, height) changed between the
+                  last two captures or None if changes are not tracked
+        :rtype: [(int, int, int, int)] or None
+
+        Changes are tracked only for incremental framebuffer updates where
+        the first capture of a screen region reports the region as changed.
+        """
+        return self._last_changes
+    last_changes = property(fget=get_last_changes)
+
+    def _start_incremental_updates(self):
+        import threading
+        import numpy
+        protocol = self._backend_obj.protocol
+
+        self._framebuffer = numpy.array(protocol.screen.convert('RGB'))
+        self._framebuffer_lock = threading.Condition()
+        # region kept up to date through incremental update requests
+        self._framebuffer_region = None
+        self._framebuffer_requests = 0
+        self._framebuffer_changes = []
+        # masks of requested rectangles (x, y, mask) not yet covered by updates
+        self._framebuffer_pending = []
+        self._last_changes = None
+
+        def store_rectangle(x, y, width, height, covering=True):
+            # mirror the protocol screen (including any drawn cursor) in the framebuffer
+            screen_width, screen_height = protocol.screen.size
+            left, top = max(x, 0), max(y, 0)
+            right, bottom = min(x + width, screen_width), min(y + height, screen_height)
+            if left >= right or top >= bottom:
+                return
+            self._resize_framebuffer(screen_width, screen_height)
+            area = protocol.screen.crop((left, top, right, bottom))
+            self._framebuffer[top:bottom, left:right] = numpy.asarray(area.convert('RGB'))
+            self._framebuffer_changes.append((left, top, right - left, bottom - top))
+            if not covering:
+                return
+            for pending_x, pending_y, pending in self._framebuffer_pending:
+                pending[max(top - pending_y, 0):max(bottom - pending_y, 0),
+                        max(left - pending_x, 0):max(right - pending_x, 0)] = False
+
+        def store_cursor():
+            if protocol.cursor is None or protocol.screen is None:
+                return
+            width, height = protocol.cursor.size
+            store_rectangle(protocol.x - protocol.cfocus[0], protocol.y - protocol.cfocus[1],
+                            width, height, covering=False)
+
+        update_screen = protocol.updateRectangle
+        def update_rectangle(x, y, width, height, data):
+            update_screen(x, y, width, height, data)
+            # ignore empty updates
+            if not data:
+                return
+            with self._framebuffer_lock:
+                store_rectangle(x, y, width, height)
+                store_cursor()
+
+        def copy_rectangle(srcx, srcy, x, y, width, height):
+            if protocol.screen is None:
+                return
+            source = protocol.screen.crop((srcx, srcy, srcx + width, srcy + height))
+            protocol.screen.paste(source, (x, y))
+            protocol.drawCursor()
+            with self._framebuffer_lock:
+                store_rectangle(x, y, width, height)
+                store_cursor()
+
+        update_cursor = protocol.updateCursor
+        def update_cursor_shape(x, y, width, height, image, mask):
+            update_cursor(x, y, width, height, image, mask)
+            with self._framebuffer_lock:
+                store_cursor()
+
+        update_size = protocol.updateDesktopSize
+        def update_desktop_size(width, height):
+            update_size(width, height)
+            with self._framebuffer_lock:
+                self._framebuffer = self._framebuffer[:height, :width]
+                self._resize_framebuffer(width, height)
+                self._framebuffer_changes.append((0, 0, width, height))
+
+        commit_update = protocol.commitUpdate
+        def commit_incremental_update(rectangles):
+            commit_update(rectangles)
+            with self._framebuffer_lock:
+                self._framebuffer_requests = max(self._framebuffer_requests - 1, 0)
+                region = self._framebuffer_region
+                # keep exactly one request in flight for the watched region
+                if region is not None and self._framebuffer_requests == 0:
+                    self._framebuffer_requests += 1
+                    protocol.framebufferUpdateRequest(*region, incremental=1)
+                self._framebuffer_lock.notify_all()
+
+        protocol.updateRectangle = update_rectangle
+        protocol.copyRectangle = copy_rectangle
+        protocol.updateCursor = update_cursor_shape
+        protocol.updateDesktopSize = update_desktop_size
+        protocol.commitUpdate = commit_incremental_update
+        log.debug("Capturing from a framebuffer with incremental updates")
+
+    def _resize_framebuffer(self, width, height):
+        import numpy
+        if self._framebuffer.shape[1] >= width and self._framebuffer.shape[0] >= height:
+            return
+        new_framebuffer = numpy.zeros((max(height, self._framebuffer.shape[0]),
+                                       max(width, self._framebuffer.shape[1]), 3), numpy.uint8)
+        new_framebuffer[:self._framebuffer.shape[0], :self._framebuffer.shape[1]] = self._framebuffer
+        self._framebuffer = new_framebuffer
+
+    def _capture_framebuffer(self, xpos, ypos, width, height):
+        import numpy
+        from twisted.internet import reactor
+        protocol = self._backend_obj.protocol
+        with self._framebuffer_lock:
+            region = self._framebuffer_region
+            if (region is None or xpos < region[0] or ypos < region[1]
+                    or xpos + width > region[0] + region[2] or ypos + height > region[1] + region[3]):
+                # watch a region covering both the old and the newly captured one
+                if region is None:
+                    region = (xpos, ypos, width, height)
+                else:
+                    left, top = min(region[0], xpos), min(region[1], ypos)
+                    right = max(region[0] + region[2], xpos + width)
+                    bottom = max(region[1] + region[3], ypos + height)
+                    region = (left, top, right - left, bottom - top)
+                self._framebuffer_region = region
+                log.debug("Requesting a full framebuffer update for the new region %s", region)
+
+                # in-flight updates for the old region may arrive first so wait until
+                # the new region is entirely covered by updates received from now on
+                pending = numpy.ones((height, width), dtype=bool)
+                request = (xpos, ypos, pending)
+                self._framebuffer_pending.append(request)
+                self._framebuffer_requests += 1
+                reactor.callFromThread(protocol.framebufferUpdateRequest,
+                                       xpos, ypos, width, height, 0)
+                try:
+                    if not self._framebuffer_lock.wait_for(lambda: not pending.any(),
+                                                           timeout=self._backend_obj.timeout):
+                        raise TimeoutError("Timeout while waiting for a framebuffer update")
+                finally:
+                    self._framebuffer_pending = [r for r in self._framebuffer_pending
+                                                 if r is not request]
+                self._framebuffer_changes = []
+                self._last_changes = [(xpos, ypos, width, height)]
+            else:
+                self._last_changes = self._framebuffer_changes
+                self._framebuffer_changes = []
+
+            numpy_image = self._framebuffer[ypos:ypos+height, xpos:xpos+width].copy()
+        image = Image(numpy_image=numpy_image)
+
+        # keep the tracked changes relative to the captured region for comparisons
+        region = (xpos, ypos, width, height)
+        self._capture_changes = None
+        if self._last_capture is not None and self._last_capture[1] == region:
+            changes = []
+            for x, y, w, h in self._last_changes:
+                left, top = max(x, xpos), max(y, ypos)
+                right, bottom = min(x + w, xpos + width), min(y + h, ypos + height)
+                if left < right and top < bottom:
+                    changes.append((left - xpos, top - ypos, right - left, bottom - top))
+            self._capture_changes = (self._last_capture[0], image, changes)
+        self._last_capture = (image, region)
+        return image
+
+    def detect_changes(self, previous, current, tile_size=32):
+        """
+        Custom implementation of the base method.
+
+        See base method for details.
+
+        Changes between two successive captures of the same region are
+        taken from the tracked framebuffer updates without any comparison.
+        """
+        if (self._framebuffer is not None and self._capture_changes is not None
+                and previous is self._capture_changes[0] and current is self._capture_changes[1]):
+            return list(self._capture_changes[2])
+        return super(VNCDoToolController, self).detect_changes(previous, current, tile_size)
+
+    def wait_for_change(self, previous, timeout, *args):
+        """
+        Custom implementation of the base method.
+
+        See base method for details.
+
+        If the older capture is the last capture of the same region in
+        incremental framebuffer mode, the wait is woken directly by the
+        framebuffer updates overlapping with the region.
+        """
+        region = self._clipped_region_from_args(*args)
+        if (self._framebuffer is None or self._last_capture is None
+                or previous is not self._last_capture[0] or region != self._last_capture[1]):
+            return super(VNCDoToolController, self).wait_for_change(previous, timeout, *args)
+
+        xpos, ypos, width, height = region
+        def region_changed():
+            for x, y, w, h in self._framebuffer_changes:
+                if x < xpos + width and xpos < x + w and y < ypos + height and ypos < y + h:
+                    return True
+            return False
+        with self._framebuffer_lock:
+            self._framebuffer_lock.wait_for(region_changed, timeout=timeout)
+        capture = self.capture_screen(*args)
+        return capture, self.detect_changes(previous, capture)
+
     def mouse_move(self, location, smooth=True):
         """
         Custom implementation of the base method.
@@ -936,7 +1460,7 @@ class PyAutoGUIController(Controller):
 
         See base method for details.
         """
-        xpos, ypos, width, height, _ = self._region_from_args(*args)
+        xpos, ypos, width, height = self._clipped_region_from_args(*args)
 
         pil_image = self._backend_obj.screenshot(region=(xpos, ypos, width, height))
         return Image(None, pil_image)
@@ -29,7 +29,10 @@ import os
 import sys
 import re
 import copy
+import bisect
 import random
+import threading
+import collections
 import configparser as config
 import PIL.Image
 
@@ -440,6 +443,22 @@ class Finder(LocalConfig):
         """
         raise NotImplementedError("Abstract method call - call implementation of this class")
 
+    def find_batch(self, needles, haystack):
+        """
+        Find all matches of several needle targets in the same haystack image.
+
+        :param needles: targets to look for
+        :type needles: [:py:class:`target.Target`]
+        :param haystack: image to look in
+        :type haystack: :py:class:`target.Image`
+        :returns: all found matches for each needle in the order of the needles
+        :rtype: [[:py:class:`match.Match`]]
+
+        All needles are matched by this finder one after the other which
+        reuses any conversion of the haystack cached by its image.
+        """
+        return [self.find(needle, haystack) for needle in needles]
+
     def log(self, lvl):
         """
         Log images with an arbitrary logging level.
@@ -572,6 +591,10 @@ class ContourFinder(Finder):
     the ones with area (size) similar to the searched image.
     """
 
+    _cache = collections.OrderedDict()
+    _cache_size = 64
+    _cache_lock = threading.Lock()
+
     def __init__(self, configure=True, synchronize=True):
         """Build a CV backend using OpenCV's contour matching."""
         super(ContourFinder, self).__init__(configure=False, synchronize=False)
@@ -687,105 +710,253 @@ class ContourFinder(Finder):
         import cv2
         import numpy
 
-        orig_needle = numpy.array(needle.pil_image)
-        thresh_needle = self._binarize_image(orig_needle, log=False)
-        countours_needle = thresh_needle.copy()
-        needle_contours = self._extract_contours(countours_needle, log=False)
+        needle_contours, nareas, ninvariants = self._needle_contours(needle)
 
-        orig_haystack = numpy.array(haystack.pil_image)
-        thresh_haystack = self._binarize_image(orig_haystack, log=True)
+        thresh_haystack = self._binarize_image(haystack.gray_image, log=True)
         countours_haystack = thresh_haystack.copy()
         haystack_contours = self._extract_contours(countours_haystack, log=True)
+        hareas, hinvariants = self._describe_contours(haystack_contours)
 
-        self.imglog.hotmaps.append(numpy.array(haystack.pil_image))
+        self.imglog.hotmaps.append(haystack.numpy_image.copy())
 
-        distances = numpy.ones((len(haystack_contours), len(needle_contours)))
-        for i, hcontour in enumerate(haystack_contours):
-            if cv2.contourArea(hcontour) < self.params["contour"]["minArea"].value:
-                continue
-            for j, ncontour in enumerate(needle_contours):
-                if cv2.contourArea(ncontour) < self.params["contour"]["minArea"].value:
-                    continue
-                distances[i, j] = cv2.matchShapes(hcontour, ncontour, self.params["contour"]["contoursMatch"].value, 0)
-                assert distances[i, j] >= 0.0
+        distances = self._match_shapes(hinvariants, ninvariants,
+                                       self.params["contour"]["contoursMatch"].value)
+        assert (distances >= 0.0).all()
+        min_area = self.params["contour"]["minArea"].value
+        distances[hareas < min_area, :] = 1.0
+        distances[:, nareas < min_area] = 1.0
 
         from .match import Match
         matches = []
         nx, ny, nw, nh = cv2.boundingRect(numpy.concatenate(needle_contours, axis=0))
-        while True:
-            matching_haystack_contours = []
-            matching_haystack_distances = numpy.zeros(len(needle_contours))
-            for j in range(len(needle_contours)):
-                matching_haystack_distances[j] = numpy.min(distances[:, j])
-                index = numpy.where(distances[:, j] == matching_haystack_distances[j])
-                # we don't allow collapsing into the same needle contour, i.e.
-                # the map from the needle to the haystack contours is injective
-                # -> so here we cross the entire row rather than one value in it
-                distances[index[0][0], :] = 1.1  # like this works even for similarity 0.0
-                matching_haystack_contours.append(haystack_contours[index[0][0]])
-            average_distance = numpy.average(matching_haystack_distances)
-            required_distance = 1.0 - self.params["find"]["similarity"].value
-            logging.debug("Average distance to next needle shape is %s of max allowed %s",
-                          average_distance, required_distance)
-            if average_distance > required_distance:
-                break
-            else:
-                shape = numpy.concatenate(matching_haystack_contours, axis=0)
-                x, y, w, h = cv2.boundingRect(shape)
-                # calculate needle upleft and downright points to return its (0,0) location
-                needle_upleft = (max(int((x-nx)*float(w)/nw), 0), max(int((y-ny)*float(h)/nh), 0))
-                needle_downright = (min(int(needle_upleft[0]+needle.width*float(w)/nw), haystack.width),
-                                    min(int(needle_upleft[1]+needle.height*float(h)/nh), haystack.height))
-                needle_center_offset = (needle.center_offset.x*float(w)/nw,
-                                        needle.center_offset.y*float(h)/nh)
-                cv2.rectangle(self.imglog.hotmaps[-1], needle_upleft, needle_downright, (0, 0, 0), 2)
-                cv2.rectangle(self.imglog.hotmaps[-1], needle_upleft, needle_downright, (255, 255, 255), 1)
-                # NOTE: to extract the region of interest just do:
-                # roi = thresh_haystack[y:y+h,x:x+w]
-                similarity = 1.0 - average_distance
-                self.imglog.similarities.append(similarity)
-                self.imglog.locations.append(needle_upleft)
-                matches.append(Match(needle_upleft[0], needle_upleft[1],
-                                     needle_downright[0] - needle_upleft[0],
-                                     needle_downright[1] - needle_upleft[1],
-                                     needle_center_offset[0], needle_center_offset[1],
-                                     similarity))
+        required_distance = 1.0 - self.params["find"]["similarity"].value
+        for rows, average_distance in self._assign_contours(distances, required_distance):
+            shape = numpy.concatenate([haystack_contours[i] for i in rows], axis=0)
+            x, y, w, h = cv2.boundingRect(shape)
+            # calculate needle upleft and downright points to return its (0,0) location
+            needle_upleft = (max(int((x-nx)*float(w)/nw), 0), max(int((y-ny)*float(h)/nh), 0))
+            needle_downright = (min(int(needle_upleft[0]+needle.width*float(w)/nw), haystack.width),
+                                min(int(needle_upleft[1]+needle.height*float(h)/nh), haystack.height))
+            needle_center_offset = (needle.center_offset.x*float(w)/nw,
+                                    needle.center_offset.y*float(h)/nh)
+            cv2.rectangle(self.imglog.hotmaps[-1], needle_upleft, needle_downright, (0, 0, 0), 2)
+            cv2.rectangle(self.imglog.hotmaps[-1], needle_upleft, needle_downright, (255, 255, 255), 1)
+            # NOTE: to extract the region of interest just do:
+            # roi = thresh_haystack[y:y+h,x:x+w]
+            similarity = 1.0 - average_distance
+            self.imglog.similarities.append(similarity)
+            self.imglog.locations.append(needle_upleft)
+            matches.append(Match(needle_upleft[0], needle_upleft[1],
+                                 needle_downright[0] - needle_upleft[0],
+                                 needle_downright[1] - needle_upleft[1],
+                                 needle_center_offset[0], needle_center_offset[1],
+                                 similarity))
 
         self.imglog.log(30)
         return matches
 
-    def _binarize_image(self, image, log=False):
+    def _assign_contours(self, distances, required_distance):
+        """
+        EXTRA DOCSTRING: Contour matching backend - contour assignment.
+
+        Greedily assign to each needle contour (column) its closest haystack
+        contour (row) in turn, obtaining one set of haystack contours for each
+        needle match until the average distance of a set exceeds the required
+        one. Assigned haystack contours are crossed out for all further
+        assignments with a distance of 1.1 so that the map from the needle to
+        the haystack contours is injective while this works even for similarity
+        0.0. All columns are sorted only once and then walked in a single pass
+        instead of searching the entire distance matrix for each assignment.
+
+        :param distances: distances between each haystack and needle contour
+        :type distances: :py:class:`numpy.ndarray`
+        :param float required_distance: maximal average distance of a match
+        :returns: haystack contour indices and average distance for each match
+        :rtype: [([int], float)]
+        """
+        import numpy
+        crossed_distance = 1.1
+        nrows, ncols = distances.shape
+        if nrows == 0 or ncols == 0:
+            return []
+        # stable sorting retains the lowest row among equally distant ones
+        order = numpy.argsort(distances, axis=0, kind="stable").T.tolist()
+        columns = distances.T.tolist()
+        positions = [0] * ncols
+        crossed = [False] * nrows
+        first_crossed = nrows
+
+        groups = []
+        while True:
+            rows = []
+            group_distances = numpy.zeros(ncols)
+            for j in range(ncols):
+                column_order, position = order[j], positions[j]
+                while position < nrows and crossed[column_order[position]]:
+                    position += 1
+                positions[j] = position
+                if position < nrows:
+                    row = column_order[position]
+                    distance = columns[j][row]
+                else:
+                    row, distance = nrows, float("inf")
+                # crossed out rows remain candidates with their crossed out distance
+                if first_crossed < nrows and (distance > crossed_distance
+                                              or distance == crossed_distance and first_crossed < row):
+                    row, distance = first_crossed, crossed_distance
+                group_distances[j] = distance
+                crossed[row] = True
+                first_crossed = min(first_crossed, row)
+                rows.append(row)
+            average_distance = numpy.average(group_distances)
+            log.debug("Average distance to next needle shape is %s of max allowed %s",
+                      average_distance, required_distance)
+            if average_distance > required_distance:
+                return groups
+            groups.append((rows, average_distance))
+
+    def _needle_contours(self, needle):
+        """
+        EXTRA DOCSTRING: Contour matching backend - cached needle contours.
+
+        The needle contours and their descriptors are cached by needle content
+        and threshold and contour configuration since the needle rarely changes
+        between successive matching attempts.
+
+        :param needle: target image to extract contours from
+        :type needle: :py:class:`Image`
+        :returns: needle contours, their areas and Hu invariants
+        :rtype: ([:py:class:`numpy.ndarray`], :py:class:`numpy.ndarray`,
+                 :py:class:`numpy.ndarray`)
+        """
+        import hashlib
+        import numpy
+        gray = needle.gray_image
+        signature = tuple((category, key, value.value if isinstance(value, CVParameter) else value)
+                          for category in ("contour", "threshold")
+                          for key, value in sorted(self.params[category].items()))
+        needle_id = (hashlib.sha1(numpy.ascontiguousarray(gray)).hexdigest(), gray.shape, signature)
+        with self._cache_lock:
+            if needle_id in self._cache:
+                log.log(9, "Reusing cached needle contours")
+                self._cache.move_to_end(needle_id)
+                return self._cache[needle_id]
+
+        thresh_needle = self._binarize_image(gray, log=False)
+        countours_needle = thresh_needle.copy()
+        needle_contours = self._extract_contours(countours_needle, log=False)
+        nareas, ninvariants = self._describe_contours(needle_contours)
+        with self._cache_lock:
+            self._cache[needle_id] = (needle_contours, nareas, ninvariants)
+            while self._cache_size > 0 and len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return needle_contours, nareas, ninvariants
+
+    def _describe_contours(self, contours):
+        """
+        EXTRA DOCSTRING: Contour matching backend - contour descriptors.
+
+        Calculate the area and the Hu invariants used for shape matching
+        only once for each contour rather than for each pair of contours.
+
+        :param contours: contours to describe
+        :type contours: [:py:class:`numpy.ndarray`]
+        :returns: areas and Hu invariants of the contours as rows
+        :rtype: (:py:class:`numpy.ndarray`, :py:class:`numpy.ndarray`)
+        """
+        import cv2
+        import numpy
+        areas = numpy.array([cv2.contourArea(contour) for contour in contours], dtype=numpy.float64)
+        invariants = numpy.array([cv2.HuMoments(cv2.moments(contour)).ravel() for contour in contours],
+                                 dtype=numpy.float64).reshape(-1, 7)
+        return areas, invariants
+
+    def _match_shapes(self, hinvariants, ninvariants, method):
+        """
+        EXTRA DOCSTRING: Contour matching backend - shape distances.
+
+        Vectorized equivalent of :py:func:`cv2.matchShapes` for all pairs
+        of haystack and needle contours given their Hu invariants.
+
+        :param hinvariants: Hu invariants of the haystack contours as rows
+        :type hinvariants: :py:class:`numpy.ndarray`
+        :param ninvariants: Hu invariants of the needle contours as rows
+        :type ninvariants: :py:class:`numpy.ndarray`
+        :param int method: 1 for L1, 2 for L2, and 3 for L3 shape comparison
+        :returns: distances between each haystack (row) and needle (column) contour
+        :rtype: :py:class:`numpy.ndarray`
+        """
+        import math
+        import numpy
+        eps = 1.e-5
+
+        def scale(invariants):
+            # scalar logarithms round exactly like the ones used by OpenCV
+            scaled = numpy.array([[(1.0 if x > 0 else -1.0) * math.log10(abs(x)) if abs(x) > eps else 0.0
+                                   for x in row] for row in invariants],
+                                 dtype=numpy.float64).reshape(-1, 7)
+            if method == 1:
+                with numpy.errstate(divide="ignore"):
+                    scaled = numpy.where(numpy.abs(invariants) > eps, 1.0 / scaled, 0.0)
+            return scaled
+        hscaled, nscaled = scale(hinvariants), scale(ninvariants)
+        valid = ((numpy.abs(hinvariants) > eps)[:, numpy.newaxis, :]
+                 & (numpy.abs(ninvariants) > eps)[numpy.newaxis, :, :])
+
+        distances = numpy.zeros((len(hinvariants), len(ninvariants)))
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            # accumulate in the same order as OpenCV for identical results
+            for i in range(7):
+                hvalues = hscaled[:, numpy.newaxis, i]
+                nvalues = nscaled[numpy.newaxis, :, i]
+                if method == 3:
+                    distance = numpy.abs((hvalues - nvalues) / hvalues)
+                    # undefined ratios are skipped like failed comparisons in OpenCV
+                    distances = numpy.fmax(distances, numpy.where(valid[:, :, i], distance, 0.0))
+                else:
+                    distances += numpy.where(valid[:, :, i], numpy.abs(nvalues - hvalues), 0.0)
+        # shapes with only zero invariants match only such shapes
+        hany = (hinvariants != 0).any(axis=1)
+        nany = (ninvariants != 0).any(axis=1)
+        distances[hany[:, numpy.newaxis] != nany[numpy.newaxis, :]] = numpy.finfo(numpy.float64).max
+        return distances
+
+    def _binarize_image(self, image, log=False, category="threshold"):
         import cv2
+        params = self.params[category]
         # blur first in order to avoid unwonted edges caused from noise
-        blurSize = self.params["threshold"]["blurKernelSize"].value
-        blurDeviation = self.params["threshold"]["blurKernelSigma"].value
-        gray_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
-        if self.params["threshold"]["blurType"].value == 1:
+        blurSize = params["blurKernelSize"].value
+        blurDeviation = params["blurKernelSigma"].value
+        if image.ndim == 2:
+            gray_image = image
+        else:
+            gray_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+        if params["blurType"].value == 1:
             blur_image = cv2.blur(gray_image, (blurSize, blurSize))
-        elif self.params["threshold"]["blurType"].value == 2:
+        elif params["blurType"].value == 2:
             blur_image = cv2.medianBlur(gray_image, blurSize)
-        elif self.params["threshold"]["blurType"].value == 3:
+        elif params["blurType"].value == 3:
             blur_image = cv2.GaussianBlur(gray_image, (blurSize, blurSize), blurDeviation)
-        elif self.params["threshold"]["blurType"].value == 4:
+        elif params["blurType"].value == 4:
             blur_image = gray_image
 
         # second stage: thresholding
-        if self.params["threshold"]["backend"] == "normal":
+        if params["backend"] == "normal":
             _, thresh_image = cv2.threshold(blur_image,
-                                            self.params["threshold"]["thresholdValue"].value,
-                                            self.params["threshold"]["thresholdMax"].value,
-                                            self.params["threshold"]["thresholdType"].value)
-        elif self.params["threshold"]["backend"] == "adaptive":
+                                            params["thresholdValue"].value,
+                                            params["thresholdMax"].value,
+                                            params["thresholdType"].value)
+        elif params["backend"] == "adaptive":
             thresh_image = cv2.adaptiveThreshold(blur_image,
-                                                 self.params["threshold"]["thresholdMax"].value,
-                                                 self.params["threshold"]["adaptiveMethod"].value,
-                                                 self.params["threshold"]["thresholdType"].value,
-                                                 self.params["threshold"]["blockSize"].value,
-                                                 self.params["threshold"]["constant"].value)
-        elif self.params["threshold"]["backend"] == "canny":
+                                                 params["thresholdMax"].value,
+                                                 params["adaptiveMethod"].value,
+                                                 params["thresholdType"].value,
+                                                 params["blockSize"].value,
+                                                 params["constant"].value)
+        elif params["backend"] == "canny":
             thresh_image = cv2.Canny(blur_image,
-                                     self.params["threshold"]["threshold1"].value,
-                                     self.params["threshold"]["threshold2"].value)
+                                     params["threshold1"].value,
+                                     params["threshold2"].value)
 
         if log:
             self.imglog.hotmaps.append(thresh_image)
@@ -848,6 +1019,9 @@ class TemplateFinder(Finder):
         # we only use the normalized version of "sqdiff", "ccorr", and "ccoeff"
         self.algorithms["template_matchers"] = ("sqdiff_normed", "ccorr_normed", "ccoeff_normed")
 
+        # other attributes
+        self._match_cache = None
+
         # additional preparation (no synchronization available)
         if configure:
             self.__configure_backend(reset=True)
@@ -872,6 +1046,10 @@ class TemplateFinder(Finder):
         self.params[category] = {}
         self.params[category]["backend"] = backend
         self.params[category]["nocolor"] = CVParameter(False)
+        # number of coarse matching levels of the image pyramid (0 for exhaustive matching)
+        self.params[category]["pyramid_levels"] = CVParameter(0, 0, 5, 2.0)
+        # similarity margin for the coarse candidates to be refined at full resolution
+        self.params[category]["pyramid_tolerance"] = CVParameter(0.1, 0.0, 1.0, 0.1, 0.01)
         log.log(9, "%s %s\n", category, self.params[category])
 
     def configure_backend(self, backend=None, category="template", reset=False):
@@ -882,12 +1060,20 @@ class TemplateFinder(Finder):
         """
         self.__configure_backend(backend, category, reset)
 
-    def find(self, needle, haystack):
+    def find(self, needle, haystack, max_matches=0, changes=None, previous=None):
         """
         Custom implementation of the base method.
 
         :param needle: target iamge to search for
         :type needle: :py:class:`Image`
+        :param int max_matches: maximal number of matches to return where
+                                zero means no limit (best matches first)
+        :param changes: rectangles (x, y, width, height) of the haystack that
+                        changed since the previous haystack or None if unknown
+        :type changes: [(int, int, int, int)] or None
+        :param previous: haystack the changes are relative to, only used if
+                         it was the last haystack searched for the same needle
+        :type previous: :py:class:`Image` or None
         :raises: :py:class:`UnsupportedBackendError` if the choice of template
                  matches is not among the supported ones
 
@@ -907,7 +1093,8 @@ class TemplateFinder(Finder):
         no_color = self.params["template"]["nocolor"].value
         log.debug("Performing %s template matching %s color",
                   match_template, "without" if no_color else "with")
-        result = self._match_template(needle, haystack, no_color, match_template)
+        result = self._match_template(needle, haystack, no_color, match_template,
+                                      changes, previous)
         if result is None:
             log.warning("OpenCV's template matching returned no result")
             return []
@@ -918,79 +1105,133 @@ class TemplateFinder(Finder):
         import cv2
         import numpy
         universal_hotmap = result * 255.0
-        final_hotmap = numpy.array(self.imglog.haystack.pil_image)
         if self.params["template"]["nocolor"].value:
-            final_hotmap = cv2.cvtColor(final_hotmap, cv2.COLOR_RGB2GRAY)
+            final_hotmap = haystack.gray_image.copy()
+        else:
+            final_hotmap = haystack.numpy_image.copy()
 
-        # extract maxima once for each needle size region
         similarity = self.params["find"]["similarity"].value
+        # return just one match if no similarity requirement
+        if similarity == 0.0:
+            max_matches = 1
+        locations = self._extract_maxima(result, needle, similarity, max_matches)
+
         from .match import Match
         matches = []
-        while True:
-
-            minVal, maxVal, minLoc, maxLoc = cv2.minMaxLoc(result)
+        if len(locations) == 0:
+            _, maxVal, _, maxLoc = cv2.minMaxLoc(result)
             # rectify to the [0,1] interval to avoid negative values in some methods
             maxVal = min(max(maxVal, 0.0), 1.0)
-            log.debug('Next best match with value %s (similarity %s) and location (x,y) %s',
+            log.debug("Best match with value %s (similarity %s) and location (x,y) %s is not acceptable",
                       str(maxVal), similarity, str(maxLoc))
+            self.imglog.similarities.append(maxVal)
+            self.imglog.locations.append(maxLoc)
+            current_hotmap = numpy.copy(universal_hotmap)
+            cv2.circle(current_hotmap, (maxLoc[0], maxLoc[1]), int(30*maxVal), (255, 255, 255))
+            self.imglog.hotmaps.append(current_hotmap)
+            self.imglog.hotmaps.append(final_hotmap)
+
+        for maxLoc, maxVal in locations:
+            log.debug("Next acceptable match with value %s (similarity %s) and location (x,y) %s",
+                      str(maxVal), similarity, str(maxLoc))
+            self.imglog.similarities.append(maxVal)
+            self.imglog.locations.append(maxLoc)
+            current_hotmap = numpy.copy(universal_hotmap)
+            cv2.circle(current_hotmap, (maxLoc[0], maxLoc[1]), int(30*maxVal), (255, 255, 255))
+            x, y = maxLoc
+            w, h = needle.width, needle.height
+            dx, dy = needle.center_offset.x, needle.center_offset.y
+            cv2.rectangle(final_hotmap, (x, y), (x+w, y+h), (0, 0, 0), 2)
+            cv2.rectangle(final_hotmap, (x, y), (x+w, y+h), (255, 255, 255), 1)
+            self.imglog.hotmaps.append(current_hotmap)
+            matches.append(Match(x, y, w, h, dx, dy, maxVal))
 
-            if maxVal < similarity:
-                if len(matches) == 0:
-                    self.imglog.similarities.append(maxVal)
-                    self.imglog.locations.append(maxLoc)
-                    current_hotmap = numpy.copy(universal_hotmap)
-                    cv2.circle(current_hotmap, (maxLoc[0], maxLoc[1]), int(30*maxVal), (255, 255, 255))
-                    self.imglog.hotmaps.append(current_hotmap)
-                    self.imglog.hotmaps.append(final_hotmap)
-
-                log.debug("Next best match is not acceptable")
-                break
-            else:
-                self.imglog.similarities.append(maxVal)
-                self.imglog.locations.append(maxLoc)
-                current_hotmap = numpy.copy(universal_hotmap)
-                cv2.circle(current_hotmap, (maxLoc[0], maxLoc[1]), int(30*maxVal), (255, 255, 255))
-                x, y = maxLoc
-                w, h = needle.width, needle.height
-                dx, dy = needle.center_offset.x, needle.center_offset.y
-                cv2.rectangle(final_hotmap, (x, y), (x+w, y+h), (0, 0, 0), 2)
-                cv2.rectangle(final_hotmap, (x, y), (x+w, y+h), (255, 255, 255), 1)
-                self.imglog.hotmaps.append(current_hotmap)
-                log.debug("Next best match is acceptable")
-                matches.append(Match(x, y, w, h, dx, dy, maxVal))
-                if similarity == 0.0:
-                    # return just one match if no similarity requirement
-                    break
-
-            res_w = haystack.width - needle.width + 1
-            res_h = haystack.height - needle.height + 1
-            match_x0 = max(maxLoc[0] - int(0.5 * needle.width), 0)
-            match_x1 = min(maxLoc[0] + int(0.5 * needle.width), res_w)
-            match_y0 = max(maxLoc[1] - int(0.5 * needle.height), 0)
-            match_y1 = min(maxLoc[1] + int(0.5 * needle.height), res_h)
-
-            # log this only if performing deep internal debugging
-            log.log(9, "Wipe image matches in x [%s, %s]/[%s, %s]",
-                    match_x0, match_x1, 0, res_w)
-            log.log(9, "Wipe image matches in y [%s, %s]/[%s, %s]",
-                    match_y0, match_y1, 0, res_h)
-
-            # clean found image to look for next safe distance match
-            result[match_y0:match_y1, match_x0:match_x1] = 0.0
-
-            log.log(9, "Total maxima up to the point are %i", len(matches))
         log.debug("A total of %i matches found", len(matches))
         self.imglog.hotmaps.append(final_hotmap)
         self.imglog.log(30)
 
         return matches
 
-    def _match_template(self, needle, haystack, nocolor, method):
+    def _extract_maxima(self, result, needle, similarity, max_matches=0):
+        """
+        EXTRA DOCSTRING: Template matching backend - peak extraction.
+
+        Extract all acceptable maxima of a match result in one pass over
+        the result map followed by greedy non-maximum suppression.
+
+        :param result: match result with higher values for better matches
+        :type result: :py:class:`numpy.ndarray`
+        :param needle: needle image determining the suppression radius
+        :type needle: :py:class:`Image`
+        :param float similarity: minimal value of an acceptable maximum
+        :param int max_matches: maximal number of maxima to extract where
+                                zero means no limit
+        :returns: locations and rectified values of the maxima (best first)
+        :rtype: [((int, int), float)]
+
+        Each extracted maximum suppresses all weaker candidates within half
+        the needle size to the left/top and right/bottom of it, the same way
+        iteratively wiping the result map around the best match would.
+        """
+        import numpy
+        # the similarity threshold applies to the rectified values so that
+        # any (even negative) maximum is acceptable without a requirement
+        if similarity > 0.0:
+            ys, xs = numpy.nonzero(result >= similarity)
+        else:
+            ys, xs = numpy.nonzero(numpy.ones(result.shape, dtype=bool))
+        values = result[ys, xs]
+        log.log(9, "Total candidates above the similarity threshold are %i", len(values))
+
+        half_width, half_height = int(0.5 * needle.width), int(0.5 * needle.height)
+        suppressed = numpy.zeros(result.shape, dtype=bool)
+        maxima = []
+        # only the best candidates are sorted at a time with more of them
+        # taken in each next chunk until enough maxima are found
+        chunk = max(4 * max_matches, 64)
+        while len(values) > 0:
+            if chunk < len(values):
+                # all candidates at least as good as the chunk-th best one
+                kth = len(values) - chunk
+                selected = values >= numpy.partition(values, kth)[kth]
+            else:
+                selected = numpy.ones(len(values), dtype=bool)
+            chunk_ys, chunk_xs, chunk_values = ys[selected], xs[selected], values[selected]
+            ys, xs, values = ys[~selected], xs[~selected], values[~selected]
+            chunk *= 2
+
+            # skip candidates already suppressed by maxima from previous chunks
+            unsuppressed = ~suppressed[chunk_ys, chunk_xs]
+            chunk_ys, chunk_xs = chunk_ys[unsuppressed], chunk_xs[unsuppressed]
+            chunk_values = chunk_values[unsuppressed]
+            # candidate ordering is stable and thus breaks ties in row-major
+            # order, i.e. in the order of successive minMaxLoc calls
+            order = numpy.argsort(-chunk_values, kind="stable")
+            for y, x, value in zip(chunk_ys[order].tolist(), chunk_xs[order].tolist(),
+                                   chunk_values[order].tolist()):
+                if suppressed[y, x]:
+                    continue
+                # rectify to the [0,1] interval to avoid negative values in some methods
+                maxima.append(((x, y), min(max(value, 0.0), 1.0)))
+                if max_matches > 0 and len(maxima) >= max_matches:
+                    return maxima
+                # clean found neighbourhood to look for next safe distance match
+                suppressed[max(y - half_height, 0):y + half_height,
+                           max(x - half_width, 0):x + half_width] = True
+
+        return maxima
+
+    def _match_template(self, needle, haystack, nocolor, method, changes=None, previous=None):
         """
         EXTRA DOCSTRING: Template matching backend - wrapper.
 
         Match a color or grayscale needle image using the OpenCV
         template matching methods.
+
+        If the changes in the haystack are known with respect to the last
+        haystack matched with the same needle, the previous match result is
+        reused and only the positions overlapping with some change are
+        matched again.
         """
         # sanity check: needle size must be smaller than haystack
         if haystack.width < needle.width or haystack.height < needle.height:
@@ -999,21 +1240,150 @@ class TemplateFinder(Finder):
             return None
 
         import cv2
-        import numpy
         methods = {"sqdiff": cv2.TM_SQDIFF, "sqdiff_normed": cv2.TM_SQDIFF_NORMED,
                    "ccorr": cv2.TM_CCORR, "ccorr_normed": cv2.TM_CCORR_NORMED,
                    "ccoeff": cv2.TM_CCOEFF, "ccoeff_normed": cv2.TM_CCOEFF_NORMED}
         if method not in methods.keys():
             raise UnsupportedBackendError("Supported algorithms are in conflict")
 
-        numpy_needle = numpy.array(needle.pil_image)
-        numpy_haystack = numpy.array(haystack.pil_image)
         if nocolor:
-            gray_needle = cv2.cvtColor(numpy_needle, cv2.COLOR_RGB2GRAY)
-            gray_haystack = cv2.cvtColor(numpy_haystack, cv2.COLOR_RGB2GRAY)
-            match = cv2.matchTemplate(gray_haystack, gray_needle, methods[method])
+            numpy_needle = needle.gray_image
+            numpy_haystack = haystack.gray_image
         else:
+            numpy_needle = needle.numpy_image
+            numpy_haystack = haystack.numpy_image
+
+        levels = self.params["template"]["pyramid_levels"].value
+        cache_key = (numpy_haystack.shape, method, nocolor, levels)
+        cache = self._match_cache
+        # the changes are only valid for the very haystack they are relative to
+        if changes is not None and previous is not None and cache is not None and \
+                cache[0] is numpy_needle and cache[1] == cache_key and cache[2] is previous:
+            match = self._match_changes(numpy_needle, numpy_haystack, methods[method],
+                                        cache[3], changes)
+            if match is not None:
+                self._match_cache = (numpy_needle, cache_key, haystack, match)
+                return match
+
+        if levels > 0 and method.endswith("_normed"):
+            match = self._match_pyramid(numpy_needle, numpy_haystack, methods[method], levels)
+        else:
+            if levels > 0:
+                log.warning("Image pyramid matching requires a normalized method, "
+                            "falling back to exhaustive matching for %s", method)
             match = cv2.matchTemplate(numpy_haystack, numpy_needle, methods[method])
+        self._match_cache = (numpy_needle, cache_key, haystack, match)
+        return match
+
+    def _match_changes(self, needle, haystack, method, previous, changes):
+        """
+        EXTRA DOCSTRING: Template matching backend - dirty rectangles.
+
+        Update a previous match result only at the positions where the
+        needle overlaps with some of the changed haystack rectangles.
+
+        :param needle: needle array (color or grayscale)
+        :type needle: :py:class:`numpy.ndarray`
+        :param haystack: current haystack array of the same depth as the needle
+        :type haystack: :py:class:`numpy.ndarray`
+        :param int method: OpenCV template matching method
+        :param previous: match result for the previous haystack
+        :type previous: :py:class:`numpy.ndarray`
+        :param changes: rectangles (x, y, width, height) of the haystack
+                        changed since the previous haystack
+        :type changes: [(int, int, int, int)]
+        :returns: updated match result or None if most of it would have to
+                  be recomputed anyway
+        :rtype: :py:class:`numpy.ndarray` or None
+        """
+        import cv2
+        result_height, result_width = previous.shape[:2]
+        needle_height, needle_width = needle.shape[:2]
+
+        # positions overlapping with a change extend by the needle size to the left/top
+        windows = []
+        for x, y, w, h in changes:
+            left, top = max(0, x - needle_width + 1), max(0, y - needle_height + 1)
+            right, bottom = min(result_width, x + w), min(result_height, y + h)
+            if left < right and top < bottom:
+                windows.append((left, top, right, bottom))
+        area = sum((right - left) * (bottom - top) for left, top, right, bottom in windows)
+        if area > 0.5 * result_width * result_height:
+            return None
+        log.debug("Rematching %s changed windows covering %s%% of the previous result",
+                  len(windows), int(100 * area / (result_width * result_height)))
+
+        match = previous.copy()
+        for left, top, right, bottom in windows:
+            window = haystack[top:bottom + needle_height - 1, left:right + needle_width - 1]
+            match[top:bottom, left:right] = cv2.matchTemplate(window, needle, method)
+        return match
+
+    def _match_pyramid(self, needle, haystack, method, levels):
+        """
+        EXTRA DOCSTRING: Template matching backend - coarse-to-fine.
+
+        Match a needle at the top of an image pyramid and refine only the
+        promising candidates at full resolution.
+
+        :param needle: needle array (color or grayscale)
+        :type needle: :py:class:`numpy.ndarray`
+        :param haystack: haystack array of the same depth as the needle
+        :type haystack: :py:class:`numpy.ndarray`
+        :param int method: OpenCV normalized template matching method
+        :param int levels: maximal number of pyramid levels to descend
+        :returns: full resolution match result where all regions away from
+                  the candidates are filled with the worst similarity
+        :rtype: :py:class:`numpy.ndarray`
+        """
+        import cv2
+        import numpy
+
+        # reduce the images as long as the needle keeps enough detail
+        coarse_needle, coarse_haystack = needle, haystack
+        scale = 1
+        for _ in range(levels):
+            if min(coarse_needle.shape[:2]) < 16:
+                break
+            coarse_needle = cv2.pyrDown(coarse_needle)
+            coarse_haystack = cv2.pyrDown(coarse_haystack)
+            scale *= 2
+
+        full_height = haystack.shape[0] - needle.shape[0] + 1
+        full_width = haystack.shape[1] - needle.shape[1] + 1
+        if scale == 1:
+            return cv2.matchTemplate(haystack, needle, method)
+
+        coarse = cv2.matchTemplate(coarse_haystack, coarse_needle, method)
+        if method == cv2.TM_SQDIFF_NORMED:
+            coarse = 1.0 - coarse
+            worst = 1.0
+        elif method == cv2.TM_CCORR_NORMED:
+            worst = 0.0
+        else:
+            worst = -1.0
+        threshold = (self.params["find"]["similarity"].value
+                     - self.params["template"]["pyramid_tolerance"].value)
+        candidates = numpy.uint8(coarse >= threshold)
+        log.debug("Pyramid matching at scale 1/%s found %s coarse candidates",
+                  scale, numpy.count_nonzero(candidates))
+
+        match = numpy.full((full_height, full_width), worst, dtype=numpy.float32)
+        if not candidates.any():
+            return match
+        candidates = cv2.dilate(candidates, numpy.ones((3, 3), numpy.uint8))
+        count, _, stats, _ = cv2.connectedComponentsWithStats(candidates)
+        needle_height, needle_width = needle.shape[:2]
+        for i in range(1, count):
+            x, y, w, h = stats[i][:4]
+            left = max(0, (x - 1) * scale)
+            top = max(0, (y - 1) * scale)
+            right = min(full_width, (x + w + 1) * scale)
+            bottom = min(full_height, (y + h + 1) * scale)
+            if left >= right or top >= bottom:
+                continue
+            window = haystack[top:bottom + needle_height - 1, left:right + needle_width - 1]
+            match[top:bottom, left:right] = cv2.matchTemplate(window, needle, method)
 
         return match
 
@@ -1055,6 +1425,12 @@ class FeatureFinder(Finder):
         by default in newer OpenCV versions (>3.0).
     """
 
+    _cache = collections.OrderedDict()
+    _cache_size = 64
+    _frame_cache = collections.OrderedDict()
+    _frame_cache_size = 8
+    _cache_lock = threading.Lock()
+
     def __init__(self, configure=True, synchronize=True):
         """Build a CV backend using OpenCV's feature matching."""
         super(FeatureFinder, self).__init__(configure=False, synchronize=False)
@@ -1078,6 +1454,8 @@ class FeatureFinder(Finder):
         self.detector = None
         self.extractor = None
         self.matcher = None
+        # configuration each of the above was last synchronized with
+        self._synchronized = {}
 
         # additional preparation
         if configure:
@@ -1114,6 +1492,8 @@ class FeatureFinder(Finder):
             self.params[category]["minMatchedFeatures"] = CVParameter(4, 1, None)
             # 0 for matched/detected ratio, 1 for projected/matched ratio
             self.params[category]["similarityRatio"] = CVParameter(1, 0, 1, enumerated=True)
+            # maximal number of needle instances to project from the same features
+            self.params[category]["maxInstances"] = CVParameter(1, 1, None)
         elif category == "fdetect":
             self.params[category]["nzoom"] = CVParameter(1.0, 1.0, 10.0, 2.5)
             self.params[category]["hzoom"] = CVParameter(1.0, 1.0, 10.0, 2.5)
@@ -1239,6 +1619,10 @@ class FeatureFinder(Finder):
         if category == "feature":
             # nothing to sync
             return
+        elif self._synchronized.get(category) == self._backend_signature(category):
+            # backend objects are expensive to create and only change with the configuration
+            log.log(9, "Backend for %s is already synchronized", category)
+            return
         elif category == "fdetect":
             import cv2
             feature_detector_create = getattr(cv2, "%s_create" % backend)
@@ -1256,6 +1640,7 @@ class FeatureFinder(Finder):
             # are extracted from the matcher interface although
             # the API supports it - skip fmatch for now
             self.matcher = backend_obj
+            self._synchronized[category] = self._backend_signature(category)
             return
 
         for attribute in dir(backend_obj):
@@ -1279,6 +1664,7 @@ class FeatureFinder(Finder):
             self.extractor = backend_obj
         elif category == "fmatch":
             self.matcher = backend_obj
+        self._synchronized[category] = self._backend_signature(category)
 
     def synchronize_backend(self, backend=None, category="feature", reset=False):
         """
@@ -1288,6 +1674,17 @@ class FeatureFinder(Finder):
         """
         self.__synchronize_backend(backend, category, reset)
 
+    def _backend_signature(self, category):
+        """
+        Hashable summary of the current configuration of a backend category.
+
+        :param str category: category of the backend
+        :returns: pairs of parameter names and values
+        :rtype: ((str, object))
+        """
+        return tuple((key, value.value if isinstance(value, CVParameter) else value)
+                     for key, value in sorted(self.params[category].items()))
+
     def __synchronize(self, feature_detect=None, feature_extract=None,
                       feature_match=None, reset=True):
         self.__synchronize_backend(category="feature", reset=reset)
@@ -1318,8 +1715,13 @@ class FeatureFinder(Finder):
 
         See base method for details.
 
-        .. warning:: Finding multiple matches is currently not supported
-                     and this will currently only return a single match.
+        .. note:: Only a single match is returned by default. Multiple matches
+                  are projected from the same detected features if the
+                  "maxInstances" parameter of the "feature" category is
+                  increased, in which case each needle feature is matched to
+                  that many haystack features and the RANSAC projection is
+                  repeated on the matches left after removing the inliers of
+                  each found instance.
 
         Available methods are: a combination of feature detector,
         extractor, and matcher.
@@ -1332,12 +1734,14 @@ class FeatureFinder(Finder):
 
         import cv2
         import numpy
-        ngray = cv2.cvtColor(numpy.array(needle.pil_image), cv2.COLOR_RGB2GRAY)
-        hgray = cv2.cvtColor(numpy.array(haystack.pil_image), cv2.COLOR_RGB2GRAY)
-        self.imglog.hotmaps.append(numpy.array(haystack.pil_image))
-        self.imglog.hotmaps.append(numpy.array(haystack.pil_image))
-        self.imglog.hotmaps.append(numpy.array(haystack.pil_image))
-        self.imglog.hotmaps.append(numpy.array(haystack.pil_image))
+        ngray = needle.gray_image
+        hgray = haystack.gray_image
+        # features are drawn on the stage hotmaps only at image logging level 30 or lower
+        for _ in range(4):
+            if self.imglog.logging_level > 30:
+                self.imglog.hotmaps.append(haystack.numpy_image)
+            else:
+                self.imglog.hotmaps.append(haystack.numpy_image.copy())
 
         # project more points for debugging purposes and image logging
         npoints = []
@@ -1346,24 +1750,32 @@ class FeatureFinder(Finder):
         npoints.append((needle.width / 2, needle.height / 2))
 
         similarity = self.params["find"]["similarity"].value
-        hpoints = self._project_features(npoints, ngray, hgray, similarity)
-        if hpoints is not None and len(hpoints) > 0:
+        max_instances = self.params["feature"]["maxInstances"].value
+        instances = self._project_features(npoints, ngray, hgray, similarity, max_instances)
+        if instances is not None and len(instances) > 0:
             from .match import Match
-            x, y = hpoints[0]
-            w, h = tuple(numpy.abs(numpy.subtract(hpoints[3], hpoints[0])))
-            # TODO: projecting offset requires more effort
-            matches = [Match(x, y, w, h, 0, 0, self.imglog.similarities[-1])]
+            matches = []
+            for hpoints, instance_similarity in instances:
+                x, y = hpoints[0]
+                w, h = tuple(numpy.abs(numpy.subtract(hpoints[3], hpoints[0])))
+                # TODO: projecting offset requires more effort
+                matches.append(Match(x, y, w, h, 0, 0, instance_similarity))
+            matches = sorted(matches, key=lambda x: x.similarity, reverse=True)
             self.imglog.log(30)
             return matches
         self.imglog.log(40)
         return []
 
-    def _project_features(self, locations_in_needle, ngray, hgray, similarity):
+    def _project_features(self, locations_in_needle, ngray, hgray, similarity, max_instances=1):
         """
         EXTRA DOCSTRING: Feature matching backend - wrapper.
 
         Wrapper for the internal feature detection, matching and location
         projection used by all public feature matching functions.
+
+        :returns: projected locations and similarity of each found needle
+                  instance or None if no instance was found
+        :rtype: [([(int, int)], float)] or None
         """
         # default logging in case no match is found (further overridden by match stages)
         self.imglog.locations.append((0, 0))
@@ -1384,8 +1796,9 @@ class FeatureFinder(Finder):
                       len(nkp), min_features, len(hkp), min_features)
             return None
 
-        mnkp, mhkp = self._match_features(nkp, ndc, hkp, hdc,
-                                          self.params["fmatch"]["backend"])
+        mnkp, mhkp, mnidx = self._match_features(nkp, ndc, hkp, hdc,
+                                                 self.params["fmatch"]["backend"],
+                                                 max_instances)
 
         min_features = self.params["feature"]["minMatchedFeatures"].value
         if self.imglog.similarities[-1] < similarity or len(mnkp) < min_features:
@@ -1396,73 +1809,126 @@ class FeatureFinder(Finder):
                       self.imglog.similarities[-1], similarity)
             return None
 
-        locations_in_haystack = self._project_locations(locations_in_needle, mnkp, mhkp)
-        if self.imglog.similarities[-1] < similarity:
-            log.debug("No acceptable best match after RANSAC projection: "
-                      "best match similarity %s is less than required %s",
-                      self.imglog.similarities[-1], similarity)
+        import numpy
+        # each instance can be projected from at most one match per needle feature
+        nmatched = len(mnkp) if max_instances == 1 else len(numpy.unique(mnidx))
+        match_similarity = self.imglog.similarities[-1]
+        remaining = numpy.ones(len(mnkp), dtype=bool)
+        instances = []
+        while len(instances) < max_instances and numpy.count_nonzero(remaining) >= min_features:
+            self.imglog.similarities[-1] = match_similarity
+            logged_locations = len(self.imglog.locations)
+            locations_in_haystack, inliers = self._project_locations(locations_in_needle,
+                                                                     mnkp[remaining],
+                                                                     mhkp[remaining],
+                                                                     nmatched)
+            if self.imglog.similarities[-1] < similarity:
+                log.debug("No acceptable %s match after RANSAC projection: "
+                          "match similarity %s is less than required %s",
+                          "best" if len(instances) == 0 else "further",
+                          self.imglog.similarities[-1], similarity)
+                if len(instances) > 0:
+                    del self.imglog.locations[logged_locations:]
+                break
+            instances.append((locations_in_haystack, self.imglog.similarities[-1]))
+            # the inliers of a found instance cannot support any other instance
+            remaining[numpy.flatnonzero(remaining)[inliers]] = False
+
+        if len(instances) == 0:
             return None
-        else:
-            self._log_features(30, self.imglog.locations, self.imglog.hotmaps[-1], 3, 0, 0, 255)
-            return locations_in_haystack
+        self.imglog.similarities[-1] = instances[0][1]
+        self._log_features(30, self.imglog.locations, self.imglog.hotmaps[-1], 3, 0, 0, 255)
+        return instances
 
     def _detect_features(self, ngray, hgray, detect, extract):
         """
         EXTRA DOCSTRING: Feature matching backend - detection/extraction stage (1).
 
         Detect all keypoints and calculate their respective decriptors.
+        Keypoints are returned as packed Nx2 arrays of their locations which
+        are used as such through the remaining matching stages.
+
+        The needle features are cached by needle content and detector and
+        extractor configuration since the needle rarely changes between
+        successive matching attempts. The features of the last few haystacks
+        are cached in the same way so that matching multiple needles on the
+        same screen capture extracts its features only once.
         """
         nfactor = self.params["fdetect"]["nzoom"].value
         hfactor = self.params["fdetect"]["hzoom"].value
 
-        # zoom in if explicitly set
-        import cv2
-        if nfactor > 1.0:
-            log.debug("Zooming x%i needle", nfactor)
-            ngray = cv2.resize(ngray, None, fx=nfactor, fy=nfactor)
-        if hfactor > 1.0:
-            log.debug("Zooming x%i haystack", hfactor)
-            hgray = cv2.resize(hgray, None, fx=hfactor, fy=hfactor)
-
         # include only methods tested for compatibility
-        if (detect in self.algorithms["feature_detectors"]
-                and extract in self.algorithms["feature_extractors"]):
-            self.synchronize_backend(category="fdetect")
-            self.synchronize_backend(category="fextract")
-
-            # keypoints
-            nkeypoints = self.detector.detect(ngray)
-            hkeypoints = self.detector.detect(hgray)
-
-            # feature vectors (descriptors)
-            (nkeypoints, ndescriptors) = self.extractor.compute(ngray, nkeypoints)
-            (hkeypoints, hdescriptors) = self.extractor.compute(hgray, hkeypoints)
-
-        else:
+        if (detect not in self.algorithms["feature_detectors"]
+                or extract not in self.algorithms["feature_extractors"]):
             raise UnsupportedBackendError("Feature detector %s is not among the supported"
                                           "ones %s" % (detect, self.algorithms[self.categories["fdetect"]]))
+        self.synchronize_backend(category="fdetect")
+        self.synchronize_backend(category="fextract")
 
-        # reduce keypoint coordinates to the original image size
-        for nkeypoint in nkeypoints:
-            nkeypoint.pt = (int(nkeypoint.pt[0] / nfactor),
-                            int(nkeypoint.pt[1] / nfactor))
-        for hkeypoint in hkeypoints:
-            hkeypoint.pt = (int(hkeypoint.pt[0] / hfactor),
-                            int(hkeypoint.pt[1] / hfactor))
+        nkeypoints, ndescriptors = self._extract_features(ngray, nfactor, self._cache,
+                                                          self._cache_size)
+        hkeypoints, hdescriptors = self._extract_features(hgray, hfactor, self._frame_cache,
+                                                          self._frame_cache_size)
 
         log.debug("Detected %s keypoints in needle and %s in haystack",
                   len(nkeypoints), len(hkeypoints))
-        hkp_locations = [hkp.pt for hkp in hkeypoints]
-        self._log_features(10, hkp_locations, self.imglog.hotmaps[-4], 3, 255, 0, 0)
+        self._log_features(10, hkeypoints, self.imglog.hotmaps[-4], 3, 255, 0, 0)
 
         return (nkeypoints, ndescriptors, hkeypoints, hdescriptors)
 
+    def _extract_features(self, gray, factor, cache, cache_size=0):
+        """
+        EXTRA DOCSTRING: Feature matching backend - cached detection/extraction.
+
+        :param gray: grayscale image to detect features in
+        :type gray: :py:class:`numpy.ndarray`
+        :param float factor: zoom factor to apply before detection
+        :param cache: features cached by image content and configuration
+        :type cache: :py:class:`collections.OrderedDict`
+        :param int cache_size: maximal number of cached images or zero for no limit
+        :returns: keypoint locations in original image coordinates as an Nx2
+                  array and their descriptors
+        :rtype: (:py:class:`numpy.ndarray`, :py:class:`numpy.ndarray`)
+        """
+        import cv2
+        import hashlib
+        import numpy
+        image_id = (hashlib.sha1(numpy.ascontiguousarray(gray)).hexdigest(), gray.shape,
+                    self._synchronized["fdetect"], self._synchronized["fextract"])
+        with self._cache_lock:
+            if image_id in cache:
+                log.log(9, "Reusing cached image features")
+                cache.move_to_end(image_id)
+                return cache[image_id]
+
+        # zoom in if explicitly set
+        if factor > 1.0:
+            log.debug("Zooming x%i image", factor)
+            gray = cv2.resize(gray, None, fx=factor, fy=factor)
+        # keypoints and feature vectors (descriptors)
+        keypoints = self.detector.detect(gray)
+        (keypoints, descriptors) = self.extractor.compute(gray, keypoints)
+        # reduce keypoint coordinates to the original image size
+        keypoints = numpy.asarray(cv2.KeyPoint_convert(keypoints), dtype=numpy.float64)
+        keypoints = numpy.trunc(keypoints.reshape(-1, 2) / factor).astype(numpy.float32)
+
+        with self._cache_lock:
+            cache[image_id] = (keypoints, descriptors)
+            while cache_size > 0 and len(cache) > cache_size:
+                cache.popitem(last=False)
+        return keypoints, descriptors
+
     def _match_features(self, nkeypoints, ndescriptors,
-                        hkeypoints, hdescriptors, match):
+                        hkeypoints, hdescriptors, match, max_instances=1):
         """
         EXTRA DOCSTRING: Feature matching backend - matching stage (2).
 
-        Match two sets of keypoints based on their descriptors.
+        Match two sets of keypoints based on their descriptors. Each needle
+        keypoint is matched to as many haystack keypoints as the maximal
+        number of needle instances unless a ratio test is performed which
+        by definition rejects matches with more than one good candidate.
+        The matched needle keypoints are returned along with their indices
+        since distinct needle features may share the same location.
         """
         def ratio_test(matches):
             """
@@ -1472,18 +1938,15 @@ class FeatureFinder(Finder):
             Therefore these matches are ignored and thus only matches of
             greater probabilty are returned.
             """
-            matches2 = []
-            for m in matches:
-
-                if len(m) > 1:
-                    # smooth to make 0/0 case also defined as 1.0
-                    smooth_dist1 = m[0].distance + 0.0000001
-                    smooth_dist2 = m[1].distance + 0.0000001
-
-                    if smooth_dist1 / smooth_dist2 < self.params["fmatch"]["ratioThreshold"].value:
-                        matches2.append(m[0])
-                else:
-                    matches2.append(m[0])
+            import numpy
+            # unambiguous matches without a second best candidate are always kept
+            distances = numpy.array([(m[0].distance, m[1].distance) if len(m) > 1
+                                     else (0.0, 1.0) for m in matches], dtype=numpy.float64)
+            distances = distances.reshape(-1, 2)
+            # smooth to make 0/0 case also defined as 1.0
+            ratios = (distances[:, 0] + 0.0000001) / (distances[:, 1] + 0.0000001)
+            selected = numpy.flatnonzero(ratios < self.params["fmatch"]["ratioThreshold"].value)
+            matches2 = [matches[i][0] for i in selected]
 
             log.log(9, "Ratio test result is %i/%i", len(matches2), len(matches))
             return matches2
@@ -1496,17 +1959,15 @@ class FeatureFinder(Finder):
             matching of each other to ensure the error by accepting the
             match is not too large.
             """
-            import cv2
-            matches2 = []
-            for nm in nmatches:
-                for hm in hmatches:
-
-                    if nm.queryIdx == hm.trainIdx and nm.trainIdx == hm.queryIdx:
-                        m = cv2.DMatch(nm.queryIdx, nm.trainIdx, nm.distance)
-                        matches2.append(m)
-                        break
-
-            log.log(9, "Symmetry test result is %i/%i", len(matches2), len(matches))
+            import numpy
+            # encode each (needle, haystack) keypoint index pair as a single integer
+            stride = len(hkeypoints) + 1
+            nkeys = numpy.array([m.queryIdx * stride + m.trainIdx for m in nmatches], dtype=numpy.int64)
+            hkeys = numpy.array([m.trainIdx * stride + m.queryIdx for m in hmatches], dtype=numpy.int64)
+            selected = numpy.flatnonzero(numpy.isin(nkeys, hkeys))
+            matches2 = [nmatches[i] for i in selected]
+
+            log.log(9, "Symmetry test result is %i/%i", len(matches2), len(nmatches))
             return matches2
 
         # include only methods tested for compatibility
@@ -1530,8 +1991,8 @@ class FeatureFinder(Finder):
                 matches = self.matcher.knnMatch(ndescriptors, hdescriptors, 2)
                 matches = ratio_test(matches)
             else:
-                matches = self.matcher.knnMatch(ndescriptors, hdescriptors, 1)
-                matches = [m[0] for m in matches]
+                matches = self.matcher.knnMatch(ndescriptors, hdescriptors, max_instances)
+                matches = [m for nmatches in matches for m in nmatches]
             if self.params["fmatch"]["symmetryTest"].value:
                 if self.params["fmatch"]["ratioTest"].value:
                     hmatches = self.matcher.knnMatch(hdescriptors, ndescriptors, 2)
@@ -1542,28 +2003,25 @@ class FeatureFinder(Finder):
                 matches = symmetry_test(matches, hmatches)
 
         # prepare final matches
-        match_nkeypoints = []
-        match_hkeypoints = []
+        import numpy
         matches = sorted(matches, key=lambda x: x.distance)
-        for match in matches:
-            log.log(9, match.distance)
-            match_nkeypoints.append(nkeypoints[match.queryIdx])
-            match_hkeypoints.append(hkeypoints[match.trainIdx])
+        indices = numpy.array([(m.queryIdx, m.trainIdx) for m in matches], dtype=int).reshape(-1, 2)
+        match_nkeypoints = nkeypoints[indices[:, 0]]
+        match_hkeypoints = hkeypoints[indices[:, 1]]
 
         # these matches are half the way to being good
-        mhkp_locations = [mhkp.pt for mhkp in match_hkeypoints]
-        self._log_features(10, mhkp_locations, self.imglog.hotmaps[-3], 2, 255, 255, 0)
+        self._log_features(10, match_hkeypoints, self.imglog.hotmaps[-3], 2, 255, 255, 0)
 
-        match_similarity = float(len(match_nkeypoints)) / float(len(nkeypoints))
+        match_similarity = float(len(numpy.unique(indices[:, 0]))) / float(len(nkeypoints))
         # update the current achieved similarity if matching similarity is used:
         # won't be updated anymore if self.params["feature"]["similarityRatio"].value == 0
         self.imglog.similarities[-1] = match_similarity
         log.log(9, "%s\\%s -> %f", len(match_nkeypoints),
                 len(nkeypoints), match_similarity)
 
-        return (match_nkeypoints, match_hkeypoints)
+        return (match_nkeypoints, match_hkeypoints, indices[:, 0])
 
-    def _project_locations(self, locations_in_needle, mnkp, mhkp):
+    def _project_locations(self, locations_in_needle, mnkp, mhkp, nmatched=None):
         """
         EXTRA DOCSTRING: Feature matching backend - projecting stage (3).
 
@@ -1573,9 +2031,13 @@ class FeatureFinder(Finder):
 
         In particular, take the locations in the need as (x,y) tuples
         for each point, the matched needle keypoints, and the matched
-        haystack keypoints and return a list of (x,y) tuples of the
-        respective locations in the haystack. Also, set the final
-        similarity and returned location in the hotmap.
+        haystack keypoints (as Nx2 location arrays) and return a list of
+        (x,y) tuples of the respective locations in the haystack together
+        with a mask of the matches that are inliers of the projection.
+        Also, set the final similarity and returned location in the hotmap.
+
+        The projection similarity is measured against the number of
+        matched needle features if given or against all matches otherwise.
 
         .. warning:: The returned location is always the projected
             point at (0,0) needle coordinates as in template matching,
@@ -1591,14 +2053,11 @@ class FeatureFinder(Finder):
         # homography and fundamental matrix as options - homography is considered only
         # for rotation but currently gives better results than the fundamental matrix
         if self.params["feature"]["projectionMethod"].value == 0:
-            H, mask = cv2.findHomography(numpy.array([kp.pt for kp in mnkp]),
-                                         numpy.array([kp.pt for kp in mhkp]), cv2.RANSAC,
+            H, mask = cv2.findHomography(mnkp, mhkp, cv2.RANSAC,
                                          self.params["feature"]["ransacReprojThreshold"].value)
         elif self.params["feature"]["projectionMethod"].value == 1:
-            H, mask = cv2.findFundamentalMat(numpy.array([kp.pt for kp in mnkp]),
-                                             numpy.array([kp.pt for kp in mhkp]),
-                                             method=cv2.RANSAC, param1=10.0,
-                                             param2=0.9)
+            H, mask = cv2.findFundamentalMat(mnkp, mhkp, method=cv2.RANSAC,
+                                             param1=10.0, param2=0.9)
         else:
             raise ValueError("Unsupported projection method - use 0 for homography and "
                              "1 for fundamentlal matrix")
@@ -1607,33 +2066,26 @@ class FeatureFinder(Finder):
         if H is None or mask is None:
             log.log(30, "Homography error occurred during feature matching")
             self.imglog.similarities[-1] = 0.0
-            return []
-        true_matches = []
-        for i, kp in enumerate(mhkp):
-            # true matches are also inliers for the homography
-            if mask[i][0] == 1:
-                true_matches.append(kp)
-        tmhkp_locations = [tmhkp.pt for tmhkp in true_matches]
-        self._log_features(20, tmhkp_locations, self.imglog.hotmaps[-2], 1, 0, 255, 0)
-
-        # calculate and project all point coordinates in the needle
-        projected = []
-        for location in locations_in_needle:
-            (ox, oy) = (location[0], location[1])
-            orig_center_wrapped = numpy.array([[[ox, oy]]], dtype=numpy.float32)
-            log.log(9, "%s %s", orig_center_wrapped.shape, H.shape)
-            match_center_wrapped = cv2.perspectiveTransform(orig_center_wrapped, H)
-            (mx, my) = (match_center_wrapped[0][0][0], match_center_wrapped[0][0][1])
-            projected.append((int(mx), int(my)))
-
-        ransac_similarity = float(len(true_matches)) / float(len(mnkp))
+            return [], numpy.zeros(len(mhkp), dtype=bool)
+        # true matches are also inliers for the homography
+        inliers = mask.ravel() == 1
+        true_matches = mhkp[inliers]
+        self._log_features(20, true_matches, self.imglog.hotmaps[-2], 1, 0, 255, 0)
+
+        # calculate and project all point coordinates in the needle at once
+        locations = numpy.array([locations_in_needle], dtype=numpy.float32).reshape(1, -1, 2)
+        projected = cv2.perspectiveTransform(locations, H)[0]
+        projected = [(int(mx), int(my)) for mx, my in projected]
+
+        nmatched = len(mnkp) if nmatched is None else nmatched
+        ransac_similarity = min(1.0, float(len(true_matches)) / float(nmatched))
         if self.params["feature"]["similarityRatio"].value == 1:
             # override the match similarity if projectin-based similarity is preferred
             self.imglog.similarities[-1] = ransac_similarity
-        log.log(9, "%s\\%s -> %f", len(true_matches), len(mnkp), ransac_similarity)
+        log.log(9, "%s\\%s -> %f", len(true_matches), nmatched, ransac_similarity)
         self.imglog.locations.extend(projected)
 
-        return projected
+        return projected, inliers
 
     def log(self, lvl):
         """
@@ -1692,6 +2144,10 @@ class CascadeFinder(Finder):
     due to the cascade classifier API.
     """
 
+    _cache = collections.OrderedDict()
+    _cache_size = 16
+    _cache_lock = threading.Lock()
+
     def __init__(self, classifier_datapath=".", configure=True, synchronize=True):
         """Build a CV backend using OpenCV's cascade matching options."""
         super(CascadeFinder, self).__init__(configure=False, synchronize=False)
@@ -1737,41 +2193,93 @@ class CascadeFinder(Finder):
 
         See base method for details.
         """
-        needle.match_settings = self
-        needle.use_own_settings = True
-        self.imglog.needle = needle
-        self.imglog.haystack = haystack
-        self.imglog.dump_matched_images()
+        return self.find_batch([needle], haystack)[0]
+
+    def find_batch(self, needles, haystack):
+        """
+        Custom implementation of the base method.
+
+        :param needles: target patterns (cascades) to search for
+        :type needles: [:py:class:`Pattern`]
 
+        See base method for details.
+
+        All cascades are loaded before any detection and are run over the
+        same grayscale haystack with the same detection settings.
+        """
         import cv2
-        import numpy
-        needle_cascade = cv2.CascadeClassifier(needle.data_file)
-        if needle_cascade.empty():
-            raise Exception("Could not load the cascade classifier properly")
-        gray_haystack = cv2.cvtColor(numpy.array(haystack.pil_image), cv2.COLOR_RGB2GRAY)
-        canvas = numpy.array(haystack.pil_image)
+        cascades = [self._load_cascade(needle.data_file) for needle in needles]
+        gray_haystack = haystack.gray_image
+        detect_args = (self.params["cascade"]["scaleFactor"].value,
+                       self.params["cascade"]["minNeighbors"].value,
+                       0,
+                       (self.params["cascade"]["minWidth"].value,
+                        self.params["cascade"]["minHeight"].value),
+                       (self.params["cascade"]["maxWidth"].value,
+                        self.params["cascade"]["maxHeight"].value))
 
         from .match import Match
-        matches = []
-        rects = needle_cascade.detectMultiScale(gray_haystack,
-                                                self.params["cascade"]["scaleFactor"].value,
-                                                self.params["cascade"]["minNeighbors"].value,
-                                                0,
-                                                (self.params["cascade"]["minWidth"].value,
-                                                 self.params["cascade"]["minHeight"].value),
-                                                (self.params["cascade"]["maxWidth"].value,
-                                                 self.params["cascade"]["maxHeight"].value))
-        for (x, y, w, h) in rects:
-            cv2.rectangle(canvas, (x, y), (x+w, y+h), (0, 0, 0), 2)
-            cv2.rectangle(canvas, (x, y), (x+w, y+h), (255, 0, 0), 1)
-            dx, dy = needle.center_offset.x, needle.center_offset.y
-            matches.append(Match(x, y, w, h, dx, dy))
+        batch_matches = []
+        for needle, (needle_cascade, cascade_lock) in zip(needles, cascades):
+            needle.match_settings = self
+            needle.use_own_settings = True
+            self.imglog.needle = needle
+            self.imglog.haystack = haystack
+            self.imglog.dump_matched_images()
+            canvas = haystack.numpy_image.copy()
 
-        self.imglog.similarities.append(self.params["find"]["similarity"].value)
-        self.imglog.locations = [(loc.x, loc.y) for loc in matches]
-        self.imglog.hotmaps.append(canvas)
-        self.imglog.log(30)
-        return matches
+            matches = []
+            with cascade_lock:
+                rects = needle_cascade.detectMultiScale(gray_haystack, *detect_args)
+            for (x, y, w, h) in rects:
+                cv2.rectangle(canvas, (x, y), (x+w, y+h), (0, 0, 0), 2)
+                cv2.rectangle(canvas, (x, y), (x+w, y+h), (255, 0, 0), 1)
+                dx, dy = needle.center_offset.x, needle.center_offset.y
+                matches.append(Match(x, y, w, h, dx, dy))
+
+            self.imglog.similarities.append(self.params["find"]["similarity"].value)
+            self.imglog.locations = [(loc.x, loc.y) for loc in matches]
+            self.imglog.hotmaps.append(canvas)
+            self.imglog.log(30)
+            batch_matches.append(matches)
+        return batch_matches
+
+    def _load_cascade(self, data_file):
+        """
+        EXTRA DOCSTRING: Cascade matching backend - cached cascade classifier.
+
+        Parsing a cascade from its file is costly compared to a detection
+        so the last few loaded classifiers are reused as long as their file
+        remains unmodified.
+
+        :param str data_file: file of the cascade to load
+        :returns: cascade classifier and a lock to use it by one thread at a time
+        :rtype: (:py:class:`cv2.CascadeClassifier`, :py:class:`threading.Lock`)
+        :raises: :py:class:`Exception` if the cascade could not be loaded
+        """
+        import cv2
+        try:
+            stat = os.stat(data_file)
+            cascade_id = (os.path.abspath(data_file), stat.st_mtime_ns, stat.st_size)
+        except (OSError, TypeError):
+            cascade_id = None
+        with self._cache_lock:
+            if cascade_id is not None and cascade_id in self._cache:
+                log.log(9, "Reusing cached cascade classifier")
+                self._cache.move_to_end(cascade_id)
+                return self._cache[cascade_id]
+
+        needle_cascade = cv2.CascadeClassifier(data_file)
+        if needle_cascade.empty():
+            raise Exception("Could not load the cascade classifier properly")
+        cascade = (needle_cascade, threading.Lock())
+        if cascade_id is None:
+            return cascade
+        with self._cache_lock:
+            self._cache[cascade_id] = cascade
+            if self._cache_size > 0 and len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return cascade
 
 
 class TextFinder(ContourFinder):
@@ -1788,6 +2296,9 @@ class TextFinder(ContourFinder):
     Neumann L., Matas J.: Real-Time Scene Text Localization and Recognition, CVPR 2012
     """
 
+    _frame_cache = collections.OrderedDict()
+    _frame_cache_size = 8
+
     def __init__(self, configure=True, synchronize=True):
         """Build a CV backend using OpenCV's text matching options."""
         super(TextFinder, self).__init__(configure=False, synchronize=False)
@@ -1810,6 +2321,9 @@ class TextFinder(ContourFinder):
         self.erc2 = None
         self.erf2 = None
         self.ocr = None
+        self._ocr_instances = []
+        self._ocr_lock = threading.Lock()
+        self._east_buffers = None
 
         # additional preparation
         if configure:
@@ -1864,6 +2378,8 @@ class TextFinder(ContourFinder):
                 self.params[category]["input_res_x"] = CVParameter(320, 32, None, 32.0)
                 self.params[category]["input_res_y"] = CVParameter(320, 32, None, 32.0)
                 self.params[category]["min_box_confidence"] = CVParameter(0.8, 0.0, 1.0, 0.1)
+                # maximal overlap (intersection over union) of two final text regions
+                self.params[category]["nms_threshold"] = CVParameter(0.4, 0.0, 1.0, 0.1)
             elif backend == "erstat":
                 self.params[category]["thresholdDelta"] = CVParameter(1, 1, 255, 50.0)
                 self.params[category]["minArea"] = CVParameter(0.00025, 0.0, 1.0, 0.25, 0.001)
@@ -1901,6 +2417,11 @@ class TextFinder(ContourFinder):
                 self.params[category]["psmode"] = CVParameter(3, 0, 13, enumerated=True)
                 if backend == "pytesseract":
                     self.params[category]["extra_configs"] = CVParameter("")
+                    # recognize all text regions with a single tesseract process
+                    # by tiling them on one page instead of one process per region
+                    # (only for page segmentation modes and with possibly different
+                    # whitespace in the recognized text)
+                    self.params[category]["batch_regions"] = CVParameter(False)
                     # TODO: there could be a decent way to change component modes
                     self.params[category]["component_level"] = CVParameter(1, 1, 1, enumerated=True)
                 elif backend == "tesserocr":
@@ -1922,6 +2443,8 @@ class TextFinder(ContourFinder):
                 # perform custom image thresholding if set to true or leave it to the OCR
                 self.params[category]["binarize_text"] = CVParameter(True)
             self.params[category]["min_confidence"] = CVParameter(0, 0, 100, 25.0)
+            # number of concurrent OCR workers or 0 for one worker per CPU
+            self.params[category]["workers"] = CVParameter(0, 0, None)
             # zoom factor for improved OCR processing due to higher resolution
             self.params[category]["zoom_factor"] = CVParameter(1.0, 1.0, 100.0, 25.0)
             # border size to wrap around text field to improve recognition rate
@@ -2027,12 +2550,11 @@ class TextFinder(ContourFinder):
                 self.ocr_config %= (self.params["ocr"]["char_whitelist"].value,
                                     self.params["ocr"]["extra_configs"].value)
             elif backend == "tesserocr":
-                from tesserocr import PyTessBaseAPI
-                self.ocr = PyTessBaseAPI(path=tessdata_path,
-                                         lang=self.params["ocr"]["language"].value,
-                                         oem=self.params["ocr"]["oem"].value,
-                                         psm=self.params["ocr"]["psmode"].value)
-                self.ocr.SetVariable("tessedit_char_whitelist", self.params["ocr"]["char_whitelist"].value)
+                self._tessdata_path = tessdata_path
+                self.ocr = self._create_tesserocr()
+                # idle API instances for concurrent recognition starting with the main one
+                with self._ocr_lock:
+                    self._ocr_instances = [self.ocr]
             elif backend == "tesseract":
                 self.ocr = cv2.text.OCRTesseract_create(tessdata_path,
                                                         language=self.params["ocr"]["language"].value,
@@ -2124,12 +2646,81 @@ class TextFinder(ContourFinder):
         self.imglog.dump_matched_images()
 
         import cv2
-        import numpy
         text_needle = needle.value
-        img_haystack = numpy.array(haystack.pil_image)
-        final_hotmap = numpy.array(haystack.pil_image)
+        final_hotmap = haystack.numpy_image.copy()
+
+        # detect and recognize text once per screen for any number of needles
+        text_regions, text_images, outputs, index = self._read_text(haystack)
+        similarity_required = self.params["find"]["similarity"].value
+        # similarities of all regions are needed only for image logging
+        if self.imglog.logging_level <= 30:
+            scored = list(range(len(outputs)))
+            similarities = needle.similarities_to(outputs)
+        else:
+            scored = self._lookup_text(text_needle, outputs, index, similarity_required)
+            similarities = needle.similarities_to([outputs[i] for i in scored], similarity_required)
+
+        from .match import Match
+        matches = []
+        for i, similarity in zip(scored, similarities):
+            text_box, text_img, output = text_regions[i], text_images[i], outputs[i]
+            self.imglog.hotmaps.append(text_img)
+            log.debug("OCR output %s = '%s'", i+1, output)
+            log.debug("Similarity = '%s'", similarity)
+            self.imglog.similarities.append(similarity)
+            if similarity >= similarity_required:
+                log.debug("Text at (%s, %s) is acceptable", text_box[0], text_box[1])
+                self.imglog.locations.append((text_box[0], text_box[1]))
+                x, y, w, h = text_box
+                dx, dy = needle.center_offset.x, needle.center_offset.y
+                cv2.rectangle(final_hotmap, (x, y), (x+w, y+h), (0, 0, 0), 2)
+                cv2.rectangle(final_hotmap, (x, y), (x+w, y+h), (255, 255, 255), 1)
+                matches.append(Match(x, y, w, h, dx, dy, similarity))
+        matches = sorted(matches, key=lambda x: x.similarity, reverse=True)
+
+        self.imglog.hotmaps.append(final_hotmap)
+        self.imglog.log(30)
+        return matches
+
+    def _read_text(self, haystack):
+        """
+        EXTRA DOCSTRING: Text matching backend - cached text detection and recognition.
+
+        Detect and recognize all text in the haystack or reuse the results
+        from a previous search on a haystack with identical content and
+        identical text matching configuration. The results of the last few
+        haystacks are kept together with an index of the recognized text so
+        that multiple text needles on the same screen require only a single
+        detection and recognition pass.
+
+        :param haystack: image to read the text from
+        :type haystack: :py:class:`Image`
+        :returns: detected text regions, their preprocessed images, their
+                  recognized text, and an index of the recognized text
+        :rtype: ([(int, int, int, int)], [:py:class:`numpy.ndarray`], [str],
+                 {str: {int: int}})
+        """
+        import hashlib
+        import numpy
+        img_haystack = haystack.numpy_image
+        signature = tuple((category, key, value.value if isinstance(value, CVParameter) else value)
+                          for category in sorted(self.params.keys()) if category != "find"
+                          for key, value in sorted(self.params[category].items()))
+        frame_id = (hashlib.sha1(numpy.ascontiguousarray(img_haystack)).hexdigest(),
+                    img_haystack.shape, signature)
+        with self._cache_lock:
+            # entries cached without logging have no hotmaps to log now
+            if frame_id in self._frame_cache and (self._frame_cache[frame_id][4] is not None
+                                                  or self.imglog.logging_level > 30):
+                log.debug("Reusing text read from an identical haystack")
+                self._frame_cache.move_to_end(frame_id)
+                text_regions, text_images, outputs, index, hotmaps = self._frame_cache[frame_id]
+                if hotmaps is not None:
+                    self.imglog.hotmaps.extend(hotmaps)
+                return text_regions, text_images, outputs, index
 
         # detect characters and group them into detected text
+        logged_hotmaps = len(self.imglog.hotmaps)
         backend = self.params["tdetect"]["backend"]
         log.debug("Detecting text with %s", backend)
         if backend == "east":
@@ -2142,115 +2733,325 @@ class TextFinder(ContourFinder):
             text_regions = self._detect_text_components(haystack)
         else:
             raise UnsupportedBackendError("Unsupported text detection backend %s" % backend)
+        # full-frame hotmaps are kept only if they could be logged
+        if self.imglog.logging_level <= 30:
+            hotmaps = self.imglog.hotmaps[logged_hotmaps:]
+        else:
+            hotmaps = None
 
         # perform optical character recognition on the final regions
         backend = self.params["ocr"]["backend"]
         log.debug("Recognizing text with %s", backend)
-        from .match import Match
-        matches = []
-        def binarize_step(threshold, text_img):
-            if self.params["ocr"]["binarize_text"].value:
-                first_threshold = self.params["threshold"]
-                self.params["threshold"] = self.params[threshold]
+        text_images, outputs = self._recognize_text(img_haystack, text_regions)
+        if self.params["ocr"]["component_level"].value == 1:
+            # strip of the new line character which is never useful
+            outputs = [output.rstrip() for output in outputs]
+        index = self._index_text(outputs)
+
+        with self._cache_lock:
+            self._frame_cache[frame_id] = (text_regions, text_images, outputs, index, hotmaps)
+            if len(self._frame_cache) > self._frame_cache_size:
+                self._frame_cache.popitem(last=False)
+        return text_regions, text_images, outputs, index
+
+    def _index_text(self, outputs, gram_size=2):
+        """
+        EXTRA DOCSTRING: Text matching backend - index of recognized text.
+
+        :param outputs: recognized text of all text regions
+        :type outputs: [str]
+        :param int gram_size: length of the substrings (q-grams) to index by
+        :returns: number of occurrences of each q-gram in each text region
+        :rtype: {str: {int: int}}
+        """
+        index = {}
+        for i, output in enumerate(outputs):
+            grams = collections.Counter(output[j:j+gram_size] for j in range(len(output) - gram_size + 1))
+            for gram, count in grams.items():
+                index.setdefault(gram, {})[i] = count
+        return index
+
+    def _lookup_text(self, text, outputs, index, similarity, gram_size=2):
+        """
+        EXTRA DOCSTRING: Text matching backend - lookup in the recognized text index.
+
+        Select only the text regions that could be similar enough to the
+        searched text using the q-gram lemma, i.e. two strings within edit
+        distance k share at least max(m, n) - q + 1 - k * q of their q-grams.
+        The remaining regions are guaranteed to be less similar than required.
+
+        :param str text: text to look up
+        :param outputs: recognized text of all text regions
+        :type outputs: [str]
+        :param index: index of the recognized text by q-grams
+        :type index: {str: {int: int}}
+        :param float similarity: minimal required similarity
+        :param int gram_size: length of the indexed substrings (q-grams)
+        :returns: indices of the candidate text regions
+        :rtype: [int]
+        """
+        import math
+        grams = collections.Counter(text[j:j+gram_size] for j in range(len(text) - gram_size + 1))
+        shared = collections.Counter()
+        for gram, count in grams.items():
+            for i, output_count in index.get(gram, {}).items():
+                shared[i] += min(count, output_count)
+
+        candidates = []
+        for i, output in enumerate(outputs):
+            length = max(len(output), len(text))
+            # round up the allowed distance to stay on the safe side
+            max_distance = math.ceil((1.0 - similarity) * length)
+            if abs(len(output) - len(text)) > max_distance:
+                continue
+            if shared[i] < length - gram_size + 1 - max_distance * gram_size:
+                continue
+            candidates.append(i)
+        return candidates
+
+    def _recognize_text(self, img_haystack, text_regions):
+        """
+        EXTRA DOCSTRING: Text matching backend - concurrent OCR stage.
+
+        Preprocess and recognize all detected text regions in a pool of
+        workers. The Tesseract backends recognize the text within the workers
+        (one tesseract process per region for pytesseract and one API instance
+        per worker for tesserocr) while the OpenCV backends recognize the
+        preprocessed regions one by one with output streams redirected only
+        once for all of them. If batching is enabled for pytesseract and the
+        page segmentation mode can segment a page into lines, the preprocessed
+        regions are instead tiled on a single page and recognized by a single
+        tesseract process. Block, line, word, and character modes would merge
+        or misread the tiles so they always recognize each region separately.
+
+        :param img_haystack: image to crop the text regions from
+        :type img_haystack: :py:class:`numpy.ndarray`
+        :param text_regions: detected text regions as (x, y, width, height)
+        :type text_regions: [(int, int, int, int)]
+        :returns: preprocessed image and recognized text for each region
+        :rtype: ([:py:class:`numpy.ndarray`], [str])
+        """
+        backend = self.params["ocr"]["backend"]
+        # BUG: we hit segfault when using the BeamSearch OCR backend so disallow it
+        if backend == "beamSearch" and len(text_regions) > 0:
+            raise NotImplementedError("Current version of BeamSearch segfaults so it's not yet available")
+
+        # automatic (with or without orientation detection), single column, and sparse text
+        page_modes = (1, 3, 4, 11, 12)
+        batched = (backend == "pytesseract" and len(text_regions) > 1
+                   and self.params["ocr"]["batch_regions"].value
+                   and self.params["ocr"]["psmode"].value in page_modes)
+
+        def recognize(text_box):
+            text_img = self._preprocess_text(img_haystack, text_box)
+            if backend in ["pytesseract", "tesserocr"] and not batched:
+                return text_img, self._recognize_text_tesseract(text_img)
+            return text_img, None
+
+        workers = self.params["ocr"]["workers"].value or os.cpu_count() or 1
+        workers = min(workers, len(text_regions))
+        if workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(recognize, text_regions))
+        else:
+            results = [recognize(text_box) for text_box in text_regions]
+        text_images = [text_img for text_img, _ in results]
+        outputs = [output for _, output in results]
+        if batched:
+            page, tiles = self._tile_text_images(text_images)
+            logging.debug("Running pytesseract on %s tiled regions with extra command line %s",
+                          len(tiles), self.ocr_config)
+            data = self.ocr.image_to_data(page, lang=self.params["ocr"]["language"].value,
+                                          config=self.ocr_config, output_type=self.ocr.Output.DICT)
+            return text_images, self._split_tiled_text(data, tiles)
+        if backend in ["pytesseract", "tesserocr"] or len(text_regions) == 0:
+            return text_images, outputs
+
+        # TODO: we can do this now with pytesseract/tesserocr but have to evaluate its usefulness
+        #vector<Rect> boxes;
+        #vector<string> words;
+        #vector<float> confidences;
+        #output = ocr.run(group_img, &boxes, &words, &confidences, cv2.text.OCR_LEVEL_WORD)
+        # redirection of tesseract's streams can only be done on the file descriptor level
+        # sys.stdout = open(os.devnull, 'w')
+        stdout_fd = sys.stdout.fileno() if hasattr(sys.stdout, "fileno") else 1
+        stderr_fd = sys.stderr.fileno() if hasattr(sys.stderr, "fileno") else 2
+        null_fo = open(os.devnull, 'wb')
+        with os.fdopen(os.dup(stdout_fd), 'wb') as cpout_fo:
+            with os.fdopen(os.dup(stderr_fd), 'wb') as cperr_fo:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os.dup2(null_fo.fileno(), stdout_fd)
+                os.dup2(null_fo.fileno(), stderr_fd)
                 try:
-                    text_img = self._binarize_image(text_img)
+                    outputs = [self.ocr.run(text_img, text_img,
+                                            self.params["ocr"]["min_confidence"].value,
+                                            self.params["ocr"]["component_level"].value)
+                               for text_img in text_images]
                 finally:
-                    self.params["threshold"] = first_threshold
-                return text_img
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    os.dup2(cpout_fo.fileno(), stdout_fd)
+                    os.dup2(cperr_fo.fileno(), stderr_fd)
+        null_fo.close()
+        return text_images, outputs
+
+    def _preprocess_text(self, img_haystack, text_box):
+        """
+        EXTRA DOCSTRING: Text matching backend - OCR preprocessing of a text region.
+
+        :param img_haystack: image to crop the text region from
+        :type img_haystack: :py:class:`numpy.ndarray`
+        :param text_box: detected text region as (x, y, width, height)
+        :type text_box: (int, int, int, int)
+        :returns: text region image prepared for recognition
+        :rtype: :py:class:`numpy.ndarray`
+        """
+        import cv2
+        import numpy
+
+        def binarize_step(threshold, text_img):
+            if self.params["ocr"]["binarize_text"].value:
+                return self._binarize_image(text_img, category=threshold)
             else:
                 return cv2.cvtColor(text_img, cv2.COLOR_RGB2GRAY)
-        for i, text_box in enumerate(text_regions):
-
-            # main OCR preprocessing stage
-            border = self.params["ocr"]["border_size"].value
-            text_img = img_haystack[max(text_box[1]-border, 0):min(text_box[1]+text_box[3]+border, img_haystack.shape[0]),
-                                    max(text_box[0]-border, 0):min(text_box[0]+text_box[2]+border, img_haystack.shape[1])]
-            factor = self.params["ocr"]["zoom_factor"].value
-            log.debug("Zooming x%i candidate for improved OCR processing", factor)
-            text_img = cv2.resize(text_img, None, fx=factor, fy=factor)
-            text_img = binarize_step("threshold2", text_img)
-            if self.params["ocr"]["distance_transform"].value:
-                text_img = cv2.distanceTransform(text_img,
-                                                 self.params["ocr"]["dt_distance_type"].value,
-                                                 self.params["ocr"]["dt_mask_size"].value)
-                text_img = cv2.cvtColor(numpy.asarray(text_img, dtype='uint8'), cv2.COLOR_GRAY2RGB)
-                text_img = binarize_step("threshold3", text_img)
-            if self.params["ocr"]["erode_dilate"].value < 3:
-                element = cv2.getStructuringElement(self.params["ocr"]["ed_kernel_type"].value,
-                                                    (self.params["ocr"]["ed_kernel_width"].value,
-                                                     self.params["ocr"]["ed_kernel_height"].value))
-                if self.params["ocr"]["erode_dilate"].value in [0, 2]:
-                    text_img = cv2.erode(text_img, element)
-                if self.params["ocr"]["erode_dilate"].value in [1, 2]:
-                    text_img = cv2.dilate(text_img, element)
-            self.imglog.hotmaps.append(text_img)
 
-            # BUG: we hit segfault when using the BeamSearch OCR backend so disallow it
-            if backend == "beamSearch":
-                raise NotImplementedError("Current version of BeamSearch segfaults so it's not yet available")
-            # TODO: we can do this now with pytesseract/tesserocr but have to evaluate its usefulness
-            #vector<Rect> boxes;
-            #vector<string> words;
-            #vector<float> confidences;
-            #output = ocr.run(group_img, &boxes, &words, &confidences, cv2.text.OCR_LEVEL_WORD)
-            # redirection of tesseract's streams can only be done on the file descriptor level
-            # sys.stdout = open(os.devnull, 'w')
-            if backend == "pytesseract":
-                output = self.ocr.image_to_string(text_img,
-                                                  lang=self.params["ocr"]["language"].value,
-                                                  config=self.ocr_config)
-                logging.debug("Running pytesseract with extra command line %s", self.ocr_config)
-            elif backend == "tesserocr":
-                self.ocr.SetImage(PIL.Image.fromarray(text_img))
-                output = self.ocr.GetUTF8Text()
-            else:
-                stdout_fd = sys.stdout.fileno() if hasattr(sys.stdout, "fileno") else 1
-                stderr_fd = sys.stderr.fileno() if hasattr(sys.stderr, "fileno") else 2
-                null_fo = open(os.devnull, 'wb')
-                with os.fdopen(os.dup(stdout_fd), 'wb') as cpout_fo:
-                    with os.fdopen(os.dup(stderr_fd), 'wb') as cperr_fo:
-                        sys.stdout.flush()
-                        sys.stderr.flush()
-                        os.dup2(null_fo.fileno(), stdout_fd)
-                        os.dup2(null_fo.fileno(), stderr_fd)
-                        output = self.ocr.run(text_img, text_img,
-                                              self.params["ocr"]["min_confidence"].value,
-                                              self.params["ocr"]["component_level"].value)
-                        sys.stdout.flush()
-                        sys.stderr.flush()
-                        os.dup2(cpout_fo.fileno(), stdout_fd)
-                        os.dup2(cperr_fo.fileno(), stderr_fd)
-                null_fo.close()
-            if self.params["ocr"]["component_level"].value == 1:
-                # strip of the new line character which is never useful
-                output = output.rstrip()
-            log.debug("OCR output %s = '%s'", i+1, output)
+        # main OCR preprocessing stage
+        border = self.params["ocr"]["border_size"].value
+        text_img = img_haystack[max(text_box[1]-border, 0):min(text_box[1]+text_box[3]+border, img_haystack.shape[0]),
+                                max(text_box[0]-border, 0):min(text_box[0]+text_box[2]+border, img_haystack.shape[1])]
+        factor = self.params["ocr"]["zoom_factor"].value
+        log.debug("Zooming x%i candidate for improved OCR processing", factor)
+        text_img = cv2.resize(text_img, None, fx=factor, fy=factor)
+        text_img = binarize_step("threshold2", text_img)
+        if self.params["ocr"]["distance_transform"].value:
+            text_img = cv2.distanceTransform(text_img,
+                                             self.params["ocr"]["dt_distance_type"].value,
+                                             self.params["ocr"]["dt_mask_size"].value)
+            text_img = cv2.cvtColor(numpy.asarray(text_img, dtype='uint8'), cv2.COLOR_GRAY2RGB)
+            text_img = binarize_step("threshold3", text_img)
+        if self.params["ocr"]["erode_dilate"].value < 3:
+            element = cv2.getStructuringElement(self.params["ocr"]["ed_kernel_type"].value,
+                                                (self.params["ocr"]["ed_kernel_width"].value,
+                                                 self.params["ocr"]["ed_kernel_height"].value))
+            if self.params["ocr"]["erode_dilate"].value in [0, 2]:
+                text_img = cv2.erode(text_img, element)
+            if self.params["ocr"]["erode_dilate"].value in [1, 2]:
+                text_img = cv2.dilate(text_img, element)
+        return text_img
+
+    def _recognize_text_tesseract(self, text_img):
+        """
+        EXTRA DOCSTRING: Text matching backend - Tesseract OCR of a text region.
 
-            similarity = 1.0 - float(needle.distance_to(output)) / max(len(output), len(text_needle))
-            log.debug("Similarity = '%s'", similarity)
-            self.imglog.similarities.append(similarity)
-            if similarity >= self.params["find"]["similarity"].value:
-                log.debug("Text at (%s, %s) is acceptable", text_box[0], text_box[1])
-                self.imglog.locations.append((text_box[0], text_box[1]))
-                x, y, w, h = text_box
-                dx, dy = needle.center_offset.x, needle.center_offset.y
-                cv2.rectangle(final_hotmap, (x, y), (x+w, y+h), (0, 0, 0), 2)
-                cv2.rectangle(final_hotmap, (x, y), (x+w, y+h), (255, 255, 255), 1)
-                matches.append(Match(x, y, w, h, dx, dy, similarity))
-        matches = sorted(matches, key=lambda x: x.similarity, reverse=True)
+        :param text_img: text region image prepared for recognition
+        :type text_img: :py:class:`numpy.ndarray`
+        :returns: recognized text
+        :rtype: str
+        """
+        if self.params["ocr"]["backend"] == "pytesseract":
+            logging.debug("Running pytesseract with extra command line %s", self.ocr_config)
+            return self.ocr.image_to_string(text_img,
+                                            lang=self.params["ocr"]["language"].value,
+                                            config=self.ocr_config)
+
+        # an API instance cannot be used by more than one worker at a time
+        # and instances from before a resynchronization are simply dropped
+        with self._ocr_lock:
+            instances = self._ocr_instances
+            ocr = instances.pop() if len(instances) > 0 else None
+        if ocr is None:
+            ocr = self._create_tesserocr()
+        try:
+            ocr.SetImage(PIL.Image.fromarray(text_img))
+            return ocr.GetUTF8Text()
+        finally:
+            with self._ocr_lock:
+                instances.append(ocr)
 
-        self.imglog.hotmaps.append(final_hotmap)
-        self.imglog.log(30)
-        return matches
+    def _tile_text_images(self, text_images, margin=20):
+        """
+        EXTRA DOCSTRING: Text matching backend - tiling of text regions on a single page.
+
+        :param text_images: text region images prepared for recognition
+        :type text_images: [:py:class:`numpy.ndarray`]
+        :param int margin: blank space in pixels around each tile
+        :returns: page with all regions stacked vertically and the vertical
+                  range of each tile on the page
+        :rtype: (:py:class:`numpy.ndarray`, [(int, int)])
+        """
+        import cv2
+        import numpy
+        text_images = [cv2.cvtColor(text_img, cv2.COLOR_RGB2GRAY) if text_img.ndim == 3 else text_img
+                       for text_img in text_images]
+        width = max(text_img.shape[1] for text_img in text_images) + 2 * margin
+        height = sum(text_img.shape[0] + margin for text_img in text_images) + margin
+        page = numpy.full((height, width), 255, dtype=numpy.uint8)
+
+        tiles = []
+        top = margin
+        for text_img in text_images:
+            bottom = top + text_img.shape[0]
+            page[top:bottom, margin:margin + text_img.shape[1]] = text_img
+            tiles.append((top, bottom))
+            top = bottom + margin
+        return page, tiles
+
+    def _split_tiled_text(self, data, tiles):
+        """
+        EXTRA DOCSTRING: Text matching backend - text of each tile from page OCR data.
+
+        :param data: word level OCR data of the tiled page in the dictionary
+                     format of pytesseract's `image_to_data`
+        :type data: {str, [int or str]}
+        :param tiles: vertical range of each tile on the page
+        :type tiles: [(int, int)]
+        :returns: recognized text for each tile
+        :rtype: [str]
+        """
+        tile_lines = [[] for _ in tiles]
+        last_line = [None for _ in tiles]
+        tops = [top for top, _ in tiles]
+        for i, word in enumerate(data["text"]):
+            word = str(word).strip()
+            if word == "":
+                continue
+            # a word belongs to the tile containing its vertical center
+            center = data["top"][i] + data["height"][i] / 2.0
+            tile = bisect.bisect_right(tops, center) - 1
+            if tile < 0 or center >= tiles[tile][1]:
+                continue
+            line = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+            if line != last_line[tile]:
+                tile_lines[tile].append([])
+                last_line[tile] = line
+            tile_lines[tile][-1].append(word)
+        return ["\n".join(" ".join(words) for words in lines) for lines in tile_lines]
+
+    def _create_tesserocr(self):
+        """
+        EXTRA DOCSTRING: Text matching backend - tesserocr API instance.
+
+        :returns: API instance configured with the current OCR parameters
+        :rtype: :py:class:`tesserocr.PyTessBaseAPI`
+        """
+        from tesserocr import PyTessBaseAPI
+        ocr = PyTessBaseAPI(path=self._tessdata_path,
+                            lang=self.params["ocr"]["language"].value,
+                            oem=self.params["ocr"]["oem"].value,
+                            psm=self.params["ocr"]["psmode"].value)
+        ocr.SetVariable("tessedit_char_whitelist", self.params["ocr"]["char_whitelist"].value)
+        return ocr
 
     def _detect_text_east(self, haystack):
         #:.. note:: source implementation by Adrian Rosebrock from his post:
         #:   https://www.pyimagesearch.com/2018/08/20/opencv-text-detection-east-text-detector/
         import cv2
         import numpy
-        img = numpy.array(haystack.pil_image)
-        char_canvas = cv2.cvtColor(numpy.array(haystack.pil_image), cv2.COLOR_RGB2GRAY)
-        text_canvas = numpy.array(haystack.pil_image)
+        img = haystack.numpy_image
+        char_canvas = haystack.gray_image.copy()
+        text_canvas = haystack.numpy_image.copy()
         self.imglog.hotmaps.append(char_canvas)
         self.imglog.hotmaps.append(text_canvas)
 
@@ -2259,10 +3060,18 @@ class TextFinder(ContourFinder):
                                  self.params["tdetect"]["input_res_y"].value)
         width_ratio = img.shape[1] / float(inp_width)
         height_ratio = img.shape[0] / float(inp_height)
-        img = cv2.resize(img, (inp_width, inp_height))
+        # the resize and input buffers are reused while the input resolution remains the same
+        if self._east_buffers is None or self._east_buffers[0].shape[:2] != (inp_height, inp_width):
+            self._east_buffers = (numpy.empty((inp_height, inp_width, 3), numpy.uint8),
+                                  numpy.empty((1, 3, inp_height, inp_width), numpy.float32))
+        resized, inp = self._east_buffers
+        cv2.resize(img, (inp_width, inp_height), dst=resized)
 
         # convert to a model-compatible input using the mean from the training
-        inp = cv2.dnn.blobFromImage(img, mean=(123.68, 116.78, 103.94), swapRB=True, crop=False)
+        # (identical to blobFromImage() with swapped red and blue channels)
+        for channel, mean in enumerate((123.68, 116.78, 103.94)):
+            numpy.subtract(resized[:, :, 2 - channel], numpy.float32(mean),
+                           out=inp[0, channel], dtype=numpy.float32)
         self.east_net.setInput(inp)
 
         # select two output layers for the EAST detector model respectivelly for
@@ -2271,59 +3080,22 @@ class TextFinder(ContourFinder):
         probability, geometry = self.east_net.forward(output_layers)
         char_canvas[:] = cv2.resize(probability[0, 0]*255.0, (char_canvas.shape[1], char_canvas.shape[0]))
 
-        rects = []
-        for row in range(0, probability.shape[2]):
-            row_scores = probability[0, 0, row]
-            row_data = geometry[0, :, row]
-            for col in range(0, probability.shape[3]):
-                # prune out subthreshold probability of being a text
-                if row_scores[col] < self.params["tdetect"]["min_box_confidence"].value:
-                    continue
-                # use geometry data to get input size and rescale for final bounding box width and height
-                h = min(row_data[0][col] + row_data[2][col], inp_height) * height_ratio
-                w = min(row_data[1][col] + row_data[3][col], inp_width) * width_ratio
-                # output layer dimensions are 4x smaller than the input layer dimentions
-                (dx, dy) = (col + 1) * 4.0, (row + 1) * 4.0
-                # calculate the rotation angle from the prediction ouput
-                sin, cos = numpy.sin(row_data[4][col]), numpy.cos(row_data[4][col])
-                # compute the starting (from ending) coordinates for the text bounding box
-                x2 = min(dx + cos * row_data[1][col] + sin * row_data[2][col], inp_width) * width_ratio
-                y2 = min(dy - sin * row_data[1][col] + cos * row_data[2][col], inp_height) * height_ratio
-                # the network might give unlimited region boundaries so limit by input width/height (above)
-                x1, y1 = x2 - w, y2 - h
-
-                rect = (int(x1), int(y1), int(w), int(h))
+        rects, confidences = self._east_boxes(probability, geometry, width_ratio, height_ratio)
+        if self.imglog.logging_level <= 30:
+            for rect in rects:
                 cv2.rectangle(char_canvas, (rect[0], rect[1]), (rect[0]+rect[2], rect[1]+rect[3]), (0, 0, 0), 2)
                 cv2.rectangle(char_canvas, (rect[0], rect[1]), (rect[0]+rect[2], rect[1]+rect[3]), (255, 255, 255), 1)
-                rects.append(rect)
-                # TODO: needed for outsourced nonmaxima supression
-                # confidences.append(row_scores[x])
-
         logging.debug("A total of %s possible text regions found", len(rects))
 
-        # produce a final set of nonintersecting text regions
-        text_regions = []
-        # TODO: apply outsourced nonmaxima suppression as the current OpenCV
-        # implementation is broken in the number of python2C++ called arguments
-        # indices = cv2.dnn.NMSBoxesRotated(rects, confidences, 0.5, 0.5, 1., 0)
-        region_queue = [[region, True] for region in rects]
-        while True:
-            # nothing to do for just one region
-            if len(region_queue) < 2:
-                break
-            r1, flag1 = region_queue.pop(0)
-            if not flag1:
-                continue
-            for r2pair in region_queue:
-                r2, _ = r2pair
-                # if the two regions intersect
-                if (r1[0] < r2[0] + r2[2] and r1[0] + r1[2] > r2[0]
-                        and r1[1] < r2[1] + r2[3] and r1[1] + r1[3] > r2[1]):
-                    r1 = [min(r1[0], r2[0]), min(r1[1], r2[1]), max(r1[2], r2[2]), max(r1[3], r2[3])]
-                    # second region will no longer be considered
-                    r2pair[1] = False
-            # first region is now merged with all intersecting regions
-            text_regions.append(r1)
+        # produce a final set of text regions suppressing the less confident overlapping ones
+        if len(rects) > 0:
+            indices = cv2.dnn.NMSBoxes(rects, confidences,
+                                       self.params["tdetect"]["min_box_confidence"].value,
+                                       self.params["tdetect"]["nms_threshold"].value)
+            # retain the order of detection among the remaining regions
+            text_regions = [rects[i] for i in sorted(numpy.array(indices, dtype=int).ravel())]
+        else:
+            text_regions = []
         for rect in text_regions:
             cv2.rectangle(text_canvas, (rect[0], rect[1]), (rect[0]+rect[2], rect[1]+rect[3]), (0, 0, 0), 2)
             cv2.rectangle(text_canvas, (rect[0], rect[1]), (rect[0]+rect[2], rect[1]+rect[3]), (0, 0, 255), 1)
@@ -2331,12 +3103,50 @@ class TextFinder(ContourFinder):
         logging.debug("A total of %s final text regions found", len(text_regions))
         return text_regions
 
+    def _east_boxes(self, probability, geometry, width_ratio, height_ratio):
+        """
+        EXTRA DOCSTRING: Text matching backend - decoding of EAST network outputs.
+
+        :param probability: probability map of text at each output cell
+        :type probability: :py:class:`numpy.ndarray`
+        :param geometry: distances to the box edges and rotation angle at each output cell
+        :type geometry: :py:class:`numpy.ndarray`
+        :param float width_ratio: horizontal scale from input to haystack coordinates
+        :param float height_ratio: vertical scale from input to haystack coordinates
+        :returns: text boxes as (x, y, width, height) and their confidences
+        :rtype: ([(int, int, int, int)], [float])
+        """
+        import numpy
+        inp_width, inp_height = (self.params["tdetect"]["input_res_x"].value,
+                                 self.params["tdetect"]["input_res_y"].value)
+        # prune out subthreshold probability of being a text
+        scores = probability[0, 0]
+        rows, cols = numpy.nonzero(scores >= self.params["tdetect"]["min_box_confidence"].value)
+        top, right, bottom, left, angle = geometry[0, :5, rows, cols].T
+
+        # use geometry data to get input size and rescale for final bounding box width and height
+        h = numpy.minimum(top + bottom, inp_height) * height_ratio
+        w = numpy.minimum(right + left, inp_width) * width_ratio
+        # output layer dimensions are 4x smaller than the input layer dimentions
+        dx = ((cols + 1) * 4.0).astype(numpy.float32)
+        dy = ((rows + 1) * 4.0).astype(numpy.float32)
+        # calculate the rotation angle from the prediction ouput
+        sin, cos = numpy.sin(angle), numpy.cos(angle)
+        # compute the starting (from ending) coordinates for the text bounding box
+        x2 = numpy.minimum(dx + cos * right + sin * bottom, inp_width) * width_ratio
+        y2 = numpy.minimum(dy - sin * right + cos * bottom, inp_height) * height_ratio
+        # the network might give unlimited region boundaries so limit by input width/height (above)
+        x1, y1 = x2 - w, y2 - h
+
+        rects = numpy.stack([x1, y1, w, h], axis=1).astype(int)
+        return [tuple(rect) for rect in rects.tolist()], scores[rows, cols].astype(float).tolist()
+
     def _detect_text_erstat(self, haystack):
         import cv2
         import numpy
-        img = numpy.array(haystack.pil_image)
-        char_canvas = numpy.array(haystack.pil_image)
-        text_canvas = numpy.array(haystack.pil_image)
+        img = haystack.numpy_image
+        char_canvas = haystack.numpy_image.copy()
+        text_canvas = haystack.numpy_image.copy()
         self.imglog.hotmaps.append(char_canvas)
         self.imglog.hotmaps.append(text_canvas)
 
@@ -2398,9 +3208,9 @@ class TextFinder(ContourFinder):
     def _detect_text_contours(self, haystack):
         import cv2
         import numpy
-        img = numpy.array(haystack.pil_image)
-        char_canvas = numpy.array(haystack.pil_image)
-        text_canvas = numpy.array(haystack.pil_image)
+        img = haystack.numpy_image
+        char_canvas = haystack.numpy_image.copy()
+        text_canvas = haystack.numpy_image.copy()
         self.imglog.hotmaps.append(char_canvas)
         self.imglog.hotmaps.append(text_canvas)
 
@@ -2430,16 +3240,84 @@ class TextFinder(ContourFinder):
         char_regions = sorted(char_regions, key=lambda x: x[0])
 
         # group characters into horizontally-correlated regions
-        text_regions = []
+        text_regions = self._group_text_characters(char_regions)
+        for x, y, w, h in text_regions:
+            cv2.rectangle(text_canvas, (x, y), (x+w, y+h), (0, 0, 0), 2)
+            cv2.rectangle(text_canvas, (x, y), (x+w, y+h), (0, 255, 0), 1)
+
+        return text_regions
+
+    def _group_text_characters(self, char_regions):
+        """
+        EXTRA DOCSTRING: Text matching backend - sweep-line grouping of characters.
+
+        Each character region that is not yet part of a text region greedily
+        absorbs all other remaining characters close enough along the text
+        orientation, visiting them in order of their horizontal position.
+        Instead of comparing all pairs of characters, only characters within
+        the horizontal reach of the growing region and within a few buckets
+        of vertical positions around it are visited, all others being too
+        far to be absorbed at the time of their visit.
+
+        :param char_regions: character regions as [x, y, width, height]
+                             sorted by their horizontal position
+        :type char_regions: [[int]]
+        :returns: text regions as [x, y, width, height] with enough characters
+        :rtype: [[int]]
+        """
+        import math
         dx, dy = self.params["tdetect"]["horizontalSpacing"].value, self.params["tdetect"]["verticalVariance"].value
         text_orientation = self.params["tdetect"]["orientation"].value
         min_chars_for_text = self.params["tdetect"]["minChars"].value
+        # characters larger than these are already filtered out
+        max_width = self.params["tdetect"]["maxWidth"].value
+        max_height = self.params["tdetect"]["maxHeight"].value
+
+        char_regions = list(char_regions)
+        xs = [region[0] for region in char_regions]
+        bucket_size = max(dy, 1) if text_orientation == 0 else max(dy + max_height, 1)
+        buckets = {}
+        for j, region in enumerate(char_regions):
+            buckets.setdefault(math.floor(region[1] / bucket_size), []).append(j)
+
+        def reach(region):
+            # index range and vertical range a character must be within to be absorbed
+            x1, y1, w1, h1 = region
+            if text_orientation == 0:
+                end = bisect.bisect_left(xs, x1 + w1 + dx)
+                return end, y1 - dy, y1 + dy
+            else:
+                end = bisect.bisect_left(xs, x1 + dx)
+                return end, y1 - dy - max_height, y1 + h1 + dy
+
+        def next_char(j, low, high):
+            # next character in order of visit among the buckets of the vertical range
+            next_j = len(char_regions)
+            for key in range(math.floor(low / bucket_size), math.floor(high / bucket_size) + 1):
+                bucket = buckets.get(key, [])
+                k = bisect.bisect_right(bucket, j)
+                if k < len(bucket) and bucket[k] < next_j:
+                    next_j = bucket[k]
+            return next_j
+
+        text_regions = []
         for i, region1 in enumerate(char_regions):
             # region was already merged
             if region1 is None:
                 continue
             chars_for_text = 0
-            for j, region2 in enumerate(char_regions):
+            # the first absorbed character must be within reach of the initial region
+            # and only characters after it are visited thereafter
+            if text_orientation == 0:
+                j = bisect.bisect_right(xs, region1[0] - dx - max_width) - 1
+            else:
+                j = bisect.bisect_right(xs, region1[0] - dx) - 1
+            end, low, high = reach(region1)
+            while True:
+                j = next_char(j, low, high)
+                if j >= end:
+                    break
+                region2 = char_regions[j]
                 # region is compared to itself or to merged region
                 if region1 == region2 or region2 is None:
                     continue
@@ -2453,13 +3331,11 @@ class TextFinder(ContourFinder):
                     region1 = [min(x1, x2), min(y1, y2), max(x1+w1, x2+w2)-min(x1, x2), max(y1+h1, y2+h2)-min(y1, y2)]
                     chars_for_text += 1
                     char_regions[j] = None
+                    end, low, high = reach(region1)
             if chars_for_text < min_chars_for_text:
                 log.debug("Ignoring text contour with %s<%s characters",
                           chars_for_text, min_chars_for_text)
                 continue
-            x, y, w, h = region1
-            cv2.rectangle(text_canvas, (x, y), (x+w, y+h), (0, 0, 0), 2)
-            cv2.rectangle(text_canvas, (x, y), (x+w, y+h), (0, 255, 0), 1)
             text_regions.append(region1)
             char_regions[i] = None
 
@@ -2468,9 +3344,9 @@ class TextFinder(ContourFinder):
     def _detect_text_components(self, haystack):
         import cv2
         import numpy
-        img = numpy.array(haystack.pil_image)
-        char_canvas = numpy.array(haystack.pil_image)
-        text_canvas = numpy.array(haystack.pil_image)
+        img = haystack.numpy_image
+        char_canvas = haystack.numpy_image.copy()
+        text_canvas = haystack.numpy_image.copy()
         self.imglog.hotmaps.append(char_canvas)
         self.imglog.hotmaps.append(text_canvas)
 
@@ -2656,9 +3532,9 @@ class TemplateFeatureFinder(TemplateFinder, FeatureFinder):
         self.params["find"]["similarity"].value = feature_similarity
         # dump correct matching settings
         self.imglog.dump_matched_images()
-        ngray = cv2.cvtColor(numpy.array(needle.pil_image), cv2.COLOR_RGB2GRAY)
-        hgray = cv2.cvtColor(numpy.array(haystack.pil_image), cv2.COLOR_RGB2GRAY)
-        final_hotmap = numpy.array(haystack.pil_image)
+        ngray = needle.gray_image
+        hgray = haystack.gray_image
+        final_hotmap = haystack.numpy_image.copy()
 
         frame_points = [(0, 0)]
         feature_maxima = []
@@ -2807,6 +3683,9 @@ class DeepFinder(Finder):
     """
 
     _cache = {}
+    _frame_cache = collections.OrderedDict()
+    _frame_cache_size = 8
+    _cache_lock = threading.Lock()
 
     def __init__(self, classifier_datapath=".", configure=True, synchronize=True):
         """Build a CV backend using OpenCV's text matching options."""
@@ -2818,6 +3697,7 @@ class DeepFinder(Finder):
 
         # other attributes
         self.net = None
+        self._model_id = None
 
         # additional preparation
         if configure:
@@ -2905,6 +3785,7 @@ class DeepFinder(Finder):
             model.to(device)
             model.eval()
             self.net = model
+            self._model_id = (model_id, model_classes)
 
         elif backend == "tensorflow":
             # class-specific dependencies
@@ -2958,13 +3839,7 @@ class DeepFinder(Finder):
         final_hotmap = haystack.pil_image.copy()
         needle_class = needle.id
         similarity = self.params["find"]["similarity"].value
-        backend = self.params["deep"]["backend"]
 
-        if backend == "tensorflow":
-            raise NotImplementedError("The TensorFlow model zoo/garden libary "
-                                      "is too unstable at present")
-        assert backend == "pytorch", "Only PyTorch model zoo/garden is supported"
-        import torch
         if needle.data_file is not None:
             with open(needle.data_file, "rt") as f:
                 classes_list = [line.rstrip() for line in f.readlines()]
@@ -2973,27 +3848,15 @@ class DeepFinder(Finder):
             # an infinite list as a string identity map
             classes = lambda x: str(x)
 
-        # set the module in evaluation mode
-        self.net.eval()
-
-        # convert haystack data to tensor variable
-        from torchvision import transforms
-        img = haystack.pil_image
-        transform = transforms.Compose([transforms.ToTensor()])
-        img = transform(img)
-        # a bit awkward but the only current way to get the model's device
-        device = next(self.net.parameters()).device
-        img.to(device)
-        # forward pass the image to obtain predictions
-        with torch.no_grad():
-            pred = self.net([img])
+        # detections are shared by all needles searched on the same haystack
+        labels, scores, boxes = self.detect([haystack])[0]
 
         matches = []
         from .match import Match
-        for i in range(len(pred[0]['labels'])):
-            label = classes(pred[0]['labels'][i].cpu().item())
-            score = pred[0]['scores'][i].cpu().item()
-            x, y, w, h = list(pred[0]['boxes'][i].cpu().numpy())
+        for i in range(len(labels)):
+            label = classes(labels[i])
+            score = scores[i]
+            x, y, w, h = list(boxes[i])
             rect = (int(x), int(y), int(x+w), int(y+h))
 
             from PIL import ImageDraw
@@ -3026,6 +3889,74 @@ class DeepFinder(Finder):
         self.imglog.log(30)
         return matches
 
+    def detect(self, haystacks):
+        """
+        Detect all objects in one or more haystack images.
+
+        :param haystacks: images to detect objects in
+        :type haystacks: [:py:class:`target.Image`]
+        :returns: labels, confidence scores, and boxes of the detected objects
+                  in each haystack image
+        :rtype: [([int], [float], :py:class:`numpy.ndarray`)]
+
+        All objects are detected in a single forward pass over a batch of the
+        haystacks whose detections are not already cached. The detections of
+        the last few haystacks are cached by image content and model so that
+        any number of pattern needles on the same screen, or the screens of
+        several sessions detected together beforehand, require no further
+        inference.
+        """
+        backend = self.params["deep"]["backend"]
+        if backend == "tensorflow":
+            raise NotImplementedError("The TensorFlow model zoo/garden libary "
+                                      "is too unstable at present")
+        assert backend == "pytorch", "Only PyTorch model zoo/garden is supported"
+        import hashlib
+        import numpy
+        import torch
+
+        detections = [None] * len(haystacks)
+        missing = {}
+        with self._cache_lock:
+            for i, haystack in enumerate(haystacks):
+                img = haystack.numpy_image
+                frame_id = (hashlib.sha1(numpy.ascontiguousarray(img)).hexdigest(),
+                            img.shape, self._model_id)
+                if frame_id in self._frame_cache:
+                    log.log(9, "Reusing cached detections")
+                    self._frame_cache.move_to_end(frame_id)
+                    detections[i] = self._frame_cache[frame_id]
+                else:
+                    missing.setdefault(frame_id, []).append(i)
+        if len(missing) == 0:
+            return detections
+
+        # set the module in evaluation mode
+        self.net.eval()
+
+        # convert haystack data to tensor variables on the model's device
+        from torchvision import transforms
+        transform = transforms.Compose([transforms.ToTensor()])
+        # a bit awkward but the only current way to get the model's device
+        device = next(self.net.parameters()).device
+        imgs = [transform(haystacks[indices[0]].pil_image).to(device)
+                for indices in missing.values()]
+        # forward pass all images at once to obtain predictions
+        with torch.no_grad():
+            preds = self.net(imgs)
+
+        with self._cache_lock:
+            for (frame_id, indices), pred in zip(missing.items(), preds):
+                detection = (pred['labels'].cpu().tolist(),
+                             pred['scores'].cpu().tolist(),
+                             pred['boxes'].cpu().numpy())
+                for i in indices:
+                    detections[i] = detection
+                self._frame_cache[frame_id] = detection
+                if len(self._frame_cache) > self._frame_cache_size:
+                    self._frame_cache.popitem(last=False)
+        return detections
+
     def log(self, lvl):
         """
         Custom implementation of the base method.
@@ -3141,10 +4072,19 @@ class HybridFinder(Finder):
         """
         self.__synchronize_backend(backend, category, reset)
 
-    def find(self, needle, haystack):
+    def find(self, needle, haystack, max_matches=0, changes=None, previous=None):
         """
         Custom implementation of the base method.
 
+        :param int max_matches: maximal number of matches to return where
+                                zero means no limit (only for template matchers)
+        :param changes: rectangles of the haystack that changed since the
+                        previous haystack or None if unknown (only for
+                        template matchers)
+        :type changes: [(int, int, int, int)] or None
+        :param previous: haystack the changes are relative to
+        :type previous: :py:class:`Image` or None
+
         See base method for details.
         """
         try:
@@ -3154,14 +4094,19 @@ class HybridFinder(Finder):
             log.debug("Defaulting to one step chain %s", needle)
             needle = [needle]
 
-        for step_needle in needle:
+        for i, step_needle in enumerate(needle):
 
             if step_needle.use_own_settings and not isinstance(step_needle.match_settings, HybridFinder):
                 matcher = step_needle.match_settings
             else:
                 matcher = self.matcher
 
-            matches = matcher.find(step_needle, haystack)
+            if isinstance(matcher, TemplateFinder) and not isinstance(matcher, TemplateFeatureFinder):
+                # only the first step is guaranteed to have seen the previous haystack
+                matches = matcher.find(step_needle, haystack, max_matches=max_matches,
+                                       changes=changes if i == 0 else None, previous=previous)
+            else:
+                matches = matcher.find(step_needle, haystack)
             if len(matches) > 0:
                 return matches
 
@@ -0,0 +1,452 @@
+# Copyright 2013-2023 Intranet AG and contributors
+#
+# guibot is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# guibot is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with guibot.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+SUMMARY
+------------------------------------------------------
+Asynchronous guibot interface for use within an asyncio event loop.
+
+Frontend with coroutine API wrapping a :py:class:`region.Region` or
+:py:class:`guibot.GuiBot` object so that a single event loop can drive many
+GUI sessions concurrently, e.g. via ``asyncio.gather`` over a few waits.
+Screen captures, matching, and display control run in an executor while all
+waiting between scans is done with awaitable timers. For information about
+the arguments and return values please refer to :py:class:`region.Region`.
+
+
+INTERFACE
+------------------------------------------------------
+
+"""
+
+import asyncio
+import contextlib
+import functools
+import logging
+import threading
+import weakref
+
+from .config import GlobalConfig
+from .errors import *
+from .guibot import GuiBot
+from .location import Location
+from .match import Match
+
+
+log = logging.getLogger('guibot.async')
+
+# finders keep state between calls and can thus be used by one thread at a time
+_finder_locks = weakref.WeakKeyDictionary()
+_finder_locks_lock = threading.Lock()
+
+
+def _locked_find(finders, func, *args):
+    """
+    Call a matching function holding the locks of all finders it uses.
+
+    :param finders: finders used by the matching function
+    :type finders: [:py:class:`finder.Finder`]
+    :param func: matching function to call
+    :type func: callable
+    :returns: the result of the matching function
+    """
+    with _finder_locks_lock:
+        locks = []
+        # a fixed order of acquisition avoids deadlocks among overlapping batches
+        for finder in sorted(set(finders), key=id):
+            if finder not in _finder_locks:
+                _finder_locks[finder] = threading.Lock()
+            locks.append(_finder_locks[finder])
+    with contextlib.ExitStack() as stack:
+        for lock in locks:
+            stack.enter_context(lock)
+        return func(*args)
+
+
+class AsyncRegion(object):
+    """
+    Asynchronous counterpart of a region where all methods are coroutines.
+
+    .. seealso:: Real API is provided by :py:class:`region.Region`.
+    """
+
+    def __init__(self, region, executor=None):
+        """
+        Build an asynchronous wrapper around a region.
+
+        :param region: region to perform all operations with
+        :type region: :py:class:`region.Region`
+        :param executor: executor for the blocking capturing, matching, and
+                         display control or None for the default one of the
+                         event loop
+        :type executor: :py:class:`concurrent.futures.Executor` or None
+        """
+        self.region = region
+        self.executor = executor
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    async def _find_relative(self, target, cv_backend, *args):
+        return await self._run(_locked_find, [cv_backend], self.region._find_relative,
+                               target, cv_backend, *args)
+
+    async def _find_batch(self, targets, screen_capture, *args):
+        finders = [self.region._determine_cv_backend(target) for target in targets]
+        return await self._run(_locked_find, finders, self.region._find_batch,
+                               targets, screen_capture, *args)
+
+    async def _resolve(self, target_or_location):
+        if isinstance(target_or_location, (Match, Location)):
+            return target_or_location, None
+        match = await self.find(target_or_location)
+        return match, match
+
+    async def _act(self, method, target_or_location, *args, **kwargs):
+        target_or_location, match = await self._resolve(target_or_location)
+        await self._run(getattr(self.region, method), target_or_location, *args, **kwargs)
+        return match
+
+    async def call(self, method, *args, **kwargs):
+        """
+        Call any other region method in the executor.
+
+        :param str method: name of the region method to call
+        :returns: the result of the region method
+        """
+        result = await self._run(getattr(self.region, method), *args, **kwargs)
+        return self if result is self.region else result
+
+    async def find(self, target, timeout=10):
+        """See :py:meth:`region.Region.find` for details."""
+        matches = await self._find_matches(target, timeout=timeout, allow_zero=False, max_matches=1)
+        return matches[0]
+
+    async def find_all(self, target, timeout=10, allow_zero=False):
+        """See :py:meth:`region.Region.find_all` for details."""
+        return await self._find_matches(target, timeout=timeout, allow_zero=allow_zero)
+
+    async def _find_matches(self, target, timeout=10, allow_zero=False, max_matches=0):
+        region = self.region
+        if isinstance(target, str):
+            target = await self._run(region._target_from_string, target)
+        log.debug("Looking for targets %s", target)
+        cv_backend = region._determine_cv_backend(target)
+
+        loop = asyncio.get_running_loop()
+        last_matches = []
+        moving_targets = True
+        # captures without changes since the last matched one have the same content
+        last_capture, matched_capture, relative_matches = None, None, []
+        timeout_limit = loop.time() + timeout
+        delay = GlobalConfig.rescan_speed_on_find
+        while True:
+            screen_capture, changes = await self._run(region.dc_backend.wait_for_change,
+                                                      last_capture, 0, region)
+            last_capture = screen_capture
+
+            if changes is not None and len(changes) == 0:
+                # back off exponentially while nothing changes
+                delay = min(2 * delay, 2 * GlobalConfig.rescan_speed_on_find)
+            else:
+                if changes is not None:
+                    # poll faster only while the screen keeps changing
+                    delay = max(delay / 2, GlobalConfig.rescan_speed_on_find / 4)
+                relative_matches = await self._find_relative(target, cv_backend, screen_capture,
+                                                             max_matches, changes, matched_capture)
+                matched_capture = screen_capture
+            if len(relative_matches) > 0:
+                moving_targets = region._update_matches(last_matches, relative_matches,
+                                                        cv_backend, moving_targets)
+                if not GlobalConfig.wait_for_animations or not moving_targets:
+                    return last_matches
+                await asyncio.sleep(GlobalConfig.rescan_speed_on_find)
+
+            elif loop.time() > timeout_limit:
+                if allow_zero:
+                    return last_matches
+                else:
+                    await self._run(region._save_find_error, target, screen_capture)
+                    raise FindError(target)
+
+            else:
+                await asyncio.sleep(min(delay, max(timeout_limit - loop.time(), 0)))
+
+    async def find_any(self, targets, timeout=10):
+        """See :py:meth:`region.Region.find_any` for details."""
+        region = self.region
+        needles = [await self._run(region._target_from_string, target)
+                   if isinstance(target, str) else target for target in targets]
+        loop = asyncio.get_running_loop()
+        last_found = None
+        # captures without changes since the last matched one have the same content
+        last_capture, matched_capture, batch_matches = None, None, []
+        timeout_limit = loop.time() + timeout
+        delay = GlobalConfig.rescan_speed_on_find
+        while True:
+            screen_capture, changes = await self._run(region.dc_backend.wait_for_change,
+                                                      last_capture, 0, region)
+            last_capture = screen_capture
+
+            if changes is not None and len(changes) == 0:
+                # back off exponentially while nothing changes
+                delay = min(2 * delay, 2 * GlobalConfig.rescan_speed_on_find)
+            else:
+                if changes is not None:
+                    # poll faster only while the screen keeps changing
+                    delay = max(delay / 2, GlobalConfig.rescan_speed_on_find / 4)
+                # only the best match of each target is needed
+                batch_matches = await self._find_batch(needles, screen_capture, 1,
+                                                       changes, matched_capture)
+                matched_capture = screen_capture
+
+            found = None
+            for target, matches in zip(targets, batch_matches):
+                if len(matches) > 0:
+                    found = (target, matches[0])
+                    break
+            if found is not None:
+                target, match = found
+                region._last_match = match
+                # the same target at the same position in successive scans is no longer moving
+                if not GlobalConfig.wait_for_animations or \
+                        (last_found is not None and last_found[0] is target
+                         and (last_found[1].x, last_found[1].y) == (match.x, match.y)):
+                    return target, match
+                last_found = found
+                await asyncio.sleep(GlobalConfig.rescan_speed_on_find)
+
+            elif loop.time() > timeout_limit:
+                await self._run(region._save_find_error, needles, screen_capture)
+                raise FindError("any of " + ", ".join(str(target) for target in targets))
+
+            else:
+                await asyncio.sleep(min(delay, max(timeout_limit - loop.time(), 0)))
+
+    async def find_each(self, targets):
+        """See :py:meth:`region.Region.find_each` for details."""
+        region = self.region
+        needles = [await self._run(region._target_from_string, target)
+                   if isinstance(target, str) else target for target in targets]
+        screen_capture = await self._run(region.dc_backend.capture_screen, region)
+        return dict(zip(targets, await self._find_batch(needles, screen_capture)))
+
+    async def exists(self, target, timeout=0):
+        """See :py:meth:`region.Region.exists` for details."""
+        try:
+            return await self.find(target, timeout)
+        except FindError:
+            return None
+
+    async def wait(self, target, timeout=30):
+        """See :py:meth:`region.Region.wait` for details."""
+        log.info("Waiting for %s", target)
+        return await self.find(target, timeout)
+
+    async def wait_vanish(self, target, timeout=30):
+        """See :py:meth:`region.Region.wait_vanish` for details."""
+        log.info("Waiting for %s to vanish", target)
+        region = self.region
+        if isinstance(target, str):
+            target = await self._run(region._target_from_string, target)
+        cv_backend = region._determine_cv_backend(target)
+
+        loop = asyncio.get_running_loop()
+        expires = loop.time() + timeout
+        delay = GlobalConfig.rescan_speed_on_find
+        screen_capture, matched_capture = None, None
+        while True:
+            screen_capture, changes = await self._run(region.dc_backend.wait_for_change,
+                                                      screen_capture, 0, region)
+            # the target can only vanish if the screen changed
+            if changes is None or len(changes) > 0:
+                if changes is not None:
+                    # poll faster only while the screen keeps changing
+                    delay = max(delay / 2, GlobalConfig.rescan_speed_on_find / 4)
+                matches = await self._find_relative(target, cv_backend, screen_capture,
+                                                    1, changes, matched_capture)
+                if len(matches) == 0:
+                    return self
+                matched_capture = screen_capture
+            else:
+                delay = min(2 * delay, 2 * GlobalConfig.rescan_speed_on_find)
+
+            remaining = expires - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+
+        # target is still there
+        raise NotFindError(target)
+
+    async def idle(self, timeout):
+        """See :py:meth:`region.Region.idle` for details."""
+        log.debug("Waiting for %ss", timeout)
+        await asyncio.sleep(timeout)
+        return self
+
+    async def hover(self, target_or_location):
+        """See :py:meth:`region.Region.hover` for details."""
+        return await self._act("hover", target_or_location)
+
+    async def click(self, target_or_location, modifiers=None):
+        """See :py:meth:`region.Region.click` for details."""
+        return await self._act("click", target_or_location, modifiers=modifiers)
+
+    async def right_click(self, target_or_location, modifiers=None):
+        """See :py:meth:`region.Region.right_click` for details."""
+        return await self._act("right_click", target_or_location, modifiers=modifiers)
+
+    async def middle_click(self, target_or_location, modifiers=None):
+        """See :py:meth:`region.Region.middle_click` for details."""
+        return await self._act("middle_click", target_or_location, modifiers=modifiers)
+
+    async def double_click(self, target_or_location, modifiers=None):
+        """See :py:meth:`region.Region.double_click` for details."""
+        return await self._act("double_click", target_or_location, modifiers=modifiers)
+
+    async def multi_click(self, target_or_location, count=3, modifiers=None):
+        """See :py:meth:`region.Region.multi_click` for details."""
+        return await self._act("multi_click", target_or_location, count=count, modifiers=modifiers)
+
+    async def click_expect(self, click_image_or_location, expect_target,
+                           modifiers=None, timeout=60, retries=3):
+        """See :py:meth:`region.Region.click_expect` for details."""
+        for i in range(retries):
+            if i > 0:
+                log.info("Retrying the mouse click (%s of %s)", i+1, retries)
+            await self.click(click_image_or_location, modifiers=modifiers)
+            try:
+                return await self.wait(expect_target, timeout)
+            except FindError as error:
+                if i == retries - 1:
+                    raise error
+
+    async def click_vanish(self, click_image_or_location, expect_target,
+                           modifiers=None, timeout=60, retries=3):
+        """See :py:meth:`region.Region.click_vanish` for details."""
+        for i in range(retries):
+            if i > 0:
+                log.info("Retrying the mouse click (%s of %s)", i+1, retries)
+            await self.click(click_image_or_location, modifiers=modifiers)
+            try:
+                return await self.wait_vanish(expect_target, timeout)
+            except NotFindError as error:
+                if i == retries - 1:
+                    raise error
+
+    async def mouse_down(self, target_or_location, button=None):
+        """See :py:meth:`region.Region.mouse_down` for details."""
+        return await self._act("mouse_down", target_or_location, button=button)
+
+    async def mouse_up(self, target_or_location, button=None):
+        """See :py:meth:`region.Region.mouse_up` for details."""
+        return await self._act("mouse_up", target_or_location, button=button)
+
+    async def mouse_scroll(self, target_or_location, clicks=10, horizontal=False):
+        """See :py:meth:`region.Region.mouse_scroll` for details."""
+        return await self._act("mouse_scroll", target_or_location,
+                               clicks=clicks, horizontal=horizontal)
+
+    async def drag_drop(self, src_target_or_location, dst_target_or_location, modifiers=None):
+        """See :py:meth:`region.Region.drag_drop` for details."""
+        await self.drag_from(src_target_or_location, modifiers=modifiers)
+        return await self.drop_at(dst_target_or_location, modifiers=modifiers)
+
+    async def drag_from(self, target_or_location, modifiers=None):
+        """See :py:meth:`region.Region.drag_from` for details."""
+        return await self._act("drag_from", target_or_location, modifiers=modifiers)
+
+    async def drop_at(self, target_or_location, modifiers=None):
+        """See :py:meth:`region.Region.drop_at` for details."""
+        return await self._act("drop_at", target_or_location, modifiers=modifiers)
+
+    async def press_keys(self, keys):
+        """See :py:meth:`region.Region.press_keys` for details."""
+        await self._run(self.region.press_keys, keys)
+        return self
+
+    async def press_at(self, keys, target_or_location):
+        """See :py:meth:`region.Region.press_at` for details."""
+        target_or_location, match = await self._resolve(target_or_location)
+        await self._run(self.region.press_at, keys, target_or_location)
+        return match
+
+    async def press_expect(self, keys, expect_target, timeout=60, retries=3):
+        """See :py:meth:`region.Region.press_expect` for details."""
+        for i in range(retries):
+            if i > 0:
+                log.info("Retrying the key press (%s of %s)", i+1, retries)
+            await self.press_keys(keys)
+            try:
+                return await self.wait(expect_target, timeout)
+            except FindError as error:
+                if i == retries - 1:
+                    raise error
+
+    async def press_vanish(self, keys, expect_target, timeout=60, retries=3):
+        """See :py:meth:`region.Region.press_vanish` for details."""
+        for i in range(retries):
+            if i > 0:
+                log.info("Retrying the key press (%s of %s)", i+1, retries)
+            await self.press_keys(keys)
+            try:
+                return await self.wait_vanish(expect_target, timeout)
+            except NotFindError as error:
+                if i == retries - 1:
+                    raise error
+
+    async def type_text(self, text, modifiers=None):
+        """See :py:meth:`region.Region.type_text` for details."""
+        await self._run(self.region.type_text, text, modifiers=modifiers)
+        return self
+
+    async def type_at(self, text, target_or_location, modifiers=None):
+        """See :py:meth:`region.Region.type_at` for details."""
+        target_or_location, match = await self._resolve(target_or_location)
+        await self._run(self.region.type_at, text, target_or_location, modifiers=modifiers)
+        return match
+
+
+class AsyncGuiBot(AsyncRegion):
+    """
+    Asynchronous counterpart of the main guibot object.
+
+    .. seealso:: Real API is provided by :py:class:`guibot.GuiBot`.
+    """
+
+    def __init__(self, dc=None, cv=None, executor=None):
+        """
+        Build an asynchronous guibot object.
+
+        :param dc: DC backend used for any display control
+        :type dc: :py:class:`controller.Controller` or None
+        :param cv: CV backend used for any target finding
+        :type cv: :py:class:`finder.Finder` or None
+        :param executor: executor for all blocking operations or None for
+                         the default one of the event loop
+        :type executor: :py:class:`concurrent.futures.Executor` or None
+        """
+        super(AsyncGuiBot, self).__init__(GuiBot(dc=dc, cv=cv), executor=executor)
+
+    def add_path(self, directory):
+        """See :py:meth:`guibot.GuiBot.add_path` for details."""
+        self.region.add_path(directory)
+
+    def remove_path(self, directory):
+        """See :py:meth:`guibot.GuiBot.remove_path` for details."""
+        self.region.remove_path(directory)
@@ -130,6 +130,19 @@ class GuiBotProxy(GuiBot):
             proxified.append(self._proxify(match))
         return proxified
 
+    def find_any(self, *args, **kwargs):
+        """See :py:class:`guibot.guibot.GuiBot` and its inherited :py:class:`guibot.region.Region` for details."""
+        target_match = super(GuiBotProxy, self).find_any(*args, **kwargs)
+        return target_match[0], self._proxify(target_match[1])
+
+    def find_each(self, *args, **kwargs):
+        """See :py:class:`guibot.guibot.GuiBot` and its inherited :py:class:`guibot.region.Region` for details."""
+        target_matches = super(GuiBotProxy, self).find_each(*args, **kwargs)
+        proxified = {}
+        for target, matches in target_matches.items():
+            proxified[target] = [self._proxify(match) for match in matches]
+        return proxified
+
     def sample(self, *args, **kwargs):
         """See :py:class:`guibot.guibot.GuiBot` and its inherited :py:class:`guibot.region.Region` for details."""
         return self._proxify(super(GuiBotProxy, self).sample(*args, **kwargs))
@@ -84,6 +84,18 @@ def find_all(*args, **kwargs):
     return guibot.find_all(*args, **kwargs)
 
 
+def find_any(*args, **kwargs):
+    """See :py:class:`guibot.guibot.GuiBot` and its inherited :py:class:`guibot.region.Region` for details."""
+    check_initialized()
+    return guibot.find_any(*args, **kwargs)
+
+
+def find_each(*args, **kwargs):
+    """See :py:class:`guibot.guibot.GuiBot` and its inherited :py:class:`guibot.region.Region` for details."""
+    check_initialized()
+    return guibot.find_each(*args, **kwargs)
+
+
 def sample(*args, **kwargs):
     """See :py:class:`guibot.guibot.GuiBot` and its inherited :py:class:`guibot.region.Region` for details."""
     check_initialized()
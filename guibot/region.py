@@ -411,7 +411,7 @@ class Region(object):
         This method is the main entrance to all our target finding capabilities
         and is the milestone for all target expect methods.
         """
-        matches = self.find_all(target, timeout=timeout, allow_zero=False)
+        matches = self._find_matches(target, timeout=timeout, allow_zero=False, max_matches=1)
         return matches[0]
 
     def find_all(self, target, timeout=10, allow_zero=False):
@@ -429,6 +429,9 @@ class Region(object):
 
         This method is similar the one above but allows for more than one match.
         """
+        return self._find_matches(target, timeout=timeout, allow_zero=allow_zero)
+
+    def _find_matches(self, target, timeout=10, allow_zero=False, max_matches=0):
         if isinstance(target, str):
             target = self._target_from_string(target)
         log.debug("Looking for targets %s", target)
@@ -438,27 +441,31 @@ class Region(object):
         # TODO: decide about updating the last_match attribute
         last_matches = []
         moving_targets = True
+        # captures without changes since the last matched one have the same content
+        last_capture, matched_capture, relative_matches = None, None, []
         timeout_limit = time.time() + timeout
         while True:
-            screen_capture = dc_backend.capture_screen(self)
+            if last_capture is None:
+                screen_capture, changes = dc_backend.capture_screen(self), None
+            else:
+                # wait one rescan for moving targets to stop or until the timeout for targets to appear
+                if len(relative_matches) > 0:
+                    wait_time = GlobalConfig.rescan_speed_on_find
+                else:
+                    wait_time = max(timeout_limit - time.time(), 0)
+                screen_capture, changes = dc_backend.wait_for_change(last_capture, wait_time, self)
+            last_capture = screen_capture
 
-            relative_matches = cv_backend.find(target, screen_capture)
+            if changes is not None and len(changes) == 0:
+                log.debug("No screen changes since the last capture, reusing %s matches",
+                          len(relative_matches))
+            else:
+                relative_matches = self._find_relative(target, cv_backend, screen_capture,
+                                                       max_matches, changes, matched_capture)
+                matched_capture = screen_capture
             if len(relative_matches) > 0:
-                from .match import Match
-                for i, match in enumerate(relative_matches):
-                    absolute_x, absolute_y = match.x + self.x, match.y + self.y
-                    new_match = Match(absolute_x, absolute_y,
-                                      match.width, match.height, match.dx, match.dy,
-                                      match.similarity, dc=dc_backend, cv=cv_backend)
-                    if len(last_matches) > i:
-                        if last_matches[i].x == absolute_x and last_matches[i].y == absolute_y:
-                            moving_targets = False
-                        last_matches[i] = new_match
-                    else:
-                        # disappearing or appearing (teleporting) targets count as moving targets
-                        moving_targets = True
-                        last_matches.append(new_match)
-                self._last_match = last_matches[-1]
+                moving_targets = self._update_matches(last_matches, relative_matches,
+                                                      cv_backend, moving_targets)
                 if not GlobalConfig.wait_for_animations or not moving_targets:
                     return last_matches
 
@@ -466,19 +473,168 @@ class Region(object):
                 if allow_zero:
                     return last_matches
                 else:
-                    if GlobalConfig.save_needle_on_error:
-                        if not os.path.exists(ImageLogger.logging_destination):
-                            os.mkdir(ImageLogger.logging_destination)
-                        dump_path = GlobalConfig.image_logging_destination
-                        hdump_path = os.path.join(dump_path, "last_finderror_haystack.png")
-                        ndump_path = os.path.join(dump_path, "last_finderror_needle.png")
-                        screen_capture.save(hdump_path)
-                        target.save(ndump_path)
+                    self._save_find_error(target, screen_capture)
                     raise FindError(target)
 
+    def _update_matches(self, last_matches, relative_matches, cv_backend, moving_targets):
+        for i, match in enumerate(relative_matches):
+            new_match = self._absolute_match(match, cv_backend)
+            absolute_x, absolute_y = new_match.x, new_match.y
+            if len(last_matches) > i:
+                if last_matches[i].x == absolute_x and last_matches[i].y == absolute_y:
+                    moving_targets = False
+                last_matches[i] = new_match
+            else:
+                # disappearing or appearing (teleporting) targets count as moving targets
+                moving_targets = True
+                last_matches.append(new_match)
+        self._last_match = last_matches[-1]
+        return moving_targets
+
+    def _save_find_error(self, target, screen_capture):
+        if GlobalConfig.save_needle_on_error:
+            if not os.path.exists(ImageLogger.logging_destination):
+                os.mkdir(ImageLogger.logging_destination)
+            dump_path = GlobalConfig.image_logging_destination
+            hdump_path = os.path.join(dump_path, "last_finderror_haystack.png")
+            screen_capture.save(hdump_path)
+            # multiple targets searched at once are numbered in their order
+            targets = target if isinstance(target, list) else [target]
+            for i, needle in enumerate(targets):
+                if isinstance(needle, str):
+                    needle = self._target_from_string(needle)
+                suffix = "" if len(targets) == 1 else str(i + 1)
+                ndump_path = os.path.join(dump_path, "last_finderror_needle%s.png" % suffix)
+                needle.save(ndump_path)
+
+    def find_any(self, targets, timeout=10):
+        """
+        Find the first of a few targets that is present on the screen.
+
+        :param targets: targets to look for in order of preference
+        :type targets: [str or :py:class:`target.Target`]
+        :param int timeout: timeout before giving up
+        :returns: the first target with a match and its best match
+        :rtype: (str or :py:class:`target.Target`, :py:class:`match.Match`)
+        :raises: :py:class:`errors.FindError` if none of the targets is found
+
+        All targets are matched against a single screen capture per scan.
+        """
+        log.debug("Looking for any of the targets %s", targets)
+        last_found, found = None, None
+        # captures without changes since the last matched one have the same content
+        last_capture, matched_capture, batch_matches = None, None, []
+        timeout_limit = time.time() + timeout
+        while True:
+            if last_capture is None:
+                screen_capture, changes = self.dc_backend.capture_screen(self), None
+            else:
+                # wait one rescan for moving targets to stop or until the timeout for targets to appear
+                if found is not None:
+                    wait_time = GlobalConfig.rescan_speed_on_find
+                else:
+                    wait_time = max(timeout_limit - time.time(), 0)
+                screen_capture, changes = self.dc_backend.wait_for_change(last_capture, wait_time, self)
+            last_capture = screen_capture
+
+            if changes is not None and len(changes) == 0:
+                log.debug("No screen changes since the last capture, reusing previous matches")
             else:
-                # don't hog the CPU
-                time.sleep(GlobalConfig.rescan_speed_on_find)
+                # only the best match of each target is needed
+                batch_matches = self._find_batch(targets, screen_capture, 1,
+                                                 changes, matched_capture)
+                matched_capture = screen_capture
+
+            found = None
+            for target, matches in zip(targets, batch_matches):
+                if len(matches) > 0:
+                    found = (target, matches[0])
+                    break
+            if found is not None:
+                target, match = found
+                self._last_match = match
+                # the same target at the same position in successive scans is no longer moving
+                if not GlobalConfig.wait_for_animations or \
+                        (last_found is not None and last_found[0] is target
+                         and (last_found[1].x, last_found[1].y) == (match.x, match.y)):
+                    return target, match
+                last_found = found
+
+            elif time.time() > timeout_limit:
+                self._save_find_error(list(targets), screen_capture)
+                raise FindError("any of " + ", ".join(str(target) for target in targets))
+
+    def find_each(self, targets):
+        """
+        Find all matches of each of a few targets on the screen.
+
+        :param targets: targets to look for
+        :type targets: [str or :py:class:`target.Target`]
+        :returns: matches obtained for each target (none for missing targets)
+        :rtype: {str or :py:class:`target.Target`: [:py:class:`match.Match`]}
+
+        All targets are matched against a single screen capture.
+        """
+        log.debug("Looking for each of the targets %s", targets)
+        screen_capture = self.dc_backend.capture_screen(self)
+        return dict(zip(targets, self._find_batch(targets, screen_capture)))
+
+    def _find_batch(self, targets, screen_capture, max_matches=0, changes=None, previous=None):
+        targets = [self._target_from_string(target) if isinstance(target, str) else target
+                   for target in targets]
+
+        # targets sharing a finder are matched sequentially by it
+        groups = {}
+        for i, target in enumerate(targets):
+            cv_backend = self._determine_cv_backend(target)
+            groups.setdefault(id(cv_backend), (cv_backend, []))[1].append(i)
+
+        def find_group(cv_backend, indices):
+            needles = [targets[i] for i in indices]
+            if self._extends_find(cv_backend) and (max_matches > 0 or changes is not None):
+                matches = [self._find_relative(needle, cv_backend, screen_capture,
+                                               max_matches, changes, previous)
+                           for needle in needles]
+            else:
+                matches = cv_backend.find_batch(needles, screen_capture)
+            return [[self._absolute_match(m, cv_backend) for m in needle_matches]
+                    for needle_matches in matches]
+
+        # image logging steps from concurrent finders would interleave
+        if len(groups) > 1 and ImageLogger.logging_level > 30:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(len(groups), os.cpu_count() or 1)) as pool:
+                futures = [(indices, pool.submit(find_group, cv_backend, indices))
+                           for cv_backend, indices in groups.values()]
+                group_matches = [(indices, future.result()) for indices, future in futures]
+        else:
+            group_matches = [(indices, find_group(cv_backend, indices))
+                             for cv_backend, indices in groups.values()]
+
+        batch_matches = [None] * len(targets)
+        for indices, matches in group_matches:
+            for i, needle_matches in zip(indices, matches):
+                batch_matches[i] = needle_matches
+        return batch_matches
+
+    def _find_relative(self, target, cv_backend, screen_capture, max_matches=0,
+                       changes=None, previous=None):
+        if self._extends_find(cv_backend):
+            return cv_backend.find(target, screen_capture, max_matches=max_matches,
+                                   changes=changes, previous=previous)
+        else:
+            return cv_backend.find(target, screen_capture)
+
+    def _extends_find(self, cv_backend):
+        # finders that can stop early or rematch changes only are given extra arguments
+        return isinstance(cv_backend, (TemplateFinder, HybridFinder)) \
+            and not isinstance(cv_backend, TemplateFeatureFinder)
+
+    def _absolute_match(self, match, cv_backend):
+        from .match import Match
+        return Match(match.x + self.x, match.y + self.y,
+                     match.width, match.height, match.dx, match.dy,
+                     match.similarity, dc=self.dc_backend, cv=cv_backend)
 
     def _target_from_string(self, target_str):
         # handle some specific target types
@@ -580,13 +736,24 @@ class Region(object):
         :raises: :py:class:`errors.NotFindError` if match is still found
         """
         log.info("Waiting for %s to vanish", target)
+        if isinstance(target, str):
+            target = self._target_from_string(target)
+        cv_backend = self._determine_cv_backend(target)
         expires = time.time() + timeout
-        while time.time() < expires:
-            if self.exists(target, 0) is None:
-                return self
-
-            # don't hog the CPU (as rescan within find will check the inverse)
-            time.sleep(GlobalConfig.rescan_speed_on_find)
+        screen_capture, changes = self.dc_backend.capture_screen(self), None
+        matched_capture = None
+        while True:
+            # the target can only vanish if the screen changed
+            if changes is None or len(changes) > 0:
+                if len(self._find_relative(target, cv_backend, screen_capture, 1,
+                                           changes, matched_capture)) == 0:
+                    return self
+                matched_capture = screen_capture
+
+            remaining = expires - time.time()
+            if remaining <= 0:
+                break
+            screen_capture, changes = self.dc_backend.wait_for_change(screen_capture, remaining, self)
 
         # target is still there
         raise NotFindError(target)
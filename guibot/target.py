@@ -237,13 +237,17 @@ class Image(Target):
     """
     Container for image data supporting caching, clicking target,
     file operations, and preprocessing.
+
+    The image data can be stored either as a PIL image or as a numpy
+    RGB buffer where any other representation is derived lazily from
+    the stored one and cached read-only for all users of the image.
     """
 
     _cache = {}
 
     def __init__(self, image_filename=None,
                  pil_image=None, match_settings=None,
-                 use_cache=True):
+                 use_cache=True, numpy_image=None):
         """
         Build an image object.
 
@@ -254,24 +258,39 @@ class Image(Target):
         :param match_settings: predefined configuration for the CV backend if any
         :type match_settings: :py:class:`finder.Finder` or None
         :param bool use_cache: whether to cache image data for better performance
+        :param numpy_image: RGB image data of shape (height, width, 3) used through
+                            a read-only view without copying and thus not to be
+                            modified afterwards
+        :type numpy_image: :py:class:`numpy.ndarray` or None
         """
         super(Image, self).__init__(match_settings)
         self._filename = image_filename
         self._pil_image = None
+        self._numpy_image = None
+        self._gray_image = None
         self._width = 0
         self._height = 0
 
         if self._filename is not None:
             self.load(self._filename, use_cache)
-        # per instance pil image has the final word
+        # per instance image data has the final word
         if pil_image is not None:
             self._pil_image = pil_image
+        if numpy_image is not None:
+            if pil_image is None:
+                self._pil_image = None
+            # a view leaves the flags of the caller's array untouched
+            numpy_image = numpy_image.view()
+            numpy_image.setflags(write=False)
+            self._numpy_image = numpy_image
         # per instance match settings have the final word
         if match_settings is not None:
             self.match_settings = match_settings
             self.use_own_settings = True
 
-        if self._pil_image:
+        if self._numpy_image is not None:
+            self._height, self._width = self._numpy_image.shape[:2]
+        elif self._pil_image:
             self._width = self._pil_image.size[0]
             self._height = self._pil_image.size[1]
 
@@ -316,9 +335,48 @@ class Image(Target):
         :returns: image data of the image
         :rtype: :py:class:`PIL.Image`
         """
+        if self._pil_image is None and self._numpy_image is not None:
+            # converted only once on first use
+            self._pil_image = PIL.Image.fromarray(self._numpy_image)
         return self._pil_image
     pil_image = property(fget=get_pil_image)
 
+    def get_numpy_image(self):
+        """
+        Getter for readonly attribute.
+
+        :returns: RGB image data of the image converted once and cached
+        :rtype: :py:class:`numpy.ndarray`
+
+        The returned array is shared by all users of the image and thus
+        not writeable - copy it before drawing on it.
+        """
+        if self._numpy_image is None:
+            import numpy
+            numpy_image = numpy.asarray(self._pil_image)
+            numpy_image.setflags(write=False)
+            self._numpy_image = numpy_image
+        return self._numpy_image
+    numpy_image = property(fget=get_numpy_image)
+
+    def get_gray_image(self):
+        """
+        Getter for readonly attribute.
+
+        :returns: grayscale image data of the image converted once and cached
+        :rtype: :py:class:`numpy.ndarray`
+
+        The returned array is shared by all users of the image and thus
+        not writeable - copy it before drawing on it.
+        """
+        if self._gray_image is None:
+            import cv2
+            gray_image = cv2.cvtColor(self.numpy_image, cv2.COLOR_RGB2GRAY)
+            gray_image.setflags(write=False)
+            self._gray_image = gray_image
+        return self._gray_image
+    gray_image = property(fget=get_gray_image)
+
     def load(self, filename, use_cache=True, **kwargs):
         """
         Load image from a file.
@@ -330,6 +388,10 @@ class Image(Target):
         if not os.path.exists(filename):
             filename = FileResolver().search(filename)
 
+        # views of any previous image data are no longer valid
+        self._numpy_image = None
+        self._gray_image = None
+
         # TODO: check if mtime of the file changed -> cache dirty?
         if use_cache and filename in self._cache:
             self._pil_image = self._cache[filename]
@@ -415,29 +477,104 @@ class Text(Target):
         with open(filename, "w") as f:
             f.write(self.value)
 
-    def distance_to(self, str2):
+    def distance_to(self, str2, max_distance=None):
         """
         Approximate Hungarian distance.
 
         :param str str2: string to compare to
-        :returns: string distance value
-        :rtype: float
+        :param max_distance: largest distance of interest or None for no bound
+        :type max_distance: int or None
+        :returns: string distance value or `max_distance + 1` if the
+                  distance is larger than the bound
+        :rtype: int
+
+        Only the diagonal band of the distance matrix that can stay within
+        the bound is computed and the computation stops as soon as the bound
+        is exceeded for all the remaining alignments.
         """
         str1 = self.value
-        import numpy
-        M = numpy.empty((len(str1) + 1, len(str2) + 1), int)
-
-        for a in range(0, len(str1)+1):
-            M[a, 0] = a
-        for b in range(0, len(str2)+1):
-            M[0, b] = b
-
-        for a in range(1, len(str1)+1):  # (size_t a = 1; a <= NA; ++a):
-            for b in range(1, len(str2)+1):  # (size_t b = 1; b <= NB; ++b)
-                z = M[a-1, b-1] + (0 if str1[a-1] == str2[b-1] else 1)
-                M[a, b] = min(min(M[a-1, b] + 1, M[a, b-1] + 1), z)
-
-        return M[len(str1), len(str2)]
+        if str1 == str2:
+            return 0
+        # the distance cannot exceed the length of the longer string
+        if len(str1) < len(str2):
+            str1, str2 = str2, str1
+        len1, len2 = len(str1), len(str2)
+        bound = len1 if max_distance is None else min(max_distance, len1)
+        exceeded = bound + 1
+        if len1 - len2 > bound:
+            return exceeded
+        if len2 == 0:
+            return len1
+
+        # only two rows of the matrix are kept and cells outside of the band
+        # are at least as far as their diagonal offset, i.e. beyond the bound
+        previous = [b if b <= bound else exceeded for b in range(len2 + 1)]
+        current = [exceeded] * (len2 + 1)
+        for a in range(1, len1 + 1):
+            low, high = max(1, a - bound), min(len2, a + bound)
+            current[low - 1] = a if low == 1 and a <= bound else exceeded
+            if high < len2:
+                current[high + 1] = exceeded
+            char1 = str1[a - 1]
+            row_min = current[low - 1]
+            for b in range(low, high + 1):
+                value = previous[b - 1] + (char1 != str2[b - 1])
+                if previous[b] + 1 < value:
+                    value = previous[b] + 1
+                if current[b - 1] + 1 < value:
+                    value = current[b - 1] + 1
+                current[b] = value if value < exceeded else exceeded
+                if value < row_min:
+                    row_min = value
+            # the distance can only grow from the best alignment so far
+            if row_min > bound:
+                return exceeded
+            previous, current = current, previous
+
+        return previous[len2]
+
+    def distances_to(self, strings, max_distance=None):
+        """
+        Approximate Hungarian distance to multiple strings.
+
+        :param strings: strings to compare to
+        :type strings: [str]
+        :param max_distance: largest distance of interest or None for no bound
+        :type max_distance: int or None
+        :returns: string distance values with `max_distance + 1` for all
+                  distances larger than the bound
+        :rtype: [int]
+        """
+        return [self.distance_to(str2, max_distance) for str2 in strings]
+
+    def similarities_to(self, strings, min_similarity=0.0):
+        """
+        Similarity to multiple strings based on their Hungarian distance.
+
+        :param strings: strings to compare to
+        :type strings: [str]
+        :param float min_similarity: smallest similarity of interest
+        :returns: similarity values in the [0, 1] interval which are exact
+                  if they reach the minimal similarity and only guaranteed
+                  to be below it otherwise
+        :rtype: [float]
+
+        The distance to each string is bounded according to the length of
+        the two strings so that no computation is spent on strings that can
+        no longer reach the required similarity.
+        """
+        import math
+        similarities = []
+        for str2 in strings:
+            length = max(len(self.value), len(str2))
+            if length == 0:
+                similarities.append(1.0)
+                continue
+            # round up the allowed distance to stay on the safe side
+            max_distance = math.ceil((1.0 - min_similarity) * length)
+            distance = self.distance_to(str2, max_distance)
+            similarities.append(1.0 - float(distance) / length)
+        return similarities
 
 
 class Pattern(Target):
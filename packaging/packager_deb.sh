@@ -35,7 +35,7 @@ pip3 install torch==2.0.1 torchvision==0.15.2
 # screen controlling
 pip3 install autopy==4.0.0
 pip3 install vncdotool==0.12.0
-apt-get -y install xdotool x11-apps imagemagick
+apt-get -y install xdotool x11-apps imagemagick python3-xlib
 apt-get -y install python3-tk scrot
 pip3 install pyautogui==0.9.53
 apt-get -y install x11vnc
@@ -28,7 +28,7 @@ else
     export DISABLE_AUTOPY=1
 fi
 pip3 install vncdotool==0.12.0
-dnf -y install xdotool xwd ImageMagick
+dnf -y install xdotool xwd ImageMagick python3-xlib
 # NOTE: PyAutoGUI's scrot dependencies are broken on Fedora 33- so we don't support these
 dnf -y install python3-tkinter scrot
 pip3 install pyautogui==0.9.53
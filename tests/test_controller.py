@@ -20,6 +20,7 @@ import time
 import shutil
 import unittest
 import subprocess
+from unittest import mock
 
 import common_test
 from guibot.errors import *
@@ -85,6 +86,11 @@ class ControllerTest(unittest.TestCase):
             self.backends += [AutoPyController()]
         if os.environ.get('DISABLE_XDOTOOL', "0") == "0":
             self.backends += [XDoToolController()]
+            # also test the persistent X11 session alternative
+            xdotool = XDoToolController(synchronize=False)
+            xdotool.params["xdotool"]["persistent"] = True
+            xdotool.synchronize_backend()
+            self.backends += [xdotool]
         if os.environ.get('DISABLE_PYAUTOGUI', "0") == "0":
             self.backends += [PyAutoGUIController()]
         if os.environ.get('DISABLE_VNCDOTOOL', "0") == "0":
@@ -92,6 +98,12 @@ class ControllerTest(unittest.TestCase):
             vncdotool.params["vncdotool"]["vnc_password"] = self.vncpass
             vncdotool.synchronize_backend()
             self.backends += [vncdotool]
+            # also test the incremental framebuffer alternative
+            vncdotool = VNCDoToolController(synchronize=False)
+            vncdotool.params["vncdotool"]["vnc_password"] = self.vncpass
+            vncdotool.params["vncdotool"]["vnc_incremental"] = True
+            vncdotool.synchronize_backend()
+            self.backends += [vncdotool]
 
     def tearDown(self):
         self.close_windows()
@@ -206,6 +218,79 @@ class ControllerTest(unittest.TestCase):
             self.assertEqual(320, captured.width)
             self.assertEqual(200, captured.height)
 
+    def test_capture_region_data(self):
+        """Check that region screendumps contain the same data as fullscreen ones."""
+        for display in self.backends:
+            full_capture = display.capture_screen()
+            captured = display.capture_screen(20, 10, 64, 48)
+            self.assertEqual(full_capture.pil_image.crop((20, 10, 84, 58)).tobytes(),
+                             captured.pil_image.tobytes())
+
+    def test_detect_changes(self):
+        """Check detection of changed screen regions for all display controller backends."""
+        for display in self.backends:
+            self.assertIsNone(display.detect_changes(None, display.capture_screen()))
+
+            previous = display.capture_screen(0, 0, 200, 100)
+            current = display.capture_screen(0, 0, 200, 100)
+            self.assertEqual([], display.detect_changes(previous, current))
+
+            self.show_application()
+            current = display.capture_screen(0, 0, 200, 100)
+            changes = display.detect_changes(previous, current)
+            self.assertGreater(len(changes), 0)
+            for x, y, width, height in changes:
+                self.assertLessEqual(x + width, 200)
+                self.assertLessEqual(y + height, 100)
+            self.close_windows()
+
+    def test_wait_for_change(self):
+        """Check waiting for screen changes for all display controller backends."""
+        for display in self.backends:
+            previous = display.capture_screen(0, 0, 200, 100)
+            start = time.time()
+            capture, changes = display.wait_for_change(previous, 1.0, 0, 0, 200, 100)
+            self.assertGreaterEqual(time.time() - start, 1.0)
+            self.assertEqual([], changes)
+            self.assertEqual(200, capture.width)
+            self.assertEqual(100, capture.height)
+
+            self.child_app = subprocess.Popen(['python3', self.script_app])
+            capture, changes = display.wait_for_change(previous, 10, 0, 0, 200, 100)
+            self.assertGreater(len(changes), 0)
+            self.close_windows()
+
+    @unittest.skipIf(os.environ.get('DISABLE_VNCDOTOOL', "0") == "1", "VNCDoTool disabled")
+    def test_capture_changes(self):
+        """Check tracking of changed screen rectangles with incremental framebuffer updates."""
+        display = VNCDoToolController(synchronize=False)
+        display.params["vncdotool"]["vnc_password"] = self.vncpass
+        display.params["vncdotool"]["vnc_incremental"] = True
+        display.synchronize_backend()
+        try:
+            display.capture_screen(0, 0, 320, 200)
+            self.assertEqual([(0, 0, 320, 200)], display.last_changes)
+            captured = display.capture_screen(10, 10, 100, 100)
+            self.assertEqual(100, captured.width)
+            self.assertEqual(100, captured.height)
+            for change in display.last_changes:
+                self.assertEqual(4, len(change))
+
+            # newly requested regions are fully refreshed
+            display.capture_screen(300, 180, 100, 100)
+            self.assertEqual([(300, 180, 100, 100)], display.last_changes)
+        finally:
+            display._backend_obj.disconnect()
+
+        display = VNCDoToolController(synchronize=False)
+        display.params["vncdotool"]["vnc_password"] = self.vncpass
+        display.synchronize_backend()
+        try:
+            display.capture_screen()
+            self.assertIsNone(display.last_changes)
+        finally:
+            display._backend_obj.disconnect()
+
     def test_capture_clipping(self):
         """Check screendump clipping for all display controller backends."""
         for display in self.backends:
@@ -347,5 +432,26 @@ class ControllerTest(unittest.TestCase):
                 self.child_app = None
 
 
+
+class XDoToolFallbackTest(unittest.TestCase):
+
+    def test_persistent_without_xlib(self):
+        """Check that a persistent xdotool controller works with processes if Xlib is missing."""
+        outputs = {"getdisplaygeometry": b"1024 768", "getmouselocation": b"x:10 y:20"}
+        def check_output(process, shell=False):
+            return outputs.get(process[1], b"")
+
+        display = XDoToolController(synchronize=False)
+        display.params["xdotool"]["persistent"] = True
+        with mock.patch.dict("sys.modules", {"Xlib": None}), \
+                mock.patch("subprocess.check_output", side_effect=check_output) as process:
+            display.synchronize_backend()
+            self.assertEqual((display.width, display.height), (1024, 768))
+
+            process.reset_mock()
+            display.keys_type("a", [display.keymap.CTRL])
+            commands = [call.args[0][1] for call in process.call_args_list]
+            self.assertEqual(commands, ["keydown", "type", "keyup"])
+
 if __name__ == '__main__':
     unittest.main()
@@ -286,6 +286,63 @@ class FinderTest(unittest.TestCase):
                 shutil.rmtree(self.logpath)
                 i += 1
 
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_contour_shapes(self):
+        """Test for vectorized shape matching identical to pairwise shape matching."""
+        import cv2
+        finder = ContourFinder()
+        needle_contours = finder._extract_contours(finder._binarize_image(Image('shape_blue_circle').gray_image))
+        haystack_contours = finder._extract_contours(finder._binarize_image(Image('all_shapes').gray_image))
+        _, ninvariants = finder._describe_contours(needle_contours)
+        _, hinvariants = finder._describe_contours(haystack_contours)
+        for method in (1, 2, 3):
+            distances = finder._match_shapes(hinvariants, ninvariants, method)
+            expected = [[cv2.matchShapes(hcontour, ncontour, method, 0) for ncontour in needle_contours]
+                        for hcontour in haystack_contours]
+            self.assertEqual(distances.tolist(), expected)
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_contour_assignment(self):
+        """Test for injective assignment of haystack to needle contours for multiple matches."""
+        import numpy
+        finder = ContourFinder()
+        distances = numpy.array([[0.0, 0.5], [0.1, 0.0], [0.2, 0.3], [0.9, 0.9]])
+        self.assertEqual(finder._assign_contours(distances, 0.3), [([0, 1], 0.0)])
+        self.assertEqual(finder._assign_contours(distances, 0.6), [([0, 1], 0.0), ([2, 3], 0.55)])
+        # assigned contours can only be reused at the distance of a crossed out contour
+        self.assertEqual(finder._assign_contours(numpy.array([[0.0, 0.0], [0.5, 2.0]]), 0.9),
+                         [([0, 0], 0.55), ([1, 0], 0.8)])
+        self.assertEqual(finder._assign_contours(numpy.zeros((0, 2)), 1.0), [])
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_contour_cache(self):
+        """Test for reuse of needle contours across matching attempts."""
+        finder = ContourFinder()
+        finder.params["find"]["similarity"].value = 0.99
+        finder.params["contour"]["minArea"].value = 100
+        ContourFinder._cache.clear()
+        expected = finder.find(Image('shape_blue_circle'), Image('all_shapes'))
+        matches = finder.find(Image('shape_blue_circle'), Image('all_shapes'))
+        self.assertEqual(len(ContourFinder._cache), 1)
+        self.assertEqual([(m.x, m.y, m.width, m.height) for m in matches],
+                         [(m.x, m.y, m.width, m.height) for m in expected])
+
+        # configuration changes result in new needle contours
+        finder.configure_backend("canny", "threshold")
+        finder.find(Image('shape_blue_circle'), Image('all_shapes'))
+        self.assertEqual(len(ContourFinder._cache), 2)
+
+        # only the most recently used needle contours are kept
+        ContourFinder._cache_size = 1
+        try:
+            finder = ContourFinder()
+            finder.params["find"]["similarity"].value = 0.99
+            finder.params["contour"]["minArea"].value = 100
+            finder.find(Image('shape_green_box'), Image('all_shapes'))
+            self.assertEqual(len(ContourFinder._cache), 1)
+        finally:
+            ContourFinder._cache_size = 64
+
     @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
     def test_template_same(self):
         """Test for successful match of same images for all template CV backends."""
@@ -398,6 +455,121 @@ class FinderTest(unittest.TestCase):
             self.assertRegex(hotmap, ".*-\d\.\d+.*")
             self.assertTrue(os.path.isfile(os.path.join(self.logpath, hotmap)))
 
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_template_max_matches(self):
+        """Test for limited number of multiple matches for default template CV backend."""
+        finder = TemplateFinder()
+        matches = finder.find(Image('shape_red_box'), Image('all_shapes'))
+        self.assertEqual(len(matches), 3)
+
+        limited_matches = finder.find(Image('shape_red_box'), Image('all_shapes'), max_matches=2)
+        self.assertEqual(len(limited_matches), 2)
+        for match, limited_match in zip(matches, limited_matches):
+            self.assertEqual((match.x, match.y), (limited_match.x, limited_match.y))
+            self.assertEqual(match.similarity, limited_match.similarity)
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_template_nosimilarity(self):
+        """Test for a single rectified match without similarity requirement."""
+        import numpy
+        import PIL.Image
+        finder = TemplateFinder()
+        finder.configure_backend("ccoeff_normed", "template")
+        finder.params["find"]["similarity"].value = 0.0
+        needle = Image('shape_blue_circle')
+        # an inverted haystack of the needle size has only negative correlation
+        inverted = PIL.Image.fromarray(255 - needle.numpy_image)
+        matches = finder.find(needle, Image(None, inverted))
+        self.assertEqual(len(matches), 1)
+        self.assertEqual((matches[0].x, matches[0].y), (0, 0))
+        self.assertEqual(matches[0].similarity, 0.0)
+
+        result = numpy.zeros((3, 4), dtype=numpy.float32)
+        self.assertEqual(finder._extract_maxima(result, needle, 0.0, 1), [((0, 0), 0.0)])
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_template_batch(self):
+        """Test for multiple needles matched against the same haystack."""
+        finder = TemplateFinder()
+        needles = [Image('shape_blue_circle'), Image('shape_red_box'), Image('n_ibs')]
+        haystack = Image('all_shapes')
+
+        batch_matches = finder.find_batch(needles, haystack)
+        self.assertEqual(len(batch_matches), len(needles))
+        for needle, matches in zip(needles, batch_matches):
+            expected = finder.find(needle, Image('all_shapes'))
+            self.assertEqual(len(matches), len(expected))
+            for match, other in zip(matches, expected):
+                self.assertEqual((match.x, match.y), (other.x, other.y))
+                self.assertEqual(match.similarity, other.similarity)
+        self.assertEqual([len(m) for m in batch_matches], [1, 3, 0])
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_template_pyramid(self):
+        """Test for coarse-to-fine matches identical to the exhaustive ones."""
+        finder = TemplateFinder()
+        for template in ["sqdiff_normed", "ccorr_normed", "ccoeff_normed"]:
+            finder.configure_backend(template, "template")
+            for needle in ['shape_blue_circle', 'shape_red_box']:
+                finder.params["template"]["pyramid_levels"].value = 0
+                expected = finder.find(Image(needle), Image('all_shapes'))
+                finder.params["template"]["pyramid_levels"].value = 2
+                matches = finder.find(Image(needle), Image('all_shapes'))
+
+                # perfect matches of equal similarity could come in any order
+                self.assertEqual(len(matches), len(expected))
+                matches = sorted(matches, key=lambda m: (m.x, m.y))
+                expected = sorted(expected, key=lambda m: (m.x, m.y))
+                for match, other in zip(matches, expected):
+                    self.assertEqual((match.x, match.y), (other.x, other.y))
+                    self.assertEqual((match.width, match.height), (other.width, other.height))
+                    self.assertAlmostEqual(match.similarity, other.similarity, places=5)
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_template_changes(self):
+        """Test for rematching of changed haystack regions identical to full matching."""
+        finder = TemplateFinder()
+        needle = Image('shape_blue_circle')
+        haystack = Image('all_shapes')
+        x, y, w, h = 104, 10, 165, 151
+        # move the circle to the left and wipe its old position (most of the haystack changes)
+        moved = haystack.numpy_image.copy()
+        moved[y:y+h, x-60:x-60+w] = moved[y:y+h, x:x+w].copy()
+        moved[y:y+h, x-60+w:x+w] = 255
+        # cover a small part of the circle
+        covered = haystack.numpy_image.copy()
+        covered[y+20:y+30, x+40:x+50] = 0
+        changes = {"moved": (Image(numpy_image=moved), [(x - 60, y, w + 60, h)]),
+                   "covered": (Image(numpy_image=covered), [(x + 40, y + 20, 10, 10)])}
+
+        for template in ["sqdiff_normed", "ccorr_normed", "ccoeff_normed"]:
+            finder.configure_backend(template, "template")
+            for changed, rectangles in changes.values():
+                expected = finder.find(needle, changed)
+                finder.find(needle, haystack)
+                matches = finder.find(needle, changed, changes=rectangles, previous=haystack)
+
+                self.assertEqual(len(matches), len(expected))
+                for match, other in zip(matches, expected):
+                    self.assertEqual((match.x, match.y), (other.x, other.y))
+                    self.assertAlmostEqual(match.similarity, other.similarity, places=5)
+
+                # no changes should result in the same matches
+                matches = finder.find(needle, changed, changes=[], previous=changed)
+                self.assertEqual([(m.x, m.y) for m in matches], [(m.x, m.y) for m in expected])
+
+            # changes relative to another haystack than the last matched one are not reused
+            moved, _ = changes["moved"]
+            covered = haystack.numpy_image.copy()
+            covered[y:y+10, x+116:x+126] = 0
+            covered, rectangles = Image(numpy_image=covered), [(x + 116, y, 10, 10)]
+            expected = finder.find(needle, covered)
+            finder.find(needle, moved)
+            matches = finder.find(needle, covered, changes=rectangles, previous=haystack)
+            self.assertEqual([(m.x, m.y) for m in matches], [(m.x, m.y) for m in expected])
+            for match, other in zip(matches, expected):
+                self.assertAlmostEqual(match.similarity, other.similarity, places=5)
+
     @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
     def test_feature_same(self):
         """Test for successful match of same images for all feature CV backends."""
@@ -484,6 +656,115 @@ class FinderTest(unittest.TestCase):
                         shutil.rmtree(self.logpath)
                         i += 1
 
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_feature_cache(self):
+        """Test for reuse of needle features and feature backends across matching attempts."""
+        finder = FeatureFinder()
+        finder.params["find"]["similarity"].value = 0.25
+        FeatureFinder._cache.clear()
+        expected = finder.find(Image('n_ibs'), Image('h_ibs_scaled'))
+        self.assertEqual(len(FeatureFinder._cache), 1)
+        detector, extractor, matcher = finder.detector, finder.extractor, finder.matcher
+
+        matches = finder.find(Image('n_ibs'), Image('h_ibs_scaled'))
+        self.assertEqual(len(FeatureFinder._cache), 1)
+        self.assertIs(finder.detector, detector)
+        self.assertIs(finder.extractor, extractor)
+        self.assertIs(finder.matcher, matcher)
+        self.assertEqual([(m.x, m.y, m.width, m.height) for m in matches],
+                         [(m.x, m.y, m.width, m.height) for m in expected])
+
+        # configuration changes result in new backends and needle features
+        finder.params["fdetect"]["nzoom"].value = 2.0
+        finder.find(Image('n_ibs'), Image('h_ibs_scaled'))
+        self.assertEqual(len(FeatureFinder._cache), 2)
+        self.assertIsNot(finder.detector, detector)
+
+        # only the most recently used needle features are kept
+        FeatureFinder._cache_size = 1
+        try:
+            finder.params["fdetect"]["nzoom"].value = 3.0
+            finder.find(Image('n_ibs'), Image('h_ibs_scaled'))
+            self.assertEqual(len(FeatureFinder._cache), 1)
+        finally:
+            FeatureFinder._cache_size = 64
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_feature_frame_cache(self):
+        """Test for reuse of haystack features across needles matched on the same haystack."""
+        finder = FeatureFinder()
+        finder.params["find"]["similarity"].value = 0.25
+        FeatureFinder._frame_cache.clear()
+        haystack = Image('h_ibs_scaled')
+        expected = finder.find(Image('n_ibs'), haystack)
+        finder.find(Image('shape_blue_circle'), haystack)
+        self.assertEqual(len(FeatureFinder._frame_cache), 1)
+
+        # identical haystack content from another capture is also reused
+        matches = finder.find(Image('n_ibs'), Image(numpy_image=haystack.numpy_image.copy()))
+        self.assertEqual(len(FeatureFinder._frame_cache), 1)
+        self.assertEqual([(m.x, m.y, m.width, m.height) for m in matches],
+                         [(m.x, m.y, m.width, m.height) for m in expected])
+
+        finder.find(Image('n_ibs'), Image('h_ibs_rotated'))
+        self.assertEqual(len(FeatureFinder._frame_cache), 2)
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_feature_projection(self):
+        """Test for projection of multiple needle locations with a single transform."""
+        import numpy
+        finder = FeatureFinder()
+        finder.imglog.hotmaps = [numpy.zeros((100, 100, 3), numpy.uint8)] * 4
+        finder.imglog.similarities = [0.0]
+        needle_points = numpy.array([(x, y) for x in range(0, 50, 10) for y in range(0, 50, 7)],
+                                    dtype=numpy.float32)
+        haystack_points = needle_points * 2 + numpy.array([10, 20], dtype=numpy.float32)
+        projected, inliers = finder._project_locations([(0, 0), (5, 5), (40, 30)],
+                                                       needle_points, haystack_points)
+        self.assertEqual(projected, [(10, 20), (20, 30), (90, 80)])
+        self.assertTrue(inliers.all())
+        self.assertEqual(finder.imglog.similarities[-1], 1.0)
+        self.assertEqual(finder.imglog.locations, projected)
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_feature_multiple(self):
+        """Test for projection of multiple needle instances from the same features."""
+        import numpy
+        needle = Image('n_ibs')
+        haystack = numpy.full((320, 480, 3), 255, numpy.uint8)
+        haystack[20:20 + needle.height, 30:30 + needle.width] = needle.numpy_image
+        haystack[40:40 + needle.height, 260:260 + needle.width] = needle.numpy_image
+
+        finder = FeatureFinder()
+        finder.params["find"]["similarity"].value = 0.25
+        finder.params["feature"]["maxInstances"].value = 3
+        matches = finder.find(needle, Image(numpy_image=haystack))
+        self.assertEqual(len(matches), 2)
+        matches = sorted(matches, key=lambda m: m.x)
+        for match, (x, y) in zip(matches, [(30, 20), (260, 40)]):
+            self.assertAlmostEqual(match.x, x, delta=5)
+            self.assertAlmostEqual(match.y, y, delta=5)
+            self.assertAlmostEqual(match.width, needle.width, delta=5)
+            self.assertAlmostEqual(match.height, needle.height, delta=5)
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_feature_symmetry(self):
+        """Test for successful match of scaled images with a symmetry test for matches."""
+        finder = FeatureFinder()
+        finder.params["find"]["similarity"].value = 0.25
+        finder.params["fmatch"]["symmetryTest"].value = True
+        matches = finder.find(Image('n_ibs'), Image('h_ibs_scaled'))
+        self.assertEqual(len(matches), 1)
+        self.assertAlmostEqual(matches[0].x, 39, delta=5)
+        self.assertAlmostEqual(matches[0].y, 220, delta=5)
+        self.assertAlmostEqual(matches[0].width, 100, delta=10)
+        self.assertAlmostEqual(matches[0].height, 150, delta=10)
+
+        # the ratio test is too strict for this case
+        finder.params["fmatch"]["ratioTest"].value = True
+        matches = finder.find(Image('n_ibs'), Image('h_ibs_scaled'))
+        self.assertEqual(len(matches), 0)
+
     @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
     def test_feature_scaling(self):
         """Test for successful match of scaled images for default feature CV backend."""
@@ -569,6 +850,49 @@ class FinderTest(unittest.TestCase):
         self.assertAlmostEqual(matches[0].width, 165, delta=5)
         self.assertAlmostEqual(matches[0].height, 165, delta=5)
 
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_cascade_batch(self):
+        """Test for multiple cascades detected on the same haystack."""
+        finder = CascadeFinder()
+        needles = [Pattern('shape_blue_circle.xml'), Pattern('n_ibs.xml')]
+
+        batch_matches = finder.find_batch(needles, Image('all_shapes'))
+        self.assertEqual([len(m) for m in batch_matches], [1, 0])
+        expected = finder.find(needles[0], Image('all_shapes'))
+        self.assertEqual((batch_matches[0][0].x, batch_matches[0][0].y),
+                         (expected[0].x, expected[0].y))
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_cascade_cache(self):
+        """Test for reuse of loaded cascades until their file is modified."""
+        import tempfile
+        finder = CascadeFinder()
+        data_file = Pattern('shape_blue_circle.xml').data_file
+        cascade = finder._load_cascade(data_file)
+        self.assertIs(finder._load_cascade(data_file), cascade)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, 'shape_blue_circle.xml')
+            shutil.copy(data_file, tmp_file)
+            tmp_cascade = finder._load_cascade(tmp_file)
+            self.assertIsNot(tmp_cascade, cascade)
+            self.assertIs(finder._load_cascade(tmp_file), tmp_cascade)
+            stat = os.stat(tmp_file)
+            os.utime(tmp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertIsNot(finder._load_cascade(tmp_file), tmp_cascade)
+
+            # only the most recently used cascades are kept
+            CascadeFinder._cache.clear()
+            CascadeFinder._cache_size = 1
+            try:
+                cascade = finder._load_cascade(data_file)
+                tmp_cascade = finder._load_cascade(tmp_file)
+                self.assertEqual(len(CascadeFinder._cache), 1)
+                self.assertIs(finder._load_cascade(tmp_file), tmp_cascade)
+                self.assertIsNot(finder._load_cascade(data_file), cascade)
+            finally:
+                CascadeFinder._cache_size = 16
+
     @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
     def test_cascade_rotation(self):
         """Test for successful match of rotated images for the cascade CV backend."""
@@ -792,6 +1116,177 @@ class FinderTest(unittest.TestCase):
         self.assertAlmostEqual(matches[0].width, 120, delta=5)
         self.assertAlmostEqual(matches[0].height, 10, delta=5)
 
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1" or
+                     os.environ.get('DISABLE_OCR', "0") == "1",
+                     "Disabled OpenCV or OCR")
+    def test_text_workers(self):
+        """Test for identical OCR preprocessing and output of text regions by multiple workers."""
+        finder = TextFinder(synchronize=False)
+        finder.configure_backend("contours", "tdetect")
+        finder.configure_backend("tesseract", "ocr")
+        finder.synchronize_backend("tesseract", "ocr")
+        finder.params["ocr"]["binarize_text"].value = True
+        finder.params["ocr"]["erode_dilate"].value = 2
+        haystack = Image('sentence_sans').numpy_image
+        text_regions = [(0, 0, 50, 20), (10, 5, 40, 15), (30, 2, 60, 20), (5, 8, 20, 10)]
+
+        finder.params["ocr"]["workers"].value = 1
+        images, outputs = finder._recognize_text(haystack, text_regions)
+        finder.params["ocr"]["workers"].value = 3
+        pool_images, pool_outputs = finder._recognize_text(haystack, text_regions)
+        self.assertEqual(len(pool_images), len(text_regions))
+        self.assertEqual([i.tolist() for i in pool_images], [i.tolist() for i in images])
+        self.assertEqual(pool_outputs, outputs)
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1" or
+                     os.environ.get('DISABLE_OCR', "0") == "1",
+                     "Disabled OpenCV or OCR")
+    def test_text_cache(self):
+        """Test for reuse of detected and recognized text across text needles on the same haystack."""
+        finder = TextFinder(synchronize=False)
+        finder.configure_backend("contours", "tdetect")
+        finder.configure_backend("tesseract", "ocr")
+        finder.synchronize_backend("tesseract", "ocr")
+        TextFinder._frame_cache.clear()
+        finder.find(Text('Text'), Image('all_shapes'))
+        finder.find(Text('Nothing'), Image('all_shapes'))
+        self.assertEqual(len(TextFinder._frame_cache), 1)
+
+        finder.find(Text('Text'), Image('sentence_sans'))
+        self.assertEqual(len(TextFinder._frame_cache), 2)
+        # configuration changes result in new text reading
+        finder.params["ocr"]["zoom_factor"].value = 2.0
+        finder.find(Text('Text'), Image('all_shapes'))
+        self.assertEqual(len(TextFinder._frame_cache), 3)
+
+        # hotmaps are cached only if they could be logged
+        GlobalConfig.image_logging_level = 40
+        finder.find(Text('Text'), Image('sentence_sans'))
+        self.assertEqual(len(TextFinder._frame_cache), 4)
+        self.assertIsNone(list(TextFinder._frame_cache.values())[-1][4])
+        GlobalConfig.image_logging_level = 0
+        finder.find(Text('Text'), Image('sentence_sans'))
+        self.assertEqual(len(TextFinder._frame_cache), 4)
+        self.assertIsNotNone(list(TextFinder._frame_cache.values())[-1][4])
+
+    def test_text_index(self):
+        """Test for lookup of sufficiently similar text in an index of recognized text."""
+        finder = TextFinder(configure=False, synchronize=False)
+        outputs = ["Find the word", "here", "Text", ""]
+        index = finder._index_text(outputs)
+        self.assertEqual(finder._lookup_text("Text", outputs, index, 1.0), [2])
+        self.assertEqual(finder._lookup_text("Txt", outputs, index, 0.75), [2])
+        self.assertEqual(finder._lookup_text("Find the wort", outputs, index, 0.9), [0])
+        self.assertEqual(finder._lookup_text("Text", outputs, index, 0.0), [0, 1, 2, 3])
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_text_tiles(self):
+        """Test for tiling of text regions on one page and splitting of its recognized text."""
+        import numpy
+        finder = TextFinder(configure=False, synchronize=False)
+        text_images = [numpy.zeros((30, 100), numpy.uint8),
+                       numpy.zeros((50, 60, 3), numpy.uint8)]
+        page, tiles = finder._tile_text_images(text_images, margin=10)
+        self.assertEqual(page.shape, (110, 120))
+        self.assertEqual(tiles, [(10, 40), (50, 100)])
+        self.assertEqual(page[5, 5], 255)
+        self.assertEqual(page[20, 20], 0)
+        self.assertEqual(page[60, 90], 255)
+
+        # words of the page in reading order as output by tesseract
+        data = {"text": ["", "Find", "the", "word", "", "here", "stray"],
+                "top": [0, 12, 12, 25, 50, 60, 102],
+                "height": [110, 10, 10, 10, 50, 20, 6],
+                "block_num": [1, 1, 1, 1, 2, 2, 3],
+                "par_num": [0, 1, 1, 1, 1, 1, 1],
+                "line_num": [0, 1, 1, 2, 0, 1, 1]}
+        outputs = finder._split_tiled_text(data, tiles)
+        self.assertEqual(outputs, ["Find the\nword", "here"])
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_text_tiles_psmode(self):
+        """Test for tiling of text regions only with page segmentation modes."""
+        import numpy
+        from unittest.mock import Mock
+        finder = TextFinder(configure=False, synchronize=False)
+        finder.configure_backend("pytesseract", "ocr")
+        self.assertFalse(finder.params["ocr"]["batch_regions"].value)
+        finder.params["ocr"]["batch_regions"].value = True
+        finder.ocr, finder.ocr_config = Mock(), ""
+        finder.ocr.image_to_string.return_value = "line"
+        finder.ocr.image_to_data.return_value = {"text": [], "top": [], "height": [],
+                                                 "block_num": [], "par_num": [], "line_num": []}
+        haystack = numpy.full((100, 200, 3), 255, numpy.uint8)
+        text_regions = [(10, 10, 80, 20), (10, 50, 80, 20)]
+
+        # single line mode cannot segment the tiled page
+        finder.params["ocr"]["psmode"].value = 7
+        _, outputs = finder._recognize_text(haystack, text_regions)
+        self.assertEqual(outputs, ["line", "line"])
+        self.assertEqual(finder.ocr.image_to_string.call_count, 2)
+        finder.ocr.image_to_data.assert_not_called()
+
+        finder.params["ocr"]["psmode"].value = 3
+        _, outputs = finder._recognize_text(haystack, text_regions)
+        self.assertEqual(outputs, ["", ""])
+        self.assertEqual(finder.ocr.image_to_string.call_count, 2)
+        finder.ocr.image_to_data.assert_called_once()
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_text_grouping(self):
+        """Test for grouping of character regions into horizontal and vertical text regions."""
+        finder = TextFinder(configure=False, synchronize=False)
+        finder.configure_backend("contours", "tdetect")
+        finder.params["tdetect"]["minChars"].value = 2
+        # two lines of three characters and a column continuing the second line
+        char_regions = [[x, y, 6, 10] for y in (0, 40) for x in (0, 8, 16)]
+        char_regions += [[16, 55, 6, 10], [16, 70, 6, 10]]
+        char_regions = sorted(char_regions, key=lambda x: x[0])
+
+        text_regions = finder._group_text_characters(char_regions)
+        self.assertEqual(text_regions, [[0, 0, 22, 10], [0, 40, 22, 10]])
+        finder.params["tdetect"]["orientation"].value = 1
+        text_regions = finder._group_text_characters(char_regions)
+        self.assertEqual(text_regions, [[16, 40, 6, 40]])
+        finder.params["tdetect"]["minChars"].value = 0
+        text_regions = finder._group_text_characters(char_regions)
+        self.assertEqual(text_regions, [[0, 0, 14, 10], [0, 40, 14, 10], [16, 0, 6, 10], [16, 40, 6, 40]])
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_text_east_regions(self):
+        """Test for decoding and suppression of text regions from EAST outputs."""
+        import numpy
+        finder = TextFinder(configure=False, synchronize=False)
+        finder.configure_backend("east", "tdetect")
+        probability = numpy.zeros((1, 1, 80, 80), numpy.float32)
+        geometry = numpy.zeros((1, 5, 80, 80), numpy.float32)
+        # two overlapping boxes of different confidence and a separate one
+        for row, col, score in [(10, 10, 0.9), (10, 11, 0.85), (40, 50, 0.95), (60, 60, 0.5)]:
+            probability[0, 0, row, col] = score
+            geometry[0, :4, row, col] = (8, 20, 4, 20)
+
+        rects, confidences = finder._east_boxes(probability, geometry, 2.0, 1.0)
+        self.assertEqual(rects, [(48, 36, 80, 12), (56, 36, 80, 12), (368, 156, 80, 12)])
+        self.assertAlmostEqual(confidences[0], 0.9, places=5)
+
+        class FakeNet(object):
+            def setInput(self, inp):
+                self.inp = inp
+
+            def forward(self, layers):
+                return probability, geometry
+        finder.east_net = FakeNet()
+        haystack = Image('all_shapes')
+        text_regions = finder._detect_text_east(haystack)
+        rects, _ = finder._east_boxes(probability, geometry,
+                                      haystack.width / 320.0, haystack.height / 320.0)
+        # the less confident of the overlapping boxes is suppressed
+        self.assertEqual(text_regions, [rects[0], rects[2]])
+        buffers = finder._east_buffers
+        finder._detect_text_east(haystack)
+        self.assertIs(finder._east_buffers, buffers)
+        self.assertIs(finder.east_net.inp, buffers[1])
+
     @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
     def test_tempfeat_same(self):
         """Test for successful match of same images for the template-feature CV backend."""
@@ -947,6 +1442,30 @@ class FinderTest(unittest.TestCase):
         self.assertEqual(finder._cache[finder.params["deep"]["arch"].value],
                          finder.net)
 
+    @unittest.skipIf(os.environ.get('DISABLE_PYTORCH', "0") == "1", "PyTorch disabled")
+    def test_deep_detections(self):
+        """Test for detections of multiple haystacks shared by all pattern needles."""
+        finder = DeepFinder()
+        finder.params["find"]["similarity"].value = 0.95
+        DeepFinder._frame_cache.clear()
+
+        detections = finder.detect([Image('coco_cat'), Image('all_shapes'), Image('coco_cat')])
+        self.assertEqual(len(detections), 3)
+        self.assertIs(detections[0], detections[2])
+        self.assertEqual(len(DeepFinder._frame_cache), 2)
+        labels, scores, boxes = detections[0]
+        self.assertEqual(len(labels), len(scores))
+        self.assertEqual(boxes.shape, (len(labels), 4))
+
+        # no further inference is needed for already detected haystacks
+        net, finder.net = finder.net, None
+        try:
+            matches = finder.find(Pattern('cat'), Image('coco_cat'))
+            self.assertEqual(len(matches), 1)
+            self.assertEqual(len(finder.find(Pattern('cat'), Image('all_shapes'))), 0)
+        finally:
+            finder.net = net
+
     @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "Disabled OpenCV")
     def test_hybrid_same(self):
         """Test for successful match of same images for default hybrid CV backend."""
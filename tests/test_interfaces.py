@@ -15,10 +15,13 @@
 # along with guibot.  If not, see <http://www.gnu.org/licenses/>.
 
 import sys
+import asyncio
 import inspect
 from unittest import main, mock, TestCase
 
 import common_test
+from guibot import errors
+from guibot.config import TemporaryConfig
 
 
 class SimpleAPITest(TestCase):
@@ -95,7 +98,7 @@ class ProxyAPITest(TestCase):
 
             func(self.interface, args, kwargs)
 
-            if funcname != "find_all":
+            if funcname not in ["find_all", "find_each"]:
                 self.interface._proxify.assert_called_once()
             method_calls = mock_super.return_value.method_calls
             self.assertEqual(len(method_calls), 1)
@@ -106,5 +109,101 @@ class ProxyAPITest(TestCase):
             self.interface._proxify.reset_mock()
 
 
+class AsyncAPITest(TestCase):
+
+    def setUp(self):
+        from guibot.region import Region
+        from guibot.match import Match
+        from guibot.guibot_async import AsyncRegion
+        dc_backend = mock.MagicMock(width=0, height=0)
+        dc_backend.wait_for_change.return_value = (mock.MagicMock(), None)
+        cv_backend = mock.MagicMock()
+        cv_backend.find.return_value = [Match(10, 20, 30, 40, 0, 0, 1.0)]
+        self.region = Region(dc=dc_backend, cv=cv_backend)
+        self.interface = AsyncRegion(self.region)
+        self.target = mock.MagicMock(use_own_settings=False)
+
+    def test_find(self):
+        """Test that targets are found and waited for from an event loop."""
+        async def find_many():
+            return await asyncio.gather(self.interface.find(self.target),
+                                        self.interface.wait(self.target),
+                                        self.interface.exists(self.target))
+        matches = asyncio.run(find_many())
+        self.assertEqual([(m.x, m.y) for m in matches], [(10, 20)] * 3)
+        self.assertEqual(self.region.last_match.x, 10)
+
+        self.region.cv_backend.find.return_value = []
+        with TemporaryConfig() as config:
+            config.save_needle_on_error = False
+            self.assertIsNone(asyncio.run(self.interface.exists(self.target)))
+            with self.assertRaises(errors.FindError):
+                asyncio.run(self.interface.wait(self.target, timeout=0.5))
+        self.assertEqual(asyncio.run(self.interface.wait_vanish(self.target)), self.interface)
+
+    def test_find_concurrent(self):
+        """Test that concurrent waits on the same region use its finder one at a time."""
+        import threading
+        import time
+        from guibot.match import Match
+        lock, active, overlaps = threading.Lock(), [0], []
+        def find(*args, **kwargs):
+            with lock:
+                active[0] += 1
+                overlaps.append(active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return [Match(10, 20, 30, 40, 0, 0, 1.0)]
+        self.region.cv_backend.find.side_effect = find
+
+        async def wait_many():
+            return await asyncio.gather(self.interface.wait(self.target),
+                                        self.interface.wait(self.target))
+        matches = asyncio.run(wait_many())
+        self.assertEqual([(m.x, m.y) for m in matches], [(10, 20)] * 2)
+        self.assertGreaterEqual(len(overlaps), 2)
+        self.assertEqual(max(overlaps), 1)
+
+    def test_find_any(self):
+        """Test that any of a few targets is matched only for its best match and screen changes."""
+        from guibot.finder import TemplateFinder
+        from guibot.match import Match
+        self.region.cv_backend = mock.MagicMock(spec=TemplateFinder)
+        self.region.cv_backend.find.return_value = [Match(10, 20, 30, 40, 0, 0, 1.0)]
+        # the screen does not change after the first capture
+        self.region.dc_backend.wait_for_change.side_effect = \
+            lambda previous, *args: (mock.MagicMock(), None if previous is None else [])
+        other = mock.MagicMock(use_own_settings=False)
+
+        with TemporaryConfig() as config:
+            config.wait_for_animations = True
+            for find_any in [self.region.find_any,
+                             lambda *args: asyncio.run(self.interface.find_any(*args))]:
+                self.region.cv_backend.find.reset_mock()
+                target, match = find_any([self.target, other])
+                self.assertIs(target, self.target)
+                self.assertEqual((match.x, match.y), (10, 20))
+                self.assertEqual(self.region.cv_backend.find.call_count, 2)
+                for call in self.region.cv_backend.find.call_args_list:
+                    self.assertEqual(call.kwargs["max_matches"], 1)
+
+    def test_control_delegations(self):
+        """Test that targets are found before delegating the control to the region."""
+        from guibot.location import Location
+        self.region.click = mock.MagicMock()
+        match = asyncio.run(self.interface.click(self.target))
+        self.assertEqual((match.x, match.y), (10, 20))
+        self.region.click.assert_called_once_with(match, modifiers=None)
+
+        self.region.click.reset_mock()
+        self.assertIsNone(asyncio.run(self.interface.click(Location(1, 2))))
+        self.region.click.assert_called_once()
+
+        self.region.type_text = mock.MagicMock()
+        self.assertEqual(asyncio.run(self.interface.type_text("text")), self.interface)
+        self.region.type_text.assert_called_once_with("text", modifiers=None)
+
+
 if __name__ == '__main__':
     main()
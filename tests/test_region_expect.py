@@ -247,11 +247,71 @@ class RegionTest(unittest.TestCase):
         self.assertEqual(len(matches), 0)
         self.close_windows()
 
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1" or
+                     os.environ.get('DISABLE_PYQT', "0") == "1",
+                     "Disabled OpenCV or PyQt")
+    def test_find_any(self):
+        self.show_image('all_shapes')
+
+        target, match = self.region.find_any(['word', Image('shape_green_box'),
+                                              'shape_blue_circle'], timeout=0)
+        self.assertEqual(str(target), 'shape_green_box')
+        self.assertAlmostEqual(match.x, 30, delta=5)
+        self.assertAlmostEqual(match.y, 190, delta=5)
+        self.assertEqual(self.region.last_match.x, match.x)
+        self.assertEqual(self.region.last_match.y, match.y)
+
+        self.close_windows()
+        self.assertRaises(FindError, self.region.find_any,
+                          ['shape_blue_circle', 'shape_green_box'], timeout=0)
+
+    def test_find_any_in_animation(self):
+        """Test a switch where any moving match is actually matched when stopping."""
+        match_frames = [Match(0, 0, 10, 20, 0, 0, 1.0), Match(30, 30, 10, 20, 0, 0, 1.0),
+                        Match(30, 45, 10, 20, 0, 0, 1.0), Match(30, 45, 10, 20, 0, 0, 1.0)]
+        self.region.cv_backend.find = lambda x, y, **kwargs: [match_frames.pop(0)]
+
+        with TemporaryConfig() as config:
+            config.wait_for_animations = True
+            target, match = self.region.find_any(['shape_blue_circle'])
+            self.assertEqual(target, 'shape_blue_circle')
+            self.assertEqual(match.x, 30)
+            self.assertEqual(match.y, 45)
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "Disabled OpenCV")
+    def test_find_any_error(self):
+        """Test that the haystack and all needles are saved if none of them is found."""
+        with TemporaryConfig() as config:
+            config.save_needle_on_error = True
+            self.assertRaises(FindError, self.region.find_any,
+                              ['shape_blue_circle', Image('shape_green_box')], timeout=0)
+            dump_path = GlobalConfig.image_logging_destination
+            for filename in ["last_finderror_haystack.png", "last_finderror_needle1.png",
+                             "last_finderror_needle2.png"]:
+                self.assertTrue(os.path.exists(os.path.join(dump_path, filename)))
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1" or
+                     os.environ.get('DISABLE_PYQT', "0") == "1",
+                     "Disabled OpenCV or PyQt")
+    def test_find_each(self):
+        self.show_image('all_shapes')
+
+        targets = ['word', 'shape_green_box', Image('shape_red_box')]
+        matches = self.region.find_each(targets)
+        self.assertEqual(len(matches), 3)
+        self.assertEqual(len(matches['word']), 0)
+        self.assertEqual(len(matches['shape_green_box']), 1)
+        self.assertAlmostEqual(matches['shape_green_box'][0].x, 30, delta=5)
+        self.assertAlmostEqual(matches['shape_green_box'][0].y, 190, delta=5)
+        self.assertEqual(len(matches[targets[2]]), 3)
+
     def test_find_in_animation(self):
         """Test a switch where a moving match is actually matched when stopping."""
         match_frames = [Match(0, 0, 10, 20, 0, 0, 1.0), Match(30, 30, 10, 20, 0, 0, 1.0),
                         Match(30, 45, 10, 20, 0, 0, 1.0), Match(30, 45, 10, 20, 0, 0, 1.0)]
-        self.region.cv_backend.find = lambda x, y: [match_frames.pop(0)]
+        self.region.cv_backend.find = lambda x, y, **kwargs: [match_frames.pop(0)]
+        # the screen is static so pretend it is not to rematch each capture
+        self.region.dc_backend.detect_changes = lambda previous, current: None
 
         with TemporaryConfig() as config:
             config.wait_for_animations = True
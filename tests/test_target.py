@@ -156,6 +156,67 @@ class ImageTest(unittest.TestCase):
         third_image = Image(self.file_all_shapes)
         self.assertIsNot(image.pil_image, third_image.pil_image)
 
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_image_views(self):
+        """Test image target views of the image data converted only once."""
+        image = Image(self.file_all_shapes)
+
+        self.assertEqual(image.numpy_image.shape, (image.height, image.width, 3))
+        self.assertIs(image.numpy_image, image.numpy_image)
+        self.assertFalse(image.numpy_image.flags.writeable)
+
+        self.assertEqual(image.gray_image.shape, (image.height, image.width))
+        self.assertIs(image.gray_image, image.gray_image)
+        self.assertFalse(image.gray_image.flags.writeable)
+
+    def test_image_numpy(self):
+        """Test image target with numpy image data as primary storage."""
+        import numpy
+        data = numpy.array(Image(self.file_all_shapes).pil_image)
+        image = Image(numpy_image=data)
+
+        # the data is shared through a read-only view without changing its flags
+        self.assertTrue(numpy.shares_memory(image.numpy_image, data))
+        self.assertFalse(image.numpy_image.flags.writeable)
+        self.assertTrue(data.flags.writeable)
+        self.assertEqual(image.width, 400)
+        self.assertEqual(image.height, 300)
+        self.assertEqual(image.pil_image.size, (400, 300))
+        self.assertEqual(image.pil_image.getpixel((0, 0)), tuple(data[0, 0]))
+        self.assertIs(image.pil_image, image.pil_image)
+
+
+class TextTest(unittest.TestCase):
+    """Tests for the text target."""
+
+    def test_distance(self):
+        """Test text distance with and without a bound."""
+        text = Text("kitten")
+        self.assertEqual(text.distance_to("kitten"), 0)
+        self.assertEqual(text.distance_to("sitting"), 3)
+        self.assertEqual(text.distance_to(""), 6)
+        self.assertEqual(Text("").distance_to("sitting"), 7)
+        self.assertEqual(text.distance_to("sitting", 3), 3)
+        self.assertEqual(text.distance_to("sitting", 2), 3)
+        self.assertEqual(text.distance_to("sitting", 0), 1)
+        self.assertEqual(text.distance_to("kit", 1), 2)
+        self.assertEqual(text.distances_to(["mitten", "kitchen", "kit"]), [1, 2, 3])
+        self.assertEqual(text.distances_to(["mitten", "kitchen", "kit"], 1), [1, 2, 2])
+
+    def test_similarities(self):
+        """Test text similarities to multiple strings with a minimal similarity."""
+        text = Text("Find the word")
+        similarities = text.similarities_to(["Find the word", "Find the wort", "here", ""])
+        self.assertEqual(similarities[:2], [1.0, 1.0 - 1.0 / 13])
+        self.assertAlmostEqual(similarities[2], 1.0 - 10.0 / 13)
+        self.assertEqual(similarities[3], 0.0)
+
+        similarities = text.similarities_to(["Find the word", "Find the wort", "here", ""], 0.9)
+        self.assertEqual(similarities[:2], [1.0, 1.0 - 1.0 / 13])
+        self.assertLess(similarities[2], 0.9)
+        self.assertLess(similarities[3], 0.9)
+        self.assertEqual(Text("").similarities_to([""]), [1.0])
+
 
 class ChainTest(unittest.TestCase):
     """Tests for the chain target (series of steps)."""